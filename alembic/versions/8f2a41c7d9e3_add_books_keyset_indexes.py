@@ -0,0 +1,35 @@
+"""Add books keyset indexes
+
+Revision ID: 8f2a41c7d9e3
+Revises: 3c6d1c3dedb8
+Create Date: 2026-10-17 10:12:31.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2a41c7d9e3'
+down_revision: Union[str, Sequence[str], None] = '3c6d1c3dedb8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_books_title_id', 'books', ['title', 'id'], unique=False)
+    op.create_index(
+        'ix_books_publish_year_id',
+        'books',
+        [sa.text('coalesce(publish_year, 0)'), 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_books_publish_year_id', table_name='books')
+    op.drop_index('ix_books_title_id', table_name='books')
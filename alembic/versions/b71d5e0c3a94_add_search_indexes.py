@@ -0,0 +1,58 @@
+"""Add full-text and trigram search indexes
+
+Revision ID: b71d5e0c3a94
+Revises: 8f2a41c7d9e3
+Create Date: 2026-10-17 11:04:52.918305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d5e0c3a94'
+down_revision: Union[str, Sequence[str], None] = '8f2a41c7d9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        "CREATE INDEX ix_books_search_vector ON books USING gin (("
+        "(setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(short_description, '')), 'B')) || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')))"
+    )
+    op.execute(
+        "CREATE INDEX ix_authors_search_vector ON authors USING gin ("
+        "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A'))"
+    )
+
+    op.create_index(
+        'ix_books_title_trgm',
+        'books',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_authors_name_trgm',
+        'authors',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_authors_name_trgm', table_name='authors')
+    op.drop_index('ix_books_title_trgm', table_name='books')
+    op.drop_index('ix_authors_search_vector', table_name='authors')
+    op.drop_index('ix_books_search_vector', table_name='books')
@@ -0,0 +1,66 @@
+"""Add books rating stats
+
+Revision ID: d4e19a7b2f60
+Revises: b71d5e0c3a94
+Create Date: 2026-10-17 14:05:47.219384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e19a7b2f60'
+down_revision: Union[str, Sequence[str], None] = 'b71d5e0c3a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATING_COLUMNS = (
+    'rating_count',
+    'rating_sum',
+    'rating_1',
+    'rating_2',
+    'rating_3',
+    'rating_4',
+    'rating_5'
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in RATING_COLUMNS:
+        op.add_column('books', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        """
+        UPDATE books
+        SET rating_count = stats.rating_count,
+            rating_sum = stats.rating_sum,
+            rating_1 = stats.rating_1,
+            rating_2 = stats.rating_2,
+            rating_3 = stats.rating_3,
+            rating_4 = stats.rating_4,
+            rating_5 = stats.rating_5
+        FROM (
+            SELECT book_id,
+                   count(*) AS rating_count,
+                   sum(rating) AS rating_sum,
+                   count(*) FILTER (WHERE rating = 1) AS rating_1,
+                   count(*) FILTER (WHERE rating = 2) AS rating_2,
+                   count(*) FILTER (WHERE rating = 3) AS rating_3,
+                   count(*) FILTER (WHERE rating = 4) AS rating_4,
+                   count(*) FILTER (WHERE rating = 5) AS rating_5
+            FROM reviews
+            GROUP BY book_id
+        ) AS stats
+        WHERE books.id = stats.book_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(RATING_COLUMNS):
+        op.drop_column('books', column)
@@ -0,0 +1,40 @@
+"""Add reviews pagination indexes
+
+Revision ID: e52c8b1f9a07
+Revises: d4e19a7b2f60
+Create Date: 2026-10-17 15:21:08.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e52c8b1f9a07'
+down_revision: Union[str, Sequence[str], None] = 'd4e19a7b2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_reviews_book_id_created_at_id',
+        'reviews',
+        ['book_id', 'created_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_reviews_book_id_rating_created_at_id',
+        'reviews',
+        ['book_id', 'rating', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviews_book_id_rating_created_at_id', table_name='reviews')
+    op.drop_index('ix_reviews_book_id_created_at_id', table_name='reviews')
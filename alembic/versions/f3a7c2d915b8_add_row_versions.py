@@ -0,0 +1,40 @@
+"""Add row versions
+
+Revision ID: f3a7c2d915b8
+Revises: e52c8b1f9a07
+Create Date: 2026-10-17 18:02:44.310527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c2d915b8'
+down_revision: Union[str, Sequence[str], None] = 'e52c8b1f9a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('books', 'authors', 'reviews')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in VERSIONED_TABLES:
+        op.add_column(
+            table_name,
+            sa.Column('version', sa.Integer(), server_default='1', nullable=False)
+        )
+        op.add_column(
+            table_name,
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(VERSIONED_TABLES):
+        op.drop_column(table_name, 'updated_at')
+        op.drop_column(table_name, 'version')
@@ -0,0 +1,68 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional, Iterable
+
+from fastapi import Request, Response
+
+from src.core.compression import strip_etag_encoding
+
+
+def build_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\x1f")
+
+    return f'"{digest.hexdigest()}"'
+
+
+def latest(values: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    return max((value for value in values if value is not None), default=None)
+
+
+def format_http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def build_validators(
+        etag: str,
+        last_modified: Optional[datetime],
+        cache_control: str
+) -> Dict[str, str]:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control
+    }
+
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+
+    return headers
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        tags = {strip_etag_encoding(tag.strip()) for tag in if_none_match.split(",")}
+        return "*" in tags or strip_etag_encoding(headers["ETag"]) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
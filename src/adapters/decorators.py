@@ -4,12 +4,12 @@ from fastapi import HTTPException
 from fastapi.params import Depends
 
 from src.core.auth import get_user
-from src.domain.user.entities import UserEntity
+from src.domain.user.entities import UserProfileEntity
 from src.domain.user.enums import UserRole
 
 
 def require_role(allowed_roles: List[UserRole]):
-    async def dec(user: UserEntity = Depends(get_user)):
+    async def dec(user: UserProfileEntity = Depends(get_user)):
         if user.role not in allowed_roles:
             raise HTTPException(status_code=403, detail="У Вас недостаточно прав")
         return user
@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -5,11 +8,12 @@ from src.application.usecases.author import FindAuthorUseCase, CreateAuthorUseCa
     UpdateAuthorPhotoUseCase
 from src.application.usecases.books import GetBooksUseCase, FindBookBySlugUseCase, DeleteBookUseCase, CreateBookUseCase, \
     UpdateBookUseCase, AddFavouriteBookUseCase, DeleteFavouriteBookUseCase, FindFavouriteBooksUseCase, \
-    UpdateFavouriteBookStatusUseCase
+    UpdateFavouriteBookStatusUseCase, ImportBooksUseCase, ExportBooksUseCase
 from src.application.usecases.reviews import CreateReviewUseCase, FindReviewsUseCase, UpdateReviewUseCase, \
     DeleteReviewUseCase
+from src.application.usecases.search import SearchUseCase
 from src.application.usecases.user import RegisterUseCase, LogInUseCase
-from src.core.database.database import get_session, get_uow
+from src.core.database.database import get_session, get_uow, async_session
 from src.core.uow import SQLAlchemyUoW
 from src.domain.author.mappers import AuthorSchemaMapper
 from src.domain.author.protocols import AuthorRepositoryProtocol, FindAuthorUseCaseProtocol, \
@@ -18,26 +22,30 @@ from src.domain.books.mappers import BookSchemaMapper, FavouriteBookSchemaMapper
 from src.domain.books.protocols import BookRepositoryProtocol, GetBooksUseCaseProtocol, FindBookBySlugUseCaseProtocol, \
     DeleteBookUseCaseProtocol, CreateBookUseCaseProtocol, UpdateBookUseCaseProtocol, FavouriteBookRepositoryProtocol, \
     AddFavouriteBookUseCaseProtocol, DeleteFavouriteBookUseCaseProtocol, FindFavouriteBooksUseCaseProtocol, \
-    UpdateFavouriteBookStatusUseCaseProtocol
+    UpdateFavouriteBookStatusUseCaseProtocol, ImportBooksUseCaseProtocol, ExportBooksUseCaseProtocol
 from src.domain.cache.protocols import CacheManagerProtocol
-from src.domain.reviews.mappers import ReviewSchemaMapper
+from src.domain.reviews.mappers import ReviewSchemaMapper, ReviewItemSchemaMapper
 from src.domain.reviews.protocols import ReviewRepositoryProtocol, CreateReviewUseCaseProtocol, \
     FindReviewsUseCaseProtocol, UpdateReviewUseCaseProtocol, DeleteReviewUseCaseProtocol
+from src.domain.search.mappers import SearchResultSchemaMapper
+from src.domain.search.protocols import SearchRepositoryProtocol, SearchUseCaseProtocol
 from src.domain.security.protocols import PasswordHasherProtocol, TokenServiceProtocol
 from src.domain.storage.file_storage import MinioClientProtocol
 from src.domain.user.mappers import UserSchemaMapper
 from src.domain.user.protocols import UserRepositoryProtocol, RegisterUseCaseProtocol
-from src.infrastructure.cache.cache import get_redis_cache_manager
+from src.infrastructure.cache.cache import get_cache_manager
 from src.infrastructure.database.author.mappers import AuthorModelMapper
 from src.infrastructure.database.author.repositories import AuthorRepository
 from src.infrastructure.database.books.mappers import BookModelMapper, FavouriteBookModelMapper
 from src.infrastructure.database.books.repositories import BookRepository, FavouriteBookRepository
 from src.infrastructure.database.reviews.mappers import ReviewModelMapper
 from src.infrastructure.database.reviews.repositories import ReviewRepository
+from src.infrastructure.database.search.mappers import SearchResultRowMapper
+from src.infrastructure.database.search.repositories import SearchRepository
 from src.infrastructure.database.user.mappers import UserModelMapper
 from src.infrastructure.database.user.repositories import UserRepository
-from src.infrastructure.security.security import PasswordHasher, TokenService
-from src.infrastructure.storage.file_storage import MinioClient
+from src.infrastructure.security.security import password_hasher, TokenService
+from src.infrastructure.storage.file_storage import minio_client
 
 
 def get_user_model_mapper() -> UserModelMapper:
@@ -76,6 +84,10 @@ def get_review_schema_mapper(
     return ReviewSchemaMapper(mapper=mapper)
 
 
+def get_review_item_schema_mapper() -> ReviewItemSchemaMapper:
+    return ReviewItemSchemaMapper()
+
+
 def get_favourite_book_model_mapper(
         mapper: BookModelMapper = Depends(get_book_model_mapper)
 ) -> FavouriteBookModelMapper:
@@ -88,8 +100,16 @@ def get_favourite_book_schema_mapper(
     return FavouriteBookSchemaMapper(mapper=mapper)
 
 
+def get_search_result_row_mapper() -> SearchResultRowMapper:
+    return SearchResultRowMapper()
+
+
+def get_search_result_schema_mapper() -> SearchResultSchemaMapper:
+    return SearchResultSchemaMapper()
+
+
 def get_password_hasher() -> PasswordHasherProtocol:
-    return PasswordHasher()
+    return password_hasher
 
 
 def get_token_service() -> TokenServiceProtocol:
@@ -97,7 +117,7 @@ def get_token_service() -> TokenServiceProtocol:
 
 
 def get_minio_client() -> MinioClientProtocol:
-    return MinioClient()
+    return minio_client
 
 
 def get_user_repository(
@@ -146,15 +166,25 @@ def get_author_repository(
     )
 
 
+@asynccontextmanager
+async def open_author_repository() -> AsyncIterator[AuthorRepositoryProtocol]:
+    async with async_session() as session:
+        yield AuthorRepository(
+            session=session,
+            mapper=AuthorModelMapper()
+        )
+
+
 def get_find_author_use_case(
         repository: AuthorRepositoryProtocol = Depends(get_author_repository),
         mapper: AuthorSchemaMapper = Depends(get_author_schema_mapper),
-        cache: CacheManagerProtocol = Depends(get_redis_cache_manager)
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> FindAuthorUseCaseProtocol:
     return FindAuthorUseCase(
         repository=repository,
         mapper=mapper,
-        cache=cache
+        cache=cache,
+        repository_factory=open_author_repository
     )
 
 
@@ -170,13 +200,36 @@ def get_create_author_use_case(
     )
 
 
+def get_book_repository(
+        session: AsyncSession = Depends(get_session),
+        mapper: BookModelMapper = Depends(get_book_model_mapper)
+) -> BookRepositoryProtocol:
+    return BookRepository(
+        session=session,
+        mapper=mapper
+    )
+
+
+@asynccontextmanager
+async def open_book_repository() -> AsyncIterator[BookRepositoryProtocol]:
+    async with async_session() as session:
+        yield BookRepository(
+            session=session,
+            mapper=BookModelMapper()
+        )
+
+
 def get_delete_author_use_case(
         repository: AuthorRepositoryProtocol = Depends(get_author_repository),
-        uow: SQLAlchemyUoW = Depends(get_uow)
+        book_repository: BookRepositoryProtocol = Depends(get_book_repository),
+        uow: SQLAlchemyUoW = Depends(get_uow),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> DeleteAuthorUseCaseProtocol:
     return DeleteAuthorUseCase(
         repository=repository,
-        uow=uow
+        book_repository=book_repository,
+        uow=uow,
+        cache=cache
     )
 
 
@@ -185,7 +238,7 @@ def get_update_author_photo_use_case(
         mapper: AuthorSchemaMapper = Depends(get_author_schema_mapper),
         uow: SQLAlchemyUoW = Depends(get_uow),
         storage: MinioClientProtocol = Depends(get_minio_client),
-        cache: CacheManagerProtocol = Depends(get_redis_cache_manager)
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> UpdateAuthorPhotoUseCaseProtocol:
     return UpdateAuthorPhotoUseCase(
         repository=repository,
@@ -196,45 +249,41 @@ def get_update_author_photo_use_case(
     )
 
 
-def get_book_repository(
-        session: AsyncSession = Depends(get_session),
-        mapper: BookModelMapper = Depends(get_book_model_mapper)
-) -> BookRepositoryProtocol:
-    return BookRepository(
-        session=session,
-        mapper=mapper
-    )
-
-
 def get_get_books_use_case(
         mapper: BookSchemaMapper = Depends(get_book_schema_mapper),
-        repository: BookRepositoryProtocol = Depends(get_book_repository)
+        repository: BookRepositoryProtocol = Depends(get_book_repository),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> GetBooksUseCaseProtocol:
     return GetBooksUseCase(
         repository=repository,
-        mapper=mapper
+        mapper=mapper,
+        cache=cache,
+        repository_factory=open_book_repository
     )
 
 
 def get_find_book_by_slug_use_case(
         mapper: BookSchemaMapper = Depends(get_book_schema_mapper),
         repository: BookRepositoryProtocol = Depends(get_book_repository),
-        cache: CacheManagerProtocol = Depends(get_redis_cache_manager)
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> FindBookBySlugUseCaseProtocol:
     return FindBookBySlugUseCase(
         repository=repository,
         mapper=mapper,
-        cache=cache
+        cache=cache,
+        repository_factory=open_book_repository
     )
 
 
 def get_delete_book_use_case(
         uow: SQLAlchemyUoW = Depends(get_uow),
-        repository: BookRepositoryProtocol = Depends(get_book_repository)
+        repository: BookRepositoryProtocol = Depends(get_book_repository),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> DeleteBookUseCaseProtocol:
     return DeleteBookUseCase(
         uow=uow,
-        repository=repository
+        repository=repository,
+        cache=cache
     )
 
 
@@ -242,13 +291,39 @@ def get_create_book_use_case(
         uow: SQLAlchemyUoW = Depends(get_uow),
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
         author_repository: AuthorRepositoryProtocol = Depends(get_author_repository),
-        mapper: BookSchemaMapper = Depends(get_book_schema_mapper)
+        mapper: BookSchemaMapper = Depends(get_book_schema_mapper),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> CreateBookUseCaseProtocol:
     return CreateBookUseCase(
         uow=uow,
         book_repository=book_repository,
         author_repository=author_repository,
-        mapper=mapper
+        mapper=mapper,
+        cache=cache
+    )
+
+
+def get_export_books_use_case(
+        mapper: BookSchemaMapper = Depends(get_book_schema_mapper),
+        repository: BookRepositoryProtocol = Depends(get_book_repository)
+) -> ExportBooksUseCaseProtocol:
+    return ExportBooksUseCase(
+        mapper=mapper,
+        repository=repository
+    )
+
+
+def get_import_books_use_case(
+        uow: SQLAlchemyUoW = Depends(get_uow),
+        book_repository: BookRepositoryProtocol = Depends(get_book_repository),
+        author_repository: AuthorRepositoryProtocol = Depends(get_author_repository),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
+) -> ImportBooksUseCaseProtocol:
+    return ImportBooksUseCase(
+        uow=uow,
+        book_repository=book_repository,
+        author_repository=author_repository,
+        cache=cache
     )
 
 
@@ -257,7 +332,7 @@ def get_update_book_use_case(
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
         author_repository: AuthorRepositoryProtocol = Depends(get_author_repository),
         mapper: BookSchemaMapper = Depends(get_book_schema_mapper),
-        cache: CacheManagerProtocol = Depends(get_redis_cache_manager)
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> UpdateBookUseCaseProtocol:
     return UpdateBookUseCase(
         uow=uow,
@@ -282,25 +357,29 @@ def get_create_review_use_case(
         review_repository: ReviewRepositoryProtocol = Depends(get_review_repository),
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
         mapper: ReviewSchemaMapper = Depends(get_review_schema_mapper),
-        uow: SQLAlchemyUoW = Depends(get_uow)
+        uow: SQLAlchemyUoW = Depends(get_uow),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> CreateReviewUseCaseProtocol:
     return CreateReviewUseCase(
         review_repository=review_repository,
         book_repository=book_repository,
         mapper=mapper,
-        uow=uow
+        uow=uow,
+        cache=cache
     )
 
 
 def get_find_reviews_use_case(
         review_repository: ReviewRepositoryProtocol = Depends(get_review_repository),
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
-        mapper: ReviewSchemaMapper = Depends(get_review_schema_mapper)
+        mapper: ReviewItemSchemaMapper = Depends(get_review_item_schema_mapper),
+        book_mapper: BookSchemaMapper = Depends(get_book_schema_mapper)
 ) -> FindReviewsUseCaseProtocol:
     return FindReviewsUseCase(
         review_repository=review_repository,
         book_repository=book_repository,
-        mapper=mapper
+        mapper=mapper,
+        book_mapper=book_mapper
     )
 
 
@@ -308,25 +387,29 @@ def get_update_review_use_case(
         review_repository: ReviewRepositoryProtocol = Depends(get_review_repository),
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
         mapper: ReviewSchemaMapper = Depends(get_review_schema_mapper),
-        uow: SQLAlchemyUoW = Depends(get_uow)
+        uow: SQLAlchemyUoW = Depends(get_uow),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> UpdateReviewUseCaseProtocol:
     return UpdateReviewUseCase(
         review_repository=review_repository,
         book_repository=book_repository,
         mapper=mapper,
-        uow=uow
+        uow=uow,
+        cache=cache
     )
 
 
 def get_delete_review_use_case(
         review_repository: ReviewRepositoryProtocol = Depends(get_review_repository),
         book_repository: BookRepositoryProtocol = Depends(get_book_repository),
-        uow: SQLAlchemyUoW = Depends(get_uow)
+        uow: SQLAlchemyUoW = Depends(get_uow),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
 ) -> DeleteReviewUseCaseProtocol:
     return DeleteReviewUseCase(
         review_repository=review_repository,
         book_repository=book_repository,
-        uow=uow
+        uow=uow,
+        cache=cache
     )
 
 
@@ -387,4 +470,24 @@ def get_update_favourite_book_status_use_case(
         book_repository=book_repository,
         favourite_book_repository=favourite_book_repository,
         uow=uow
+    )
+
+
+def get_search_repository(
+        session: AsyncSession = Depends(get_session),
+        mapper: SearchResultRowMapper = Depends(get_search_result_row_mapper)
+) -> SearchRepositoryProtocol:
+    return SearchRepository(
+        session=session,
+        mapper=mapper
+    )
+
+
+def get_search_use_case(
+        repository: SearchRepositoryProtocol = Depends(get_search_repository),
+        mapper: SearchResultSchemaMapper = Depends(get_search_result_schema_mapper)
+) -> SearchUseCaseProtocol:
+    return SearchUseCase(
+        repository=repository,
+        mapper=mapper
     )
\ No newline at end of file
@@ -4,6 +4,7 @@ from fastapi.params import Depends
 from src.adapters.dependencies import get_register_use_case, get_log_in_use_case
 from src.adapters.schemas.requests.user import RegisterRequest, LogInRequest
 from src.adapters.schemas.responses.user import UserResponse, TokenResponse
+from src.domain.security.exceptions import PasswordHasherBusyException
 from src.domain.user.exceptions import UserAlreadyExistException, InvalidCredentialsException
 from src.domain.user.protocols import RegisterUseCaseProtocol, LogInUseCaseProtocol
 
@@ -26,6 +27,8 @@ async def register(
         return await use_case.execute(data=request)
     except UserAlreadyExistException as e:
         raise HTTPException(status_code=409, detail=str(e))
+    except PasswordHasherBusyException as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
 
 @router.post(
@@ -40,4 +43,6 @@ async def login(
     try:
         return await use_case.execute(data=request)
     except InvalidCredentialsException as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHasherBusyException as e:
+        raise HTTPException(status_code=503, detail=str(e))
\ No newline at end of file
@@ -1,18 +1,21 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, UploadFile
+from fastapi import APIRouter, HTTPException, UploadFile, Request
 from fastapi.params import Depends, File
 
+from src.adapters.conditional import build_validators, is_not_modified, not_modified_response
 from src.adapters.decorators import require_admin
 from src.adapters.dependencies import get_create_author_use_case, get_find_author_use_case, get_delete_author_use_case, \
     get_update_author_photo_use_case
 from src.adapters.schemas.requests.author import AuthorCreateRequest
 from src.adapters.schemas.responses.author import AuthorResponse
+from src.core.config import settings
 from src.core.utils import is_allowed_content_type
 from src.domain.author.exceptions import AuthorAlreadyExistException, AuthorNotExistException
 from src.domain.author.protocols import CreateAuthorUseCaseProtocol, FindAuthorUseCaseProtocol, \
     DeleteAuthorUseCaseProtocol, UpdateAuthorPhotoUseCaseProtocol
+from src.domain.storage.exceptions import MinioFileTooLargeException
 
 router = APIRouter(
     prefix="/v1/authors",
@@ -42,14 +45,29 @@ async def create(
     response_model=AuthorResponse
 )
 async def find_by_slug(
+        request: Request,
         slug: str,
         use_case: FindAuthorUseCaseProtocol = Depends(get_find_author_use_case)
 ):
     try:
-        return await use_case.execute(slug=slug)
+        result = await use_case.execute(slug=slug)
     except AuthorNotExistException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    headers = build_validators(
+        etag=result.get_etag(request.headers.get("accept-encoding")),
+        last_modified=result.last_modified,
+        cache_control=settings.CACHE_CONTROL_AUTHOR
+    )
+
+    if is_not_modified(request=request, headers=headers):
+        return not_modified_response(headers=headers)
+
+    return result.to_response(
+        headers=headers,
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
 
 @require_admin
 @router.patch(
@@ -76,6 +94,8 @@ async def update_avatar(
         )
     except AuthorNotExistException as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except MinioFileTooLargeException as e:
+        raise HTTPException(status_code=413, detail=str(e))
 
 
 @require_admin
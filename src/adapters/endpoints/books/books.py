@@ -1,35 +1,82 @@
-from typing import List
+import io
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, UploadFile, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi.params import Depends
 
+from src.adapters.conditional import build_validators, is_not_modified, not_modified_response
 from src.adapters.decorators import require_admin
 from src.adapters.dependencies import get_get_books_use_case, get_find_book_by_slug_use_case, \
-    get_create_book_use_case, get_delete_book_use_case, get_update_book_use_case
-from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery
-from src.adapters.schemas.responses.books import BookResponse
+    get_create_book_use_case, get_delete_book_use_case, get_update_book_use_case, get_import_books_use_case, \
+    get_export_books_use_case
+from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery, BooksExportQuery
+from src.adapters.schemas.responses.books import BookResponse, BookPageResponse, BookImportResponse
+from src.core.config import settings
 from src.domain.author.exceptions import AuthorNotExistException
+from src.domain.books.enums import BookFileFormat
 from src.domain.books.exceptions import BookNotExistException, BookAlreadyExistException
 from src.domain.books.protocols import GetBooksUseCaseProtocol, FindBookBySlugUseCaseProtocol, \
-    CreateBookUseCaseProtocol, DeleteBookUseCaseProtocol, UpdateBookUseCaseProtocol
+    CreateBookUseCaseProtocol, DeleteBookUseCaseProtocol, UpdateBookUseCaseProtocol, ImportBooksUseCaseProtocol, \
+    ExportBooksUseCaseProtocol
+from src.domain.pagination.exceptions import InvalidCursorException
 
 router = APIRouter(
     prefix="/v1/books",
     tags=["Книги"]
 )
 
+EXPORT_MEDIA_TYPES = {
+    BookFileFormat.NDJSON: "application/x-ndjson",
+    BookFileFormat.CSV: "text/csv; charset=utf-8"
+}
+
 
 @router.get(
     path="",
     status_code=200,
-    response_model=List[BookResponse]
+    response_model=BookPageResponse
 )
 async def get_books(
+        request: Request,
         params: BooksQuery = Depends(),
         use_case: GetBooksUseCaseProtocol = Depends(get_get_books_use_case)
 ):
-    return await use_case.execute(filters=params)
+    try:
+        result = await use_case.execute(filters=params)
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = build_validators(
+        etag=result.get_etag(request.headers.get("accept-encoding")),
+        last_modified=result.last_modified,
+        cache_control=settings.CACHE_CONTROL_BOOKS
+    )
+
+    if is_not_modified(request=request, headers=headers):
+        return not_modified_response(headers=headers)
+
+    return result.to_response(
+        headers=headers,
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
+
+@router.get(
+    path="/export",
+    status_code=200,
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_admin)]
+)
+async def export_books(
+        params: BooksExportQuery = Depends(),
+        use_case: ExportBooksUseCaseProtocol = Depends(get_export_books_use_case)
+):
+    return StreamingResponse(
+        use_case.execute(filters=params),
+        media_type=EXPORT_MEDIA_TYPES[params.format],
+        headers={"Content-Disposition": f'attachment; filename="books.{params.format.value}"'}
+    )
 
 
 @router.get(
@@ -38,14 +85,29 @@ async def get_books(
     response_model=BookResponse
 )
 async def get_book_by_slug(
+        request: Request,
         slug: str,
         use_case: FindBookBySlugUseCaseProtocol = Depends(get_find_book_by_slug_use_case)
 ):
     try:
-        return await use_case.execute(slug=slug)
+        result = await use_case.execute(slug=slug)
     except BookNotExistException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    headers = build_validators(
+        etag=result.get_etag(request.headers.get("accept-encoding")),
+        last_modified=result.last_modified,
+        cache_control=settings.CACHE_CONTROL_BOOK
+    )
+
+    if is_not_modified(request=request, headers=headers):
+        return not_modified_response(headers=headers)
+
+    return result.to_response(
+        headers=headers,
+        accept_encoding=request.headers.get("accept-encoding")
+    )
+
 
 @router.post(
     path="",
@@ -65,6 +127,27 @@ async def create(
         raise HTTPException(status_code=409, detail=str(e))
 
 
+@router.post(
+    path="/import",
+    status_code=200,
+    response_model=BookImportResponse,
+    dependencies=[Depends(require_admin)]
+)
+async def import_books(
+        file: UploadFile,
+        fmt: BookFileFormat = Query(default=BookFileFormat.CSV, alias="format"),
+        use_case: ImportBooksUseCaseProtocol = Depends(get_import_books_use_case)
+):
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+
+    try:
+        return await use_case.execute(stream=stream, fmt=fmt)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Файл должен быть в кодировке UTF-8")
+    finally:
+        stream.detach()
+
+
 @router.delete(
     path="/{book_id}",
     status_code=204,
@@ -11,7 +11,7 @@ from src.domain.books.exceptions import BookNotExistException, FavouriteBookAlre
     FavouriteBookRepositoryException, FavouriteBookNotExistException
 from src.domain.books.protocols import AddFavouriteBookUseCaseProtocol, DeleteFavouriteBookUseCaseProtocol, \
     FindFavouriteBooksUseCaseProtocol, UpdateFavouriteBookStatusUseCaseProtocol
-from src.domain.user.entities import UserEntity
+from src.domain.user.entities import UserProfileEntity
 
 router = APIRouter(
     prefix="/v1/favourites/books",
@@ -26,7 +26,7 @@ router = APIRouter(
 )
 async def add_favourite(
         slug: str,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: AddFavouriteBookUseCaseProtocol = Depends(get_add_favourite_book_use_case)
 ):
     try:
@@ -48,7 +48,7 @@ async def add_favourite(
 )
 async def delete_favourite(
         slug: str,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: DeleteFavouriteBookUseCaseProtocol = Depends(get_delete_favourite_book_use_case)
 ):
     try:
@@ -68,7 +68,7 @@ async def delete_favourite(
     response_model=List[FavouriteBookResponse]
 )
 async def get_favourites(
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: FindFavouriteBooksUseCaseProtocol = Depends(get_find_favourite_books_use_case)
 ):
     return await use_case.execute(user_id=current_user.id)
@@ -82,7 +82,7 @@ async def get_favourites(
 async def update_favourite_book_status(
         slug: str,
         request: FavouriteBookUpdateStatusRequest,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: UpdateFavouriteBookStatusUseCaseProtocol = Depends(get_update_favourite_book_status_use_case)
 ):
     try:
@@ -1,19 +1,20 @@
-from typing import List
-
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.params import Depends
 
+from src.adapters.conditional import build_etag, build_validators, is_not_modified, not_modified_response
 from src.adapters.dependencies import get_create_review_use_case, get_find_reviews_use_case, get_update_review_use_case, \
     get_delete_review_use_case
-from src.adapters.schemas.requests.reviews import ReviewRequest
-from src.adapters.schemas.responses.reviews import ReviewResponse
+from src.adapters.schemas.requests.reviews import ReviewRequest, ReviewsQuery
+from src.adapters.schemas.responses.reviews import ReviewResponse, ReviewPageResponse
 from src.core.auth import get_user
+from src.core.config import settings
 from src.domain.books.exceptions import BookNotExistException
+from src.domain.pagination.exceptions import InvalidCursorException
 from src.domain.reviews.exceptions import ReviewAlreadyExistException, ReviewRepositoryException, \
     ReviewNotExistException
 from src.domain.reviews.protocols import CreateReviewUseCaseProtocol, FindReviewsUseCaseProtocol, \
     UpdateReviewUseCaseProtocol, DeleteReviewUseCaseProtocol
-from src.domain.user.entities import UserEntity
+from src.domain.user.entities import UserProfileEntity
 
 router = APIRouter(
     prefix="/v1/books",
@@ -29,7 +30,7 @@ router = APIRouter(
 async def create(
         slug: str,
         request: ReviewRequest,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: CreateReviewUseCaseProtocol = Depends(get_create_review_use_case)
 ):
     try:
@@ -48,14 +49,39 @@ async def create(
 
 @router.get(
     path="/{slug}/reviews",
-    status_code=201,
-    response_model=List[ReviewResponse]
+    status_code=200,
+    response_model=ReviewPageResponse
 )
 async def find_all(
+        request: Request,
+        response: Response,
         slug: str,
+        params: ReviewsQuery = Depends(),
         use_case: FindReviewsUseCaseProtocol = Depends(get_find_reviews_use_case)
 ):
-    return await use_case.execute(slug=slug)
+    try:
+        result = await use_case.execute(slug=slug, filters=params)
+    except BookNotExistException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = build_validators(
+        etag=build_etag(
+            result.book.id,
+            result.book.version,
+            *((item.id, item.version) for item in result.items),
+            result.next_cursor
+        ),
+        last_modified=None,
+        cache_control=settings.CACHE_CONTROL_REVIEWS
+    )
+
+    if is_not_modified(request=request, headers=headers):
+        return not_modified_response(headers=headers)
+
+    response.headers.update(headers)
+    return result
 
 
 @router.patch(
@@ -66,7 +92,7 @@ async def find_all(
 async def update(
         slug: str,
         request: ReviewRequest,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: UpdateReviewUseCaseProtocol = Depends(get_update_review_use_case)
 ):
     try:
@@ -87,7 +113,7 @@ async def update(
 )
 async def delete(
         slug: str,
-        current_user: UserEntity = Depends(get_user),
+        current_user: UserProfileEntity = Depends(get_user),
         use_case: DeleteReviewUseCaseProtocol = Depends(get_delete_review_use_case)
 ):
     try:
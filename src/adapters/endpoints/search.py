@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.params import Depends
+
+from src.adapters.dependencies import get_search_use_case
+from src.adapters.schemas.requests.search import SearchQuery
+from src.adapters.schemas.responses.search import SearchPageResponse
+from src.domain.search.protocols import SearchUseCaseProtocol
+
+router = APIRouter(
+    prefix="/v1/search",
+    tags=["Поиск"]
+)
+
+
+@router.get(
+    path="",
+    status_code=200,
+    response_model=SearchPageResponse
+)
+async def search(
+        params: SearchQuery = Depends(),
+        use_case: SearchUseCaseProtocol = Depends(get_search_use_case)
+):
+    return await use_case.execute(query=params)
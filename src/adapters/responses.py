@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any, Optional, Dict
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Base64Bytes
+
+from src.adapters.conditional import build_etag
+from src.core.compression import CODECS, compress, negotiate_encoding, encode_etag
+from src.core.config import settings
+from src.core.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+
+        return dumps(content)
+
+
+class EncodedResponse(BaseModel):
+    body: bytes
+    etag: str
+    content_length: int
+    last_modified: Optional[datetime] = None
+    compressed: Dict[str, Base64Bytes] = {}
+
+    @classmethod
+    def from_model(
+            cls,
+            model: BaseModel,
+            etag: Optional[str] = None,
+            last_modified: Optional[datetime] = None
+    ) -> "EncodedResponse":
+        body = dumps(model)
+        compressed = {}
+
+        if len(body) >= settings.COMPRESSION_MINIMUM_SIZE:
+            compressed = {encoding: compress(body, encoding=encoding) for encoding in CODECS}
+
+        return cls.model_construct(
+            body=body,
+            etag=etag or build_etag(body),
+            content_length=len(body),
+            last_modified=last_modified,
+            compressed=compressed
+        )
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        if not self.compressed:
+            return None
+
+        return negotiate_encoding(accept_encoding, available=tuple(self.compressed))
+
+    def get_etag(self, accept_encoding: Optional[str] = None) -> str:
+        return encode_etag(self.etag, self.negotiate(accept_encoding))
+
+    def to_response(
+            self,
+            headers: Optional[Dict[str, str]] = None,
+            accept_encoding: Optional[str] = None
+    ) -> FastJSONResponse:
+        encoding = self.negotiate(accept_encoding)
+        response_headers = {
+            **(headers or {}),
+            "ETag": encode_etag(self.etag, encoding),
+            "Content-Length": str(self.content_length)
+        }
+
+        if not self.compressed:
+            return FastJSONResponse(content=self.body, headers=response_headers)
+
+        response_headers["Vary"] = "Accept-Encoding"
+
+        if encoding is None:
+            return FastJSONResponse(content=self.body, headers=response_headers)
+
+        body = self.compressed[encoding]
+        response_headers["Content-Encoding"] = encoding
+        response_headers["Content-Length"] = str(len(body))
+
+        return FastJSONResponse(content=body, headers=response_headers)
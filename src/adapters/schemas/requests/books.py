@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
-from src.domain.books.enums import Genre, BookReadingStatus
+from src.domain.books.enums import Genre, BookReadingStatus, BookSortField, BookFileFormat
 
 
 class BookCreateRequest(BaseModel):
@@ -13,8 +13,8 @@ class BookCreateRequest(BaseModel):
     language: Annotated[Optional[str], Field(description="На каком языке написана книга")] = None
     description: Annotated[Optional[str], Field(description="Содержание книги")] = None
     short_description: Annotated[Optional[str], Field(description="Краткое содержание")] = None
-    publish_year: Annotated[Optional[int], Field(description="Год выпуска")] = None
-    page_count: Annotated[Optional[int], Field(description="Количество страниц")] = None
+    publish_year: Annotated[Optional[int], Field(ge=0, le=9999, description="Год выпуска")] = None
+    page_count: Annotated[Optional[int], Field(ge=1, le=100_000, description="Количество страниц")] = None
     author_id: Annotated[Optional[UUID], Field(description="Айди автора, написавшего книгу")] = None
 
 
@@ -24,14 +24,13 @@ class BookUpdateRequest(BaseModel):
     language: Annotated[Optional[str], Field(description="На каком языке написана книга")] = None
     description: Annotated[Optional[str], Field(description="Содержание книги")] = None
     short_description: Annotated[Optional[str], Field(description="Краткое содержание")] = None
-    publish_year: Annotated[Optional[int], Field(description="Год выпуска")] = None
-    page_count: Annotated[Optional[int], Field(description="Количество страниц")] = None
+    publish_year: Annotated[Optional[int], Field(ge=0, le=9999, description="Год выпуска")] = None
+    page_count: Annotated[Optional[int], Field(ge=1, le=100_000, description="Количество страниц")] = None
     author_id: Annotated[Optional[UUID], Field(description="Айди автора, написавшего книгу")] = None
 
 
-class BooksQuery(BaseModel):
+class BooksFilterQuery(BaseModel):
     genre: Annotated[Optional[Genre], Field(description="Жанр книги")] = None
-    limit: Annotated[Optional[int], Field(ge=0, description="Максимальное кол-во книг, которые выведется")] = None
     year_from: Annotated[Optional[int], Field(ge=0, description="Минимальный год публикации")] = None
     year_to: Annotated[Optional[int], Field(ge=0, description="Максимальный год публикации")] = None
     pages_from: Annotated[Optional[int], Field(ge=1, description="Минимальное кол-во страниц")] = None
@@ -48,5 +47,21 @@ class BooksQuery(BaseModel):
         return self
 
 
+class BooksQuery(BooksFilterQuery):
+    limit: Annotated[int, Field(ge=1, le=100, description="Максимальное кол-во книг на странице")] = 20
+    sort: Annotated[BookSortField, Field(description="Поле сортировки")] = BookSortField.TITLE
+    cursor: Annotated[Optional[str], Field(description="Курсор следующей страницы")] = None
+
+
+class BooksExportQuery(BooksFilterQuery):
+    format: Annotated[BookFileFormat, Field(description="Формат выгрузки")] = BookFileFormat.NDJSON
+
+
 class FavouriteBookUpdateStatusRequest(BaseModel):
-    status: Annotated[BookReadingStatus, Field(description="Статус прочтения книги")]
\ No newline at end of file
+    status: Annotated[BookReadingStatus, Field(description="Статус прочтения книги")]
+
+
+class BookImportRow(BookCreateRequest):
+    title: Annotated[str, Field(min_length=1, max_length=50, description="Название книги")]
+    language: Annotated[Optional[str], Field(max_length=25, description="На каком языке написана книга")] = None
+    short_description: Annotated[Optional[str], Field(max_length=255, description="Краткое содержание")] = None
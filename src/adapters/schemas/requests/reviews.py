@@ -1,8 +1,16 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field
 
+from src.domain.reviews.enums import ReviewSortField
+
 
 class ReviewRequest(BaseModel):
     review: Annotated[str, Field(description="Отзыв", min_length=10)]
     rating: Annotated[int, Field(description="Оценка", ge=1, le=5)]
+
+
+class ReviewsQuery(BaseModel):
+    limit: Annotated[int, Field(ge=1, le=100, description="Максимальное кол-во отзывов на странице")] = 20
+    sort: Annotated[ReviewSortField, Field(description="Порядок сортировки")] = ReviewSortField.NEWEST
+    cursor: Annotated[Optional[str], Field(description="Курсор следующей страницы")] = None
@@ -0,0 +1,14 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from src.domain.search.enums import SearchTarget
+
+
+class SearchQuery(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    q: Annotated[str, Field(min_length=2, max_length=100, description="Поисковый запрос")]
+    target: Annotated[SearchTarget, Field(description="Где искать")] = SearchTarget.ALL
+    limit: Annotated[int, Field(ge=1, le=50, description="Максимальное кол-во результатов на странице")] = 20
+    offset: Annotated[int, Field(ge=0, le=1000, description="Сколько результатов пропустить")] = 0
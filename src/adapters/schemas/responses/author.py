@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Annotated, Optional
 from uuid import UUID
 
@@ -15,3 +15,5 @@ class AuthorResponse(BaseModel):
     death_date: Annotated[Optional[date], Field(description="Дата смерти")] = None
     country: Annotated[Optional[str], Field(description="Страна проживания")] = None
     photo_url: Annotated[Optional[str], Field(description="Фото автора")] = None
+    version: Annotated[int, Field(description="Версия записи")] = 1
+    updated_at: Annotated[Optional[datetime], Field(description="Дата последнего изменения")] = None
@@ -1,4 +1,5 @@
-from typing import Annotated, Optional
+from datetime import datetime
+from typing import Annotated, Optional, List, Dict
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -6,6 +7,14 @@ from pydantic import BaseModel, Field
 from src.domain.books.enums import Genre, BookReadingStatus
 
 
+class BookRatingResponse(BaseModel):
+    average: Annotated[Optional[float], Field(description="Средняя оценка")] = None
+    count: Annotated[int, Field(description="Количество оценок")] = 0
+    histogram: Annotated[Dict[int, int], Field(description="Количество оценок по звёздам")] = {
+        1: 0, 2: 0, 3: 0, 4: 0, 5: 0
+    }
+
+
 class BookResponse(BaseModel):
     id: Annotated[UUID, Field(description="Уникальный идентификатор книги")]
     title: Annotated[str, Field(description="Название книги")]
@@ -18,9 +27,28 @@ class BookResponse(BaseModel):
     publish_year: Annotated[Optional[int], Field(description="Год выпуска")] = None
     page_count: Annotated[Optional[int], Field(description="Количество страниц")] = None
     author_id: Annotated[Optional[UUID], Field(description="Айди автора, написавшего книгу")] = None
+    rating: Annotated[BookRatingResponse, Field(description="Рейтинг книги")] = BookRatingResponse()
+    version: Annotated[int, Field(description="Версия записи")] = 1
+    updated_at: Annotated[Optional[datetime], Field(description="Дата последнего изменения")] = None
+
+
+class BookPageResponse(BaseModel):
+    items: Annotated[List[BookResponse], Field(description="Книги на странице")]
+    next_cursor: Annotated[Optional[str], Field(description="Курсор следующей страницы")] = None
 
 
 class FavouriteBookResponse(BaseModel):
     id: Annotated[UUID, Field(description="Уникальный идентификатор книги")]
     status: Annotated[BookReadingStatus, Field(description="Статус прочтения книги")]
-    book: Annotated[BookResponse, Field(description="Информация о книге")]
\ No newline at end of file
+    book: Annotated[BookResponse, Field(description="Информация о книге")]
+
+
+class BookImportErrorResponse(BaseModel):
+    line: Annotated[int, Field(description="Номер строки во входном файле")]
+    message: Annotated[str, Field(description="Причина, по которой строка не импортирована")]
+
+
+class BookImportResponse(BaseModel):
+    created: Annotated[int, Field(description="Количество созданных книг")] = 0
+    failed: Annotated[int, Field(description="Количество строк с ошибками")] = 0
+    errors: Annotated[List[BookImportErrorResponse], Field(description="Ошибки по строкам")] = []
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -14,3 +14,18 @@ class ReviewResponse(BaseModel):
     rating: Annotated[int, Field(description="Оценка", ge=1, le=5)]
     book: Annotated[BookResponse, Field(description="Книга")]
     created_at: Annotated[datetime, Field(description="Дата создания")]
+
+
+class ReviewItemResponse(BaseModel):
+    id: Annotated[UUID, Field(description="Уникальный идентификатор отзыва")]
+    full_name: Annotated[str, Field(description="Фамилия и имя написавшего отзыв")]
+    review: Annotated[str, Field(description="Отзыв")]
+    rating: Annotated[int, Field(description="Оценка")]
+    created_at: Annotated[datetime, Field(description="Дата создания")]
+    version: Annotated[int, Field(description="Версия отзыва")] = 1
+
+
+class ReviewPageResponse(BaseModel):
+    book: Annotated[BookResponse, Field(description="Книга")]
+    items: Annotated[List[ReviewItemResponse], Field(description="Отзывы на странице")]
+    next_cursor: Annotated[Optional[str], Field(description="Курсор следующей страницы")] = None
@@ -0,0 +1,19 @@
+from typing import Annotated, Optional, List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.domain.search.enums import SearchResultKind
+
+
+class SearchResultResponse(BaseModel):
+    id: Annotated[UUID, Field(description="Уникальный идентификатор")]
+    kind: Annotated[SearchResultKind, Field(description="Тип результата")]
+    title: Annotated[str, Field(description="Название книги или имя автора")]
+    slug: Annotated[str, Field(description="Slug книги или автора")]
+    rank: Annotated[float, Field(description="Релевантность")]
+
+
+class SearchPageResponse(BaseModel):
+    items: Annotated[List[SearchResultResponse], Field(description="Найденные книги и авторы")]
+    next_offset: Annotated[Optional[int], Field(description="Смещение следующей страницы")] = None
@@ -1,10 +1,14 @@
+from typing import Optional, Callable, AsyncContextManager
 from uuid import UUID
 
 from fastapi import UploadFile
 
+from src.adapters.conditional import build_etag
+from src.adapters.responses import EncodedResponse
 from src.adapters.schemas.requests.author import AuthorCreateRequest
 from src.adapters.schemas.responses.author import AuthorResponse
 from src.core.config import settings
+from src.core.database.routing import read_primary
 from src.core.uow import SQLAlchemyUoW
 from src.core.utils import generate_slug
 from src.domain.author.entities import AuthorCreateEntity
@@ -12,7 +16,9 @@ from src.domain.author.exceptions import AuthorNotExistException
 from src.domain.author.mappers import AuthorSchemaMapper
 from src.domain.author.protocols import CreateAuthorUseCaseProtocol, FindAuthorUseCaseProtocol, \
     DeleteAuthorUseCaseProtocol, UpdateAuthorPhotoUseCaseProtocol, AuthorRepositoryProtocol
+from src.domain.books.protocols import BookRepositoryProtocol
 from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.cache.tags import get_author_tag, get_book_tag, BOOKS_LIST_TAG
 from src.domain.storage.exceptions import MinioFileDeleteException
 from src.domain.storage.file_storage import MinioClientProtocol
 
@@ -22,35 +28,46 @@ class FindAuthorUseCase(FindAuthorUseCaseProtocol):
             self,
             repository: AuthorRepositoryProtocol,
             mapper: AuthorSchemaMapper,
-            cache: CacheManagerProtocol
+            cache: CacheManagerProtocol,
+            repository_factory: Optional[Callable[[], AsyncContextManager[AuthorRepositoryProtocol]]] = None
     ):
         self.repository = repository
         self.mapper = mapper
         self.cache = cache
+        self.repository_factory = repository_factory
         self.cache_ttl_seconds = 120
+        self.cache_stale_ttl_seconds = 1200
+
+    async def execute(self, slug: str) -> EncodedResponse:
+        return await self.cache.get_or_load(
+            key=f"author:slug:{slug}",
+            schema=EncodedResponse,
+            loader=lambda: self.load(repository=self.repository, slug=slug),
+            ttl=self.cache_ttl_seconds,
+            stale_ttl=self.cache_stale_ttl_seconds,
+            tags=[get_author_tag(slug)],
+            refresh_loader=(lambda: self.refresh(slug=slug)) if self.repository_factory else None
+        )
 
-    async def execute(self, slug: str) -> AuthorResponse:
-        cache_key = f"author:slug:{slug}"
-        cached = await self.cache.get(cache_key)
-
-        if cached is not None:
-            return AuthorResponse.model_validate(cached)
+    async def refresh(self, slug: str) -> EncodedResponse:
+        async with self.repository_factory() as repository:
+            return await self.load(repository=repository, slug=slug)
 
-        result = await self.repository.find_by_slug(slug=slug)
+    async def load(self, repository: AuthorRepositoryProtocol, slug: str) -> EncodedResponse:
+        with read_primary():
+            result = await repository.find_by_slug(slug=slug)
 
         if result is None:
             raise AuthorNotExistException()
 
         response = self.mapper.from_entity_to_schema(entity=result)
 
-        await self.cache.set_json(
-            key=cache_key,
-            value=response.model_dump(mode="json"),
-            ttl=self.cache_ttl_seconds
+        return EncodedResponse.from_model(
+            response,
+            etag=build_etag(response.id, response.version),
+            last_modified=response.updated_at
         )
 
-        return response
-
 
 class CreateAuthorUseCase(CreateAuthorUseCaseProtocol):
     def __init__(
@@ -83,18 +100,29 @@ class DeleteAuthorUseCase(DeleteAuthorUseCaseProtocol):
     def __init__(
             self,
             repository: AuthorRepositoryProtocol,
-            uow: SQLAlchemyUoW
+            book_repository: BookRepositoryProtocol,
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.repository = repository
+        self.book_repository = book_repository
         self.uow = uow
+        self.cache = cache
 
     async def execute(self, author_id: UUID) -> None:
         async with self.uow:
-            result = await self.repository.delete_by_id(model_id=author_id)
+            book_slugs = await self.book_repository.detach_author(author_id=author_id)
+            slug = await self.repository.delete_by_id(model_id=author_id)
 
-            if not result:
+            if not slug:
                 raise AuthorNotExistException()
 
+        await self.cache.invalidate_tags([
+            get_author_tag(slug),
+            BOOKS_LIST_TAG,
+            *(get_book_tag(book_slug) for book_slug in book_slugs)
+        ])
+
 
 class UpdateAuthorPhotoUseCase(UpdateAuthorPhotoUseCaseProtocol):
     def __init__(
@@ -136,7 +164,6 @@ class UpdateAuthorPhotoUseCase(UpdateAuthorPhotoUseCaseProtocol):
             except MinioFileDeleteException:
                 pass
 
-        cache_key = f"author:slug:{author.slug}"
-        await self.cache.delete(key=cache_key)
+        await self.cache.invalidate_tags([get_author_tag(author.slug)])
 
         return self.mapper.from_entity_to_schema(entity=result)
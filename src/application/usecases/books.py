@@ -1,40 +1,251 @@
-from typing import List
+import asyncio
+import csv
+import hashlib
+import io
+from typing import List, Tuple, Union, Optional, TextIO, Set, Dict, Iterator, AsyncIterator, Callable, \
+    AsyncContextManager
 from uuid import UUID
 
-from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery
-from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse
+from pydantic import ValidationError
+
+from src.adapters.conditional import build_etag, latest
+from src.adapters.responses import EncodedResponse
+from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery, BookImportRow, \
+    BooksExportQuery
+from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse, BookPageResponse, \
+    BookImportResponse, BookImportErrorResponse
+from src.core.config import settings
+from src.core.database.routing import read_primary
+from src.core.imports import iter_records
+from src.core.pagination import encode_cursor, decode_cursor
 from src.core.uow import SQLAlchemyUoW
 from src.core.utils import generate_slug
 from src.domain.author.exceptions import AuthorNotExistException
 from src.domain.author.protocols import AuthorRepositoryProtocol
-from src.domain.books.entities import BookCreateEntity, BookUpdateEntity, BookFilterEntity
-from src.domain.books.enums import BookReadingStatus
-from src.domain.books.exceptions import BookNotExistException, FavouriteBookNotExistException
+from src.domain.books.entities import BookCreateEntity, BookUpdateEntity, BookFilterEntity, BookEntity
+from src.domain.books.enums import BookReadingStatus, BookSortField, BookFileFormat
+from src.domain.books.exceptions import BookNotExistException, FavouriteBookNotExistException, BookAlreadyExistException, \
+    BookBulkCreateException
 from src.domain.books.mappers import BookSchemaMapper, FavouriteBookSchemaMapper
 from src.domain.books.protocols import GetBooksUseCaseProtocol, BookRepositoryProtocol, FindBookBySlugUseCaseProtocol, \
     DeleteBookUseCaseProtocol, CreateBookUseCaseProtocol, UpdateBookUseCaseProtocol, AddFavouriteBookUseCaseProtocol, \
     FavouriteBookRepositoryProtocol, DeleteFavouriteBookUseCaseProtocol, FindFavouriteBooksUseCaseProtocol, \
-    UpdateFavouriteBookStatusUseCaseProtocol
+    UpdateFavouriteBookStatusUseCaseProtocol, ImportBooksUseCaseProtocol, ExportBooksUseCaseProtocol
 from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.cache.tags import get_book_tag, BOOKS_LIST_TAG
+from src.domain.pagination.exceptions import InvalidCursorException
 
 
 class GetBooksUseCase(GetBooksUseCaseProtocol):
     def __init__(
             self,
             mapper: BookSchemaMapper,
-            repository: BookRepositoryProtocol
+            repository: BookRepositoryProtocol,
+            cache: CacheManagerProtocol,
+            repository_factory: Optional[Callable[[], AsyncContextManager[BookRepositoryProtocol]]] = None
     ):
         self.mapper = mapper
         self.repository = repository
+        self.cache = cache
+        self.repository_factory = repository_factory
+        self.cache_ttl_seconds = 60
+        self.cache_stale_ttl_seconds = 600
 
-    async def execute(self, filters: BooksQuery) -> List[BookResponse]:
-        filters_entity = BookFilterEntity(**filters.model_dump())
-        results = await self.repository.find_all(filters=filters_entity)
+    async def execute(self, filters: BooksQuery) -> EncodedResponse:
+        after_value, after_id = None, None
 
-        return [
-            self.mapper.from_entity_to_schema(entity=result)
-            for result in results
-        ]
+        if filters.cursor is not None:
+            after_value, after_id = self.parse_cursor(
+                cursor=filters.cursor,
+                sort=filters.sort
+            )
+
+        return await self.cache.get_or_load(
+            key=self.build_cache_key(filters=filters),
+            schema=EncodedResponse,
+            loader=lambda: self.load(
+                repository=self.repository,
+                filters=filters,
+                after_value=after_value,
+                after_id=after_id
+            ),
+            ttl=self.cache_ttl_seconds,
+            stale_ttl=self.cache_stale_ttl_seconds,
+            tags=[BOOKS_LIST_TAG],
+            refresh_loader=(
+                lambda: self.refresh(filters=filters, after_value=after_value, after_id=after_id)
+            ) if self.repository_factory else None
+        )
+
+    @staticmethod
+    def build_cache_key(filters: BooksQuery) -> str:
+        digest = hashlib.blake2b(filters.model_dump_json().encode(), digest_size=16)
+        return f"books:list:{digest.hexdigest()}"
+
+    async def refresh(
+            self,
+            filters: BooksQuery,
+            after_value: Optional[Union[str, int]],
+            after_id: Optional[UUID]
+    ) -> EncodedResponse:
+        async with self.repository_factory() as repository:
+            return await self.load(
+                repository=repository,
+                filters=filters,
+                after_value=after_value,
+                after_id=after_id
+            )
+
+    async def load(
+            self,
+            repository: BookRepositoryProtocol,
+            filters: BooksQuery,
+            after_value: Optional[Union[str, int]],
+            after_id: Optional[UUID]
+    ) -> EncodedResponse:
+        filters_entity = BookFilterEntity(
+            genre=filters.genre,
+            limit=filters.limit + 1,
+            year_from=filters.year_from,
+            year_to=filters.year_to,
+            pages_from=filters.pages_from,
+            pages_to=filters.pages_to,
+            sort=filters.sort,
+            after_value=after_value,
+            after_id=after_id
+        )
+
+        with read_primary():
+            results = await repository.find_all(filters=filters_entity)
+
+        next_cursor = None
+        if len(results) > filters.limit:
+            results = results[:filters.limit]
+            next_cursor = self.build_cursor(entity=results[-1], sort=filters.sort)
+
+        response = BookPageResponse(
+            items=[
+                self.mapper.from_entity_to_schema(entity=result)
+                for result in results
+            ],
+            next_cursor=next_cursor
+        )
+
+        return EncodedResponse.from_model(
+            response,
+            etag=build_etag(*((item.id, item.version) for item in response.items), response.next_cursor),
+            last_modified=latest(item.updated_at for item in response.items)
+        )
+
+    @staticmethod
+    def get_sort_value(entity: BookEntity, sort: BookSortField) -> Union[str, int]:
+        if sort == BookSortField.PUBLISH_YEAR:
+            return entity.publish_year or 0
+
+        return entity.title
+
+    def build_cursor(self, entity: BookEntity, sort: BookSortField) -> str:
+        return encode_cursor([
+            sort.value,
+            self.get_sort_value(entity=entity, sort=sort),
+            str(entity.id)
+        ])
+
+    @staticmethod
+    def parse_cursor(cursor: str, sort: BookSortField) -> Tuple[Union[str, int], UUID]:
+        values = decode_cursor(cursor)
+
+        if len(values) != 3 or values[0] != sort.value:
+            raise InvalidCursorException()
+
+        value_type = int if sort == BookSortField.PUBLISH_YEAR else str
+        if not isinstance(values[1], value_type) or isinstance(values[1], bool):
+            raise InvalidCursorException()
+
+        try:
+            after_id = UUID(values[2])
+        except (TypeError, ValueError):
+            raise InvalidCursorException()
+
+        return values[1], after_id
+
+
+class ExportBooksUseCase(ExportBooksUseCaseProtocol):
+    csv_header = (
+        "id",
+        "title",
+        "slug",
+        "language",
+        "genre",
+        "description",
+        "short_description",
+        "publish_year",
+        "page_count",
+        "author_id",
+        "rating_average",
+        "rating_count"
+    )
+
+    def __init__(
+            self,
+            mapper: BookSchemaMapper,
+            repository: BookRepositoryProtocol,
+            batch_size: int = settings.BOOK_EXPORT_BATCH_SIZE
+    ):
+        self.mapper = mapper
+        self.repository = repository
+        self.batch_size = batch_size
+
+    async def execute(self, filters: BooksExportQuery) -> AsyncIterator[str]:
+        filters_entity = BookFilterEntity(
+            genre=filters.genre,
+            year_from=filters.year_from,
+            year_to=filters.year_to,
+            pages_from=filters.pages_from,
+            pages_to=filters.pages_to
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if filters.format == BookFileFormat.CSV:
+            writer.writerow(self.csv_header)
+
+        written = 0
+        async for entity in self.repository.stream_all(filters=filters_entity, batch_size=self.batch_size):
+            result = self.mapper.from_entity_to_schema(entity=entity)
+
+            if filters.format == BookFileFormat.CSV:
+                writer.writerow(self.build_csv_row(result=result))
+            else:
+                buffer.write(result.model_dump_json())
+                buffer.write("\n")
+
+            written += 1
+            if written % self.batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def build_csv_row(result: BookResponse) -> tuple:
+        return (
+            result.id,
+            result.title,
+            result.slug,
+            result.language,
+            result.genre.value,
+            result.description,
+            result.short_description,
+            result.publish_year,
+            result.page_count,
+            result.author_id,
+            result.rating.average,
+            result.rating.count
+        )
 
 
 class FindBookBySlugUseCase(FindBookBySlugUseCaseProtocol):
@@ -42,52 +253,67 @@ class FindBookBySlugUseCase(FindBookBySlugUseCaseProtocol):
             self,
             mapper: BookSchemaMapper,
             repository: BookRepositoryProtocol,
-            cache: CacheManagerProtocol
+            cache: CacheManagerProtocol,
+            repository_factory: Optional[Callable[[], AsyncContextManager[BookRepositoryProtocol]]] = None
     ):
         self.mapper = mapper
         self.repository = repository
         self.cache = cache
+        self.repository_factory = repository_factory
         self.cache_ttl_seconds = 60
+        self.cache_stale_ttl_seconds = 600
+
+    async def execute(self, slug: str) -> EncodedResponse:
+        return await self.cache.get_or_load(
+            key=f"book:slug:{slug}",
+            schema=EncodedResponse,
+            loader=lambda: self.load(repository=self.repository, slug=slug),
+            ttl=self.cache_ttl_seconds,
+            stale_ttl=self.cache_stale_ttl_seconds,
+            tags=[get_book_tag(slug)],
+            refresh_loader=(lambda: self.refresh(slug=slug)) if self.repository_factory else None
+        )
 
-    async def execute(self, slug: str) -> BookResponse:
-        cache_key = f"book:slug:{slug}"
-
-        cached = await self.cache.get_json(cache_key)
-        if cached is not None:
-            return BookResponse.model_validate(cached)
+    async def refresh(self, slug: str) -> EncodedResponse:
+        async with self.repository_factory() as repository:
+            return await self.load(repository=repository, slug=slug)
 
-        result = await self.repository.find_by_slug(slug=slug)
+    async def load(self, repository: BookRepositoryProtocol, slug: str) -> EncodedResponse:
+        with read_primary():
+            result = await repository.find_by_slug(slug=slug)
 
         if result is None:
             raise BookNotExistException()
 
         response = self.mapper.from_entity_to_schema(entity=result)
 
-        await self.cache.set_json(
-            key=cache_key,
-            value=response.model_dump(mode="json"),
-            ttl=self.cache_ttl_seconds
+        return EncodedResponse.from_model(
+            response,
+            etag=build_etag(response.id, response.version),
+            last_modified=response.updated_at
         )
 
-        return response
-
 
 class DeleteBookUseCase(DeleteBookUseCaseProtocol):
     def __init__(
             self,
             repository: BookRepositoryProtocol,
-            uow: SQLAlchemyUoW
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.repository = repository
         self.uow = uow
+        self.cache = cache
 
     async def execute(self, book_id: UUID) -> None:
         async with self.uow:
-            result = await self.repository.delete_by_id(model_id=book_id)
+            slug = await self.repository.delete_by_id(model_id=book_id)
 
-            if not result:
+            if not slug:
                 raise BookNotExistException()
 
+        await self.cache.invalidate_tags([get_book_tag(slug), BOOKS_LIST_TAG])
+
 
 class CreateBookUseCase(CreateBookUseCaseProtocol):
     def __init__(
@@ -96,19 +322,15 @@ class CreateBookUseCase(CreateBookUseCaseProtocol):
             book_repository: BookRepositoryProtocol,
             author_repository: AuthorRepositoryProtocol,
             uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.book_repository = book_repository
         self.author_repository = author_repository
         self.mapper = mapper
         self.uow = uow
+        self.cache = cache
 
     async def execute(self, data: BookCreateRequest) -> BookResponse:
-        if data.author_id is not None:
-            result = await self.author_repository.find_by_id(model_id=data.author_id)
-
-            if not result:
-                raise AuthorNotExistException()
-
         slug = generate_slug(text=data.title)
         entity = BookCreateEntity(
             title=data.title,
@@ -123,8 +345,138 @@ class CreateBookUseCase(CreateBookUseCaseProtocol):
         )
 
         async with self.uow:
+            if data.author_id is not None:
+                author = await self.author_repository.find_by_id(model_id=data.author_id)
+
+                if not author:
+                    raise AuthorNotExistException()
+
             result = await self.book_repository.create(entity=entity)
-            return self.mapper.from_entity_to_schema(entity=result)
+
+        await self.cache.invalidate_tags([BOOKS_LIST_TAG])
+        return self.mapper.from_entity_to_schema(entity=result)
+
+
+class ImportBooksUseCase(ImportBooksUseCaseProtocol):
+    def __init__(
+            self,
+            book_repository: BookRepositoryProtocol,
+            author_repository: AuthorRepositoryProtocol,
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol,
+            batch_size: int = settings.BOOK_IMPORT_BATCH_SIZE,
+            max_errors: int = settings.BOOK_IMPORT_MAX_ERRORS
+    ):
+        self.book_repository = book_repository
+        self.author_repository = author_repository
+        self.uow = uow
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    async def execute(self, stream: TextIO, fmt: BookFileFormat) -> BookImportResponse:
+        response = BookImportResponse()
+        known_author_ids: Set[UUID] = set()
+        batches = self.iter_batches(stream=stream, fmt=fmt, response=response)
+
+        while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+            await self.import_batch(batch=batch, known_author_ids=known_author_ids, response=response)
+
+        if response.created:
+            await self.cache.invalidate_tags([BOOKS_LIST_TAG])
+
+        return response
+
+    def iter_batches(
+            self,
+            stream: TextIO,
+            fmt: BookFileFormat,
+            response: BookImportResponse
+    ) -> Iterator[Dict[int, BookImportRow]]:
+        batch = {}
+
+        for line, record, error in iter_records(stream=stream, fmt=fmt):
+            if error is None:
+                try:
+                    batch[line] = BookImportRow.model_validate(record)
+                except ValidationError as e:
+                    error = "; ".join(
+                        f"{'.'.join(map(str, item['loc'])) or 'row'}: {item['msg']}"
+                        for item in e.errors()
+                    )
+
+            if error is not None:
+                self.add_error(response=response, line=line, message=error)
+
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = {}
+
+        if batch:
+            yield batch
+
+    async def import_batch(
+            self,
+            batch: Dict[int, BookImportRow],
+            known_author_ids: Set[UUID],
+            response: BookImportResponse
+    ) -> None:
+        author_ids = {row.author_id for row in batch.values() if row.author_id is not None}
+        known_author_ids |= await self.author_repository.find_existing_ids(ids=author_ids - known_author_ids)
+
+        entities: Dict[str, Tuple[int, BookCreateEntity]] = {}
+
+        for line, row in batch.items():
+            if row.author_id is not None and row.author_id not in known_author_ids:
+                self.add_error(response=response, line=line, message=str(AuthorNotExistException()))
+                continue
+
+            slug = generate_slug(text=row.title)
+
+            if not slug:
+                self.add_error(response=response, line=line, message="Не удалось получить slug из названия книги")
+                continue
+
+            if slug in entities:
+                self.add_error(response=response, line=line, message="Книга с таким slug уже есть в файле")
+                continue
+
+            entities[slug] = line, BookCreateEntity(
+                title=row.title,
+                slug=slug,
+                language=row.language,
+                description=row.description,
+                short_description=row.short_description,
+                publish_year=row.publish_year,
+                page_count=row.page_count,
+                author_id=row.author_id,
+                genre=row.genre
+            )
+
+        if not entities:
+            return
+
+        try:
+            async with self.uow:
+                created = await self.book_repository.bulk_create(
+                    entities=[entity for _, entity in entities.values()]
+                )
+        except BookBulkCreateException as e:
+            for line, _ in entities.values():
+                self.add_error(response=response, line=line, message=e.message)
+            return
+
+        response.created += len(created)
+
+        for slug, (line, _) in entities.items():
+            if slug not in created:
+                self.add_error(response=response, line=line, message=str(BookAlreadyExistException()))
+
+    def add_error(self, response: BookImportResponse, line: int, message: str) -> None:
+        response.failed += 1
+
+        if len(response.errors) < self.max_errors:
+            response.errors.append(BookImportErrorResponse(line=line, message=message))
 
 
 class UpdateBookUseCase(UpdateBookUseCaseProtocol):
@@ -143,12 +495,6 @@ class UpdateBookUseCase(UpdateBookUseCaseProtocol):
         self.cache = cache
 
     async def execute(self, book_id: UUID, data: BookUpdateRequest) -> BookResponse:
-        if data.author_id is not None:
-            result = await self.author_repository.find_by_id(model_id=data.author_id)
-
-            if not result:
-                raise AuthorNotExistException()
-
         entity = BookUpdateEntity(
             id=book_id,
             language=data.language,
@@ -161,15 +507,19 @@ class UpdateBookUseCase(UpdateBookUseCaseProtocol):
         )
 
         async with self.uow:
+            if data.author_id is not None:
+                author = await self.author_repository.find_by_id(model_id=data.author_id)
+
+                if not author:
+                    raise AuthorNotExistException()
+
             result = await self.book_repository.update(entity=entity)
 
             if result is None:
                 raise BookNotExistException()
 
-            cache_key = f"book:slug:{result.slug}"
-            await self.cache.delete(key=cache_key)
-
-            return self.mapper.from_entity_to_schema(entity=result)
+        await self.cache.invalidate_tags([get_book_tag(result.slug), BOOKS_LIST_TAG])
+        return self.mapper.from_entity_to_schema(entity=result)
 
 
 class AddFavouriteBookUseCase(AddFavouriteBookUseCaseProtocol):
@@ -1,14 +1,21 @@
-from typing import List
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
-from src.adapters.schemas.requests.reviews import ReviewRequest
-from src.adapters.schemas.responses.reviews import ReviewResponse
+from src.adapters.schemas.requests.reviews import ReviewRequest, ReviewsQuery
+from src.adapters.schemas.responses.reviews import ReviewResponse, ReviewPageResponse
+from src.core.pagination import encode_cursor, decode_cursor
 from src.core.uow import SQLAlchemyUoW
 from src.domain.books.exceptions import BookNotExistException
+from src.domain.books.mappers import BookSchemaMapper
 from src.domain.books.protocols import BookRepositoryProtocol
-from src.domain.reviews.entities import ReviewCreateEntity, ReviewUpdateEntity
+from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.cache.tags import get_book_tag, BOOKS_LIST_TAG
+from src.domain.pagination.exceptions import InvalidCursorException
+from src.domain.reviews.entities import ReviewCreateEntity, ReviewUpdateEntity, ReviewFilterEntity, ReviewItemEntity
+from src.domain.reviews.enums import ReviewSortField
 from src.domain.reviews.exceptions import ReviewNotExistException
-from src.domain.reviews.mappers import ReviewSchemaMapper
+from src.domain.reviews.mappers import ReviewSchemaMapper, ReviewItemSchemaMapper
 from src.domain.reviews.protocols import CreateReviewUseCaseProtocol, ReviewRepositoryProtocol, \
     FindReviewsUseCaseProtocol, UpdateReviewUseCaseProtocol, DeleteReviewUseCaseProtocol
 
@@ -19,12 +26,14 @@ class CreateReviewUseCase(CreateReviewUseCaseProtocol):
             review_repository: ReviewRepositoryProtocol,
             book_repository: BookRepositoryProtocol,
             mapper: ReviewSchemaMapper,
-            uow: SQLAlchemyUoW
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.review_repository = review_repository
         self.book_repository = book_repository
         self.mapper = mapper
         self.uow = uow
+        self.cache = cache
 
     async def execute(
             self,
@@ -46,7 +55,13 @@ class CreateReviewUseCase(CreateReviewUseCaseProtocol):
 
         async with self.uow:
             result = await self.review_repository.create(entity=entity)
-            return self.mapper.from_entity_to_schema(entity=result)
+            await self.book_repository.update_rating_stats(
+                book_id=book.id,
+                added_rating=result.rating
+            )
+
+        await self.cache.invalidate_tags([get_book_tag(slug), BOOKS_LIST_TAG])
+        return self.mapper.from_entity_to_schema(entity=result)
 
 
 class FindReviewsUseCase(FindReviewsUseCaseProtocol):
@@ -54,23 +69,78 @@ class FindReviewsUseCase(FindReviewsUseCaseProtocol):
             self,
             review_repository: ReviewRepositoryProtocol,
             book_repository: BookRepositoryProtocol,
-            mapper: ReviewSchemaMapper
+            mapper: ReviewItemSchemaMapper,
+            book_mapper: BookSchemaMapper
     ):
         self.review_repository = review_repository
         self.book_repository = book_repository
         self.mapper = mapper
+        self.book_mapper = book_mapper
+
+    async def execute(self, slug: str, filters: ReviewsQuery) -> ReviewPageResponse:
+        after_rating, after_created_at, after_id = None, None, None
+
+        if filters.cursor is not None:
+            after_rating, after_created_at, after_id = self.parse_cursor(
+                cursor=filters.cursor,
+                sort=filters.sort
+            )
 
-    async def execute(self, slug: str) -> List[ReviewResponse]:
         book = await self.book_repository.find_by_slug(slug=slug)
 
         if book is None:
-            return []
+            raise BookNotExistException()
+
+        filters_entity = ReviewFilterEntity(
+            book_id=book.id,
+            limit=filters.limit + 1,
+            sort=filters.sort,
+            after_rating=after_rating,
+            after_created_at=after_created_at,
+            after_id=after_id
+        )
+        results = await self.review_repository.find_page(filters=filters_entity)
+
+        next_cursor = None
+        if len(results) > filters.limit:
+            results = results[:filters.limit]
+            next_cursor = self.build_cursor(entity=results[-1], sort=filters.sort)
+
+        return ReviewPageResponse(
+            book=self.book_mapper.from_entity_to_schema(entity=book),
+            items=[
+                self.mapper.from_entity_to_schema(entity=result)
+                for result in results
+            ],
+            next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def build_cursor(entity: ReviewItemEntity, sort: ReviewSortField) -> str:
+        return encode_cursor([
+            sort.value,
+            entity.rating,
+            entity.created_at.isoformat(),
+            str(entity.id)
+        ])
 
-        entities = await self.review_repository.find_all_by_book_id(book_id=book.id)
-        return [
-            self.mapper.from_entity_to_schema(entity=entity)
-            for entity in entities
-        ]
+    @staticmethod
+    def parse_cursor(cursor: str, sort: ReviewSortField) -> Tuple[Optional[int], datetime, UUID]:
+        values = decode_cursor(cursor)
+
+        if len(values) != 4 or values[0] != sort.value:
+            raise InvalidCursorException()
+
+        if not isinstance(values[1], int) or isinstance(values[1], bool):
+            raise InvalidCursorException()
+
+        try:
+            after_created_at = datetime.fromisoformat(values[2])
+            after_id = UUID(values[3])
+        except (TypeError, ValueError):
+            raise InvalidCursorException()
+
+        return values[1], after_created_at, after_id
 
 
 class UpdateReviewUseCase(UpdateReviewUseCaseProtocol):
@@ -79,12 +149,14 @@ class UpdateReviewUseCase(UpdateReviewUseCaseProtocol):
             review_repository: ReviewRepositoryProtocol,
             book_repository: BookRepositoryProtocol,
             mapper: ReviewSchemaMapper,
-            uow: SQLAlchemyUoW
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.review_repository = review_repository
         self.book_repository = book_repository
         self.mapper = mapper
         self.uow = uow
+        self.cache = cache
 
     async def execute(
             self,
@@ -105,12 +177,20 @@ class UpdateReviewUseCase(UpdateReviewUseCaseProtocol):
         )
 
         async with self.uow:
-            result = await self.review_repository.update(entity=entity)
+            updated = await self.review_repository.update(entity=entity)
 
-            if result is None:
+            if updated is None:
                 raise ReviewNotExistException()
 
-            return self.mapper.from_entity_to_schema(entity=result)
+            result, previous_rating = updated
+            await self.book_repository.update_rating_stats(
+                book_id=book.id,
+                added_rating=result.rating,
+                removed_rating=previous_rating
+            )
+
+        await self.cache.invalidate_tags([get_book_tag(slug), BOOKS_LIST_TAG])
+        return self.mapper.from_entity_to_schema(entity=result)
 
 
 class DeleteReviewUseCase(DeleteReviewUseCaseProtocol):
@@ -118,11 +198,13 @@ class DeleteReviewUseCase(DeleteReviewUseCaseProtocol):
             self,
             review_repository: ReviewRepositoryProtocol,
             book_repository: BookRepositoryProtocol,
-            uow: SQLAlchemyUoW
+            uow: SQLAlchemyUoW,
+            cache: CacheManagerProtocol
     ):
         self.review_repository = review_repository
         self.book_repository = book_repository
         self.uow = uow
+        self.cache = cache
 
     async def execute(self, user_id: UUID, slug: str) -> None:
         book = await self.book_repository.find_by_slug(slug=slug)
@@ -131,10 +213,17 @@ class DeleteReviewUseCase(DeleteReviewUseCaseProtocol):
             raise BookNotExistException()
 
         async with self.uow:
-            result = await self.review_repository.delete_by_id(
+            rating = await self.review_repository.delete_by_id(
                 user_id=user_id,
                 book_id=book.id
             )
 
-            if not result:
-                raise ReviewNotExistException()
\ No newline at end of file
+            if rating is None:
+                raise ReviewNotExistException()
+
+            await self.book_repository.update_rating_stats(
+                book_id=book.id,
+                removed_rating=rating
+            )
+
+        await self.cache.invalidate_tags([get_book_tag(slug), BOOKS_LIST_TAG])
@@ -0,0 +1,37 @@
+from src.adapters.schemas.requests.search import SearchQuery
+from src.adapters.schemas.responses.search import SearchPageResponse
+from src.domain.search.entities import SearchFilterEntity
+from src.domain.search.mappers import SearchResultSchemaMapper
+from src.domain.search.protocols import SearchUseCaseProtocol, SearchRepositoryProtocol
+
+
+class SearchUseCase(SearchUseCaseProtocol):
+    def __init__(
+            self,
+            repository: SearchRepositoryProtocol,
+            mapper: SearchResultSchemaMapper
+    ):
+        self.repository = repository
+        self.mapper = mapper
+
+    async def execute(self, query: SearchQuery) -> SearchPageResponse:
+        filters = SearchFilterEntity(
+            query=query.q,
+            target=query.target,
+            limit=query.limit + 1,
+            offset=query.offset
+        )
+        results = await self.repository.search(filters=filters)
+
+        next_offset = None
+        if len(results) > query.limit:
+            results = results[:query.limit]
+            next_offset = query.offset + query.limit
+
+        return SearchPageResponse(
+            items=[
+                self.mapper.from_entity_to_schema(entity=result)
+                for result in results
+            ],
+            next_offset=next_offset
+        )
@@ -23,7 +23,7 @@ class RegisterUseCase(RegisterUseCaseProtocol):
         self.uow = uow
 
     async def execute(self, data: RegisterRequest) -> UserResponse:
-        hashed_password = self.password_hasher.hash(password=data.password)
+        hashed_password = await self.password_hasher.hash(password=data.password)
 
         create_entity = UserCreateEntity(
             email=data.email,
@@ -55,7 +55,7 @@ class LogInUseCase(LogInUseCaseProtocol):
         if result is None:
             raise InvalidCredentialsException()
 
-        if not self.password_hasher.verify(
+        if not await self.password_hasher.verify(
                 plain_password=data.password,
                 hashed_password=result.hashed_password
         ):
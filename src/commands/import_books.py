@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import logging
+
+from src.adapters.schemas.responses.books import BookImportResponse
+from src.application.usecases.books import ImportBooksUseCase
+from src.core.database.database import async_session
+from src.core.uow import SQLAlchemyUoW
+from src.domain.books.enums import BookFileFormat
+from src.infrastructure.cache.cache import get_cache_manager
+from src.infrastructure.database.author.mappers import AuthorModelMapper
+from src.infrastructure.database.author.repositories import AuthorRepository
+from src.infrastructure.database.books.mappers import BookModelMapper
+from src.infrastructure.database.books.repositories import BookRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def import_books(path: str, fmt: BookFileFormat) -> BookImportResponse:
+    async with async_session() as session:
+        use_case = ImportBooksUseCase(
+            book_repository=BookRepository(
+                session=session,
+                mapper=BookModelMapper()
+            ),
+            author_repository=AuthorRepository(
+                session=session,
+                mapper=AuthorModelMapper()
+            ),
+            uow=SQLAlchemyUoW(session),
+            cache=await get_cache_manager()
+        )
+
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            return await use_case.execute(stream=stream, fmt=fmt)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Массовый импорт книг из CSV или NDJSON")
+    parser.add_argument("path", help="Путь к файлу с книгами")
+    parser.add_argument(
+        "--format",
+        type=BookFileFormat,
+        choices=list(BookFileFormat),
+        default=BookFileFormat.CSV,
+        help="Формат файла"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    result = asyncio.run(import_books(path=args.path, fmt=args.format))
+
+    for error in result.errors:
+        logger.warning("Line %s: %s", error.line, error.message)
+
+    logger.info("Books imported: %s, failed: %s", result.created, result.failed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+import logging
+from typing import Optional
+from uuid import UUID
+
+from src.core.database.database import async_session
+from src.core.uow import SQLAlchemyUoW
+from src.infrastructure.database.books.mappers import BookModelMapper
+from src.infrastructure.database.books.repositories import BookRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def recalculate_ratings(book_id: Optional[UUID] = None) -> int:
+    async with async_session() as session:
+        repository = BookRepository(
+            session=session,
+            mapper=BookModelMapper()
+        )
+
+        async with SQLAlchemyUoW(session):
+            return await repository.recalculate_rating_stats(book_id=book_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Пересчёт агрегатов рейтинга книг по отзывам")
+    parser.add_argument("--book-id", type=UUID, default=None, help="Пересчитать только одну книгу")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    updated = asyncio.run(recalculate_ratings(book_id=args.book_id))
+    logger.info("Rating stats recalculated for %s books", updated)
+
+
+if __name__ == "__main__":
+    main()
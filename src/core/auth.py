@@ -1,3 +1,5 @@
+import hashlib
+import time
 from uuid import UUID
 
 from fastapi import Security, Depends, HTTPException
@@ -6,19 +8,29 @@ from jose import ExpiredSignatureError, JWTError, jwt
 
 from src.adapters.dependencies import get_user_repository
 from src.core.config import settings
-from src.domain.user.entities import UserEntity
+from src.core.database.routing import read_primary
+from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.user.entities import UserProfileEntity
 from src.domain.user.protocols import UserRepositoryProtocol
+from src.infrastructure.cache.cache import get_cache_manager, token_cache
 
 bearer_scheme = HTTPBearer(auto_error=True)
 
 
-async def get_user(
-        creds: HTTPAuthorizationCredentials = Security(bearer_scheme),
-        repository: UserRepositoryProtocol = Depends(get_user_repository)
-) -> UserEntity:
+def get_user_cache_key(user_id: UUID) -> str:
+    return f"user:profile:{user_id}"
+
+
+def decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = token_cache.get(key)
+
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(
-            creds.credentials,
+            token,
             settings.AUTH_SECRET_KEY,
             algorithms=[settings.AUTH_ALGORITHM],
             options={"verify_aud": False},
@@ -28,13 +40,36 @@ async def get_user(
     except JWTError:
         raise HTTPException(status_code=401, detail="Токен недействителен")
 
-    user_id = UUID(payload.get("sub"))
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Такого пользователя нет")
+    ttl = min(settings.AUTH_TOKEN_CACHE_TTL_SECONDS, payload.get("exp", 0) - time.time())
+    token_cache.set(key, payload, size=len(token), ttl=ttl)
+
+    return payload
 
-    user = await repository.find_by_id(model_id=user_id)
+
+async def load_user(user_id: UUID, repository: UserRepositoryProtocol) -> UserProfileEntity:
+    with read_primary():
+        user = await repository.find_profile_by_id(model_id=user_id)
 
     if not user:
         raise HTTPException(status_code=401, detail="Такого пользователя нет")
 
-    return user
\ No newline at end of file
+    return user
+
+
+async def get_user(
+        creds: HTTPAuthorizationCredentials = Security(bearer_scheme),
+        repository: UserRepositoryProtocol = Depends(get_user_repository),
+        cache: CacheManagerProtocol = Depends(get_cache_manager)
+) -> UserProfileEntity:
+    payload = decode_token(creds.credentials)
+
+    user_id = UUID(payload.get("sub"))
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Такого пользователя нет")
+
+    return await cache.get_or_load(
+        key=get_user_cache_key(user_id),
+        schema=UserProfileEntity,
+        loader=lambda: load_user(user_id=user_id, repository=repository),
+        ttl=settings.AUTH_USER_CACHE_TTL_SECONDS
+    )
@@ -0,0 +1,169 @@
+import zlib
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes, final: bool) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int = settings.COMPRESSION_GZIP_LEVEL):
+        self.compressobj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressobj.compress(data) + self.compressobj.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int = settings.COMPRESSION_BROTLI_QUALITY):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.process(data) + (self.compressor.finish() if final else self.compressor.flush())
+
+
+class ZstdCompressor:
+    def __init__(self, level: int = settings.COMPRESSION_ZSTD_LEVEL):
+        self.compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return self.compressobj.compress(data) + self.compressobj.flush(flush_mode)
+
+
+CODECS: Dict[str, Callable[[], Compressor]] = {}
+
+if zstandard is not None:
+    CODECS["zstd"] = ZstdCompressor
+
+if brotli is not None:
+    CODECS["br"] = BrotliCompressor
+
+CODECS["gzip"] = GzipCompressor
+
+
+ETAG_ENCODINGS = ("zstd", "br", "gzip")
+
+
+def encode_etag(etag: str, encoding: Optional[str]) -> str:
+    if encoding is None or not etag.endswith('"') or etag.endswith(f'-{encoding}"'):
+        return etag
+
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_etag_encoding(etag: str) -> str:
+    etag = etag.removeprefix("W/")
+
+    for encoding in ETAG_ENCODINGS:
+        suffix = f'-{encoding}"'
+
+        if etag.endswith(suffix):
+            return f'{etag[:-len(suffix)]}"'
+
+    return etag
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    return CODECS[encoding]().compress(data, final=True)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    weights = {}
+
+    for item in value.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+
+        if not name:
+            continue
+
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.partition("=")
+
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(raw)
+                except ValueError:
+                    weight = 0.0
+
+        weights[name] = weight
+
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Tuple[str, ...] = tuple(CODECS)) -> Optional[str]:
+    if not accept_encoding:
+        return None
+
+    weights = parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, wildcard)
+
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+
+    return best
+
+
+class CompressionResponder(IdentityResponder):
+    def __init__(self, app: ASGIApp, minimum_size: int, encoding: str):
+        super().__init__(app, minimum_size)
+        self.content_encoding = encoding
+        self.compressor = CODECS[encoding]()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                etag = headers.get("etag")
+
+                if etag is not None and headers.get("content-encoding") == self.content_encoding:
+                    headers["ETag"] = encode_etag(etag, self.content_encoding)
+
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_etag)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        return self.compressor.compress(body, final=not more_body)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = settings.COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+
+        if encoding is None:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        else:
+            responder = CompressionResponder(self.app, self.minimum_size, encoding=encoding)
+
+        await responder(scope, receive, send)
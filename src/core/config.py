@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,9 +16,30 @@ class Settings(BaseSettings):
     DATABASE_PORT: int
     DATABASE_URL: str
     LOCAL_DATABASE_URL: str
+    DATABASE_REPLICA_URLS: List[str] = []
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DATABASE_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 10.0
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_PGBOUNCER: bool = False
+    DATABASE_QUERY_FINGERPRINT_LIMIT: int = 500
+    DATABASE_SLOW_QUERY_SECONDS: float = 0.5
+    DATABASE_SLOW_QUERY_EXPLAIN: bool = True
+    DATABASE_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = 300.0
 
     REDIS_URL: str
 
+    CACHE_LOCAL_MAX_ENTRIES: int = 10_000
+    CACHE_LOCAL_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_LOCAL_TTL_SECONDS: int = 30
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    CACHE_LOCK_TTL_SECONDS: int = 5
+    CACHE_LOCK_WAIT_SECONDS: float = 2.0
+    CACHE_XFETCH_BETA: float = 1.0
+
     MINIO_ROOT_USER: str
     MINIO_ROOT_PASSWORD: str
     MINIO_HOST: str
@@ -24,11 +47,38 @@ class Settings(BaseSettings):
     MINIO_ENDPOINT: str
     MINIO_PUBLIC_ENDPOINT: str
     MINIO_BUCKET_AVATARS: str
+    MINIO_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    MINIO_UPLOAD_PART_SIZE: int = 5 * 1024 * 1024
+    MINIO_REGION: str = "us-east-1"
+    MINIO_POOL_MAXSIZE: int = 20
+    MINIO_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    MINIO_READ_TIMEOUT_SECONDS: float = 60.0
 
     APP_PORT: int
 
+    BOOK_IMPORT_BATCH_SIZE: int = 5_000
+    BOOK_IMPORT_MAX_ERRORS: int = 1_000
+    BOOK_EXPORT_BATCH_SIZE: int = 1_000
+
+    CACHE_CONTROL_BOOKS: str = "public, max-age=0, must-revalidate"
+    CACHE_CONTROL_BOOK: str = "public, max-age=60"
+    CACHE_CONTROL_AUTHOR: str = "public, max-age=120"
+    CACHE_CONTROL_REVIEWS: str = "public, max-age=0, must-revalidate"
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    SERVER_TIMING_ENABLED: bool = True
+
     AUTH_SECRET_KEY: str
     AUTH_ALGORITHM: str
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    PASSWORD_HASHER_MAX_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
 
 
 settings = Settings() # type: ignore
\ No newline at end of file
@@ -1,20 +1,106 @@
+import uuid
+from typing import Any, Dict, Optional, cast
+
 from fastapi.params import Depends
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from sqlalchemy.orm import declarative_base
 from typing_extensions import AsyncGenerator
 
 from src.core.config import settings
-from src.core.observability.database import setup_db_timing
+from src.core.database.routing import ReplicaRouter, RoutingSession
+from src.core.observability.database import setup_db_timing, setup_pool_metrics, InstrumentedQueuePool
 from src.core.uow import SQLAlchemyUoW
 
-engine = create_async_engine(str(settings.LOCAL_DATABASE_URL or settings.DATABASE_URL))
-async_session = async_sessionmaker(engine, expire_on_commit=False)
-setup_db_timing(engine)
+
+def get_engine_options(url: str, name: str) -> Dict[str, Any]:
+    database_url = make_url(url)
+
+    if database_url.get_backend_name() == "sqlite":
+        return {}
+
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_logging_name": name
+    }
+
+    if settings.DATABASE_PGBOUNCER and database_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__"
+        }
+
+    return options
+
+
+def build_engine(url: str, name: str) -> AsyncEngine:
+    async_engine = create_async_engine(url, **get_engine_options(url=url, name=name))
+    setup_db_timing(async_engine)
+    setup_pool_metrics(async_engine, name=name, max_overflow=settings.DATABASE_POOL_MAX_OVERFLOW)
+
+    return async_engine
+
+
+engine = build_engine(str(settings.LOCAL_DATABASE_URL or settings.DATABASE_URL), name="primary")
+replica_engines = [
+    build_engine(url, name=f"replica-{index}")
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=replica_engines,
+    max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DATABASE_REPLICA_CHECK_INTERVAL_SECONDS
+)
+
+async_session = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    router=replica_router
+)
+
+
+class LazySession:
+    def __init__(self, factory: async_sessionmaker):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_opened(self) -> bool:
+        return self._session is not None
+
+    def open(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.open(), name)
+
+    async def close(self) -> None:
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
-        yield session
+    session = LazySession(async_session)
+
+    try:
+        yield cast(AsyncSession, session)
+    finally:
+        await session.close()
 
 
 async def get_uow(session: AsyncSession = Depends(get_session)) -> SQLAlchemyUoW:
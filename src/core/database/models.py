@@ -1,6 +1,8 @@
+from datetime import datetime
 from uuid import UUID, uuid4
 
 import sqlalchemy
+from sqlalchemy import func, literal_column
 from sqlalchemy.orm import mapped_column, Mapped
 
 from src.core.database.database import Base
@@ -14,4 +16,20 @@ class SQLBaseModel(Base):
         primary_key=True,
         default=uuid4,
         nullable=False
-    )
\ No newline at end of file
+    )
+
+
+class VersionedModelMixin:
+    version: Mapped[int] = mapped_column(
+        sqlalchemy.Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version + 1")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now()
+    )
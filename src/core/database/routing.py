@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Sequence, List, Any, Iterator
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.observability.metrics import DATABASE_REPLICA_LAG_SECONDS, DATABASE_REPLICA_HEALTHY
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_PINNED_KEY = "primary_pinned"
+REPLICA_KEY = "replica"
+
+POSTGRES_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = False
+        self.lag_seconds = 0.0
+
+
+class ReplicaRouter:
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replicas: Sequence[AsyncEngine] = (),
+            max_lag_seconds: float = 5.0,
+            check_interval_seconds: float = 5.0
+    ):
+        self.primary = primary
+        self.replicas: List[Replica] = [
+            Replica(name=f"replica-{index}", engine=engine)
+            for index, engine in enumerate(replicas)
+        ]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def choose(self) -> AsyncEngine:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+
+        if not healthy:
+            return self.primary
+
+        return random.choice(healthy).engine
+
+    def start(self) -> None:
+        if self._task is None and self.replicas:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def run(self) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.check_interval_seconds)
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    async def check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                if connection.dialect.name == "postgresql":
+                    lag = await connection.scalar(text(POSTGRES_LAG_QUERY))
+                else:
+                    lag = await connection.scalar(text("SELECT 0"))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if replica.healthy:
+                logger.warning("Replica %s is unavailable", replica.name, exc_info=True)
+
+            replica.healthy = False
+        else:
+            replica.lag_seconds = float(lag or 0)
+            healthy = replica.lag_seconds <= self.max_lag_seconds
+
+            if replica.healthy and not healthy:
+                logger.warning("Replica %s lags by %.1fs", replica.name, replica.lag_seconds)
+
+            replica.healthy = healthy
+            DATABASE_REPLICA_LAG_SECONDS.labels(replica=replica.name).set(replica.lag_seconds)
+
+        DATABASE_REPLICA_HEALTHY.labels(replica=replica.name).set(int(replica.healthy))
+
+
+def is_write(clause: Any) -> bool:
+    if clause is None:
+        return False
+
+    return bool(getattr(clause, "is_dml", False)) or getattr(clause, "_for_update_arg", None) is not None
+
+
+class RoutingSession(Session):
+    def __init__(self, router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self.router is None or not self.router.replicas:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+        if self.info.get(PRIMARY_PINNED_KEY) or primary_reads.get() or self._flushing or is_write(clause):
+            return self.router.primary.sync_engine
+
+        engine = self.info.get(REPLICA_KEY)
+
+        if engine is None:
+            engine = self.info[REPLICA_KEY] = self.router.choose()
+
+        return engine.sync_engine
+
+
+def pin_primary(session: AsyncSession) -> None:
+    session.info[PRIMARY_PINNED_KEY] = True
+
+
+@contextmanager
+def read_primary() -> Iterator[None]:
+    token = primary_reads.set(True)
+
+    try:
+        yield
+    finally:
+        primary_reads.reset(token)
@@ -0,0 +1,48 @@
+import csv
+import json
+from typing import Iterator, TextIO, Tuple, Optional, Dict, Any
+
+from src.domain.books.enums import BookFileFormat
+
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_csv_records(stream: TextIO) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(stream)
+
+    try:
+        for record in reader:
+            line = reader.line_num
+
+            if None in record:
+                yield line, None, "Лишние значения в строке"
+                continue
+
+            yield line, {key: value for key, value in record.items() if value not in ("", None)}, None
+    except csv.Error as e:
+        yield reader.line_num, None, f"Невалидный CSV: {e}"
+
+
+def iter_ndjson_records(stream: TextIO) -> Iterator[ImportRecord]:
+    for line, raw in enumerate(stream, start=1):
+        if not raw.strip():
+            continue
+
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            yield line, None, "Невалидный JSON"
+            continue
+
+        if not isinstance(record, dict):
+            yield line, None, "Ожидался JSON-объект"
+            continue
+
+        yield line, record, None
+
+
+def iter_records(stream: TextIO, fmt: BookFileFormat) -> Iterator[ImportRecord]:
+    if fmt == BookFileFormat.CSV:
+        return iter_csv_records(stream)
+
+    return iter_ndjson_records(stream)
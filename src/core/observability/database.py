@@ -1,13 +1,20 @@
 import time
 
 from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 
-from src.core.observability.metrics import DATABASE_QUERY_SECONDS
+from src.core.observability.metrics import DATABASE_QUERY_SECONDS, DATABASE_POOL_CHECKED_OUT, \
+    DATABASE_POOL_OVERFLOW, DATABASE_POOL_CAPACITY, DATABASE_POOL_CHECKOUT_SECONDS, DATABASE_POOL_TIMEOUTS, \
+    DATABASE_QUERY_ROWS
+from src.core.observability.queries import record_query
+from src.core.observability.statements import SlowQueryLog, fingerprints
 
 
 def setup_db_timing(async_engine: AsyncEngine) -> None:
     eng = async_engine.sync_engine
+    slow_queries = SlowQueryLog(async_engine)
 
     @event.listens_for(eng, "before_cursor_execute")
     def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -18,7 +25,13 @@ def setup_db_timing(async_engine: AsyncEngine) -> None:
         start = getattr(context, "_prom_start_time", None)
         if start is None:
             return
-        DATABASE_QUERY_SECONDS.observe(time.perf_counter() - start)
+        elapsed = time.perf_counter() - start
+        fingerprint, operation, _ = fingerprints.resolve(statement)
+        DATABASE_QUERY_SECONDS.labels(operation=operation, fingerprint=fingerprint).observe(elapsed)
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            DATABASE_QUERY_ROWS.labels(operation=operation, fingerprint=fingerprint).observe(cursor.rowcount)
+        record_query(statement, elapsed)
+        slow_queries.observe(statement, parameters, elapsed, executemany)
 
     @event.listens_for(eng, "handle_error")
     def handle_error(exception_context):
@@ -26,4 +39,33 @@ def setup_db_timing(async_engine: AsyncEngine) -> None:
         start = getattr(ctx, "_prom_start_time", None) if ctx is not None else None
         if start is None:
             return
-        DATABASE_QUERY_SECONDS.observe(time.perf_counter() - start)
\ No newline at end of file
+        elapsed = time.perf_counter() - start
+        statement = exception_context.statement or ""
+        fingerprint, operation, _ = fingerprints.resolve(statement)
+        DATABASE_QUERY_SECONDS.labels(operation=operation, fingerprint=fingerprint).observe(elapsed)
+        record_query(statement, elapsed)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def connect(self) -> PoolProxiedConnection:
+        name = self.logging_name or "default"
+        start = time.perf_counter()
+
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DATABASE_POOL_TIMEOUTS.labels(engine=name).inc()
+            raise
+        finally:
+            DATABASE_POOL_CHECKOUT_SECONDS.labels(engine=name).observe(time.perf_counter() - start)
+
+
+def setup_pool_metrics(async_engine: AsyncEngine, name: str, max_overflow: int) -> None:
+    eng = async_engine.sync_engine
+
+    if not isinstance(eng.pool, AsyncAdaptedQueuePool):
+        return
+
+    DATABASE_POOL_CHECKED_OUT.labels(engine=name).set_function(lambda: eng.pool.checkedout())
+    DATABASE_POOL_OVERFLOW.labels(engine=name).set_function(lambda: max(eng.pool.overflow(), 0))
+    DATABASE_POOL_CAPACITY.labels(engine=name).set(eng.pool.size() + max(max_overflow, 0))
@@ -1,4 +1,4 @@
-from prometheus_client import Histogram
+from prometheus_client import Histogram, Counter, Gauge
 
 REDIS_OPERATION_SECONDS = Histogram(
     "redis_operation_seconds",
@@ -13,5 +13,135 @@ REDIS_OPERATION_SECONDS = Histogram(
 DATABASE_QUERY_SECONDS = Histogram(
     "db_query_duration_seconds",
     "Время выполнения SQL-запросов",
+    ["operation", "fingerprint"],
     buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
-)
\ No newline at end of file
+)
+
+
+CACHE_LOCAL_REQUESTS = Counter(
+    "cache_local_requests_total",
+    "Обращения к локальному (in-process) кэшу",
+    ["result"]
+)
+
+
+CACHE_REFRESHES = Counter(
+    "cache_background_refreshes_total",
+    "Фоновые обновления закэшированных значений",
+    ["status"]
+)
+
+
+PASSWORD_HASHER_QUEUED = Gauge(
+    "password_hasher_queued",
+    "Операции хэширования паролей, ожидающие свободного потока"
+)
+
+
+PASSWORD_HASHER_IN_PROGRESS = Gauge(
+    "password_hasher_in_progress",
+    "Операции хэширования паролей, выполняющиеся в пуле потоков"
+)
+
+
+PASSWORD_HASHER_WAIT_SECONDS = Histogram(
+    "password_hasher_wait_seconds",
+    "Время ожидания свободного потока для хэширования пароля",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5)
+)
+
+
+PASSWORD_HASHER_SECONDS = Histogram(
+    "password_hasher_seconds",
+    "Время хэширования и проверки паролей",
+    ["op", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5)
+)
+
+
+DATABASE_REPLICA_LAG_SECONDS = Gauge(
+    "db_replica_lag_seconds",
+    "Отставание реплики базы данных от основного сервера",
+    ["replica"]
+)
+
+
+DATABASE_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "Доступна ли реплика для чтения",
+    ["replica"]
+)
+
+
+DATABASE_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Соединения, выданные из пула базы данных",
+    ["engine"]
+)
+
+
+DATABASE_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Соединения, открытые сверх постоянного размера пула",
+    ["engine"]
+)
+
+
+DATABASE_POOL_CAPACITY = Gauge(
+    "db_pool_capacity",
+    "Максимальное кол-во соединений в пуле с учётом overflow",
+    ["engine"]
+)
+
+
+DATABASE_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Время ожидания соединения из пула базы данных",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+)
+
+
+DATABASE_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Запросы, не дождавшиеся свободного соединения из пула",
+    ["engine"]
+)
+
+
+DATABASE_REQUEST_QUERIES = Histogram(
+    "db_request_queries",
+    "Кол-во SQL-запросов на один HTTP-запрос",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+)
+
+
+DATABASE_REQUEST_SECONDS = Histogram(
+    "db_request_duration_seconds",
+    "Суммарное время SQL-запросов на один HTTP-запрос",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+)
+
+
+DATABASE_QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Кол-во строк, затронутых или возвращённых SQL-запросом",
+    ["operation", "fingerprint"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000)
+)
+
+
+DATABASE_QUERY_FINGERPRINT_INFO = Gauge(
+    "db_query_fingerprint_info",
+    "Нормализованный текст SQL-запроса для каждого отпечатка",
+    ["fingerprint", "query"]
+)
+
+
+DATABASE_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "SQL-запросы, превысившие порог медленного запроса",
+    ["operation", "fingerprint"]
+)
@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional, Iterator
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from src.core.config import settings
+from src.core.observability.metrics import DATABASE_REQUEST_QUERIES, DATABASE_REQUEST_SECONDS
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+    def add(self, seconds: float, count: int = 1) -> None:
+        self.count += count
+        self.seconds += seconds
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def record_query(statement: str, seconds: float) -> None:
+    stats = query_stats.get()
+
+    if stats is None or statement.lstrip().upper().startswith(SAVEPOINT_STATEMENTS):
+        return
+
+    stats.add(seconds)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    parent = query_stats.get()
+    stats = QueryStats()
+    token = query_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+        if parent is not None:
+            parent.add(stats.seconds, count=stats.count)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > limit:
+        raise AssertionError(f"Expected at most {limit} queries, {stats.count} were executed")
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = settings.SERVER_TIMING_ENABLED):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = scope.get("route")
+
+                if route is not None:
+                    labels = {"method": scope["method"], "route": getattr(route, "path", "unknown")}
+                    DATABASE_REQUEST_QUERIES.labels(**labels).observe(stats.count)
+                    DATABASE_REQUEST_SECONDS.labels(**labels).observe(stats.seconds)
@@ -0,0 +1,178 @@
+import asyncio
+import contextvars
+import hashlib
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Set, Tuple, Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.observability.metrics import DATABASE_QUERY_FINGERPRINT_INFO, DATABASE_SLOW_QUERIES
+from src.core.observability.queries import query_stats
+
+logger = logging.getLogger(__name__)
+
+OTHER_FINGERPRINT = "other"
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+PARAMETER_PATTERN = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+ROWS_PATTERN = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+SPACE_PATTERN = re.compile(r"\s+")
+
+background_tasks: Set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    normalized = COMMENT_PATTERN.sub(" ", statement)
+    normalized = STRING_PATTERN.sub("?", normalized)
+    normalized = PARAMETER_PATTERN.sub("?", normalized)
+    normalized = NUMBER_PATTERN.sub("?", normalized)
+    normalized = LIST_PATTERN.sub("(?)", normalized)
+    normalized = ROWS_PATTERN.sub("(?)", normalized)
+
+    return SPACE_PATTERN.sub(" ", normalized).strip()
+
+
+def get_operation(normalized: str) -> str:
+    operation = normalized.split(" ", 1)[0].upper()
+    return operation.lower() if operation in OPERATIONS else "other"
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_statement(statement: str) -> Tuple[str, str, str]:
+    normalized = normalize_statement(statement)
+    fingerprint = hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
+
+    return fingerprint, get_operation(normalized), normalized
+
+
+class FingerprintRegistry:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._fingerprints: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def resolve(self, statement: str) -> Tuple[str, str, str]:
+        fingerprint, operation, normalized = fingerprint_statement(statement)
+
+        if fingerprint not in self._fingerprints:
+            if len(self._fingerprints) >= self.limit:
+                return OTHER_FINGERPRINT, operation, normalized
+
+            self._fingerprints[fingerprint] = normalized
+            DATABASE_QUERY_FINGERPRINT_INFO.labels(fingerprint=fingerprint, query=normalized[:200]).set(1)
+
+        return fingerprint, operation, normalized
+
+
+fingerprints = FingerprintRegistry(limit=settings.DATABASE_QUERY_FINGERPRINT_LIMIT)
+
+
+class SlowQueryLog:
+    def __init__(
+            self,
+            async_engine: AsyncEngine,
+            threshold_seconds: float = settings.DATABASE_SLOW_QUERY_SECONDS,
+            explain: bool = settings.DATABASE_SLOW_QUERY_EXPLAIN,
+            explain_interval_seconds: float = settings.DATABASE_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+    ):
+        self.async_engine = async_engine
+        self.threshold_seconds = threshold_seconds
+        self.explain = explain
+        self.explain_interval_seconds = explain_interval_seconds
+        self._explained_at: Dict[str, float] = {}
+
+    def observe(
+            self,
+            statement: str,
+            parameters: Any,
+            elapsed: float,
+            executemany: bool
+    ) -> None:
+        if self.threshold_seconds <= 0 or elapsed < self.threshold_seconds:
+            return
+
+        fingerprint, operation, normalized = fingerprints.resolve(statement)
+        DATABASE_SLOW_QUERIES.labels(operation=operation, fingerprint=fingerprint).inc()
+
+        if not self.should_explain(fingerprint=fingerprint, operation=operation, executemany=executemany):
+            logger.warning("Slow query %s took %.3fs: %s", fingerprint, elapsed, normalized)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("Slow query %s took %.3fs: %s", fingerprint, elapsed, normalized)
+            return
+
+        context = contextvars.copy_context()
+        context.run(query_stats.set, None)
+
+        task = loop.create_task(
+            self.log_with_plan(
+                statement=statement,
+                parameters=parameters,
+                fingerprint=fingerprint,
+                normalized=normalized,
+                elapsed=elapsed
+            ),
+            context=context
+        )
+
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+    def should_explain(self, fingerprint: str, operation: str, executemany: bool) -> bool:
+        if not self.explain or executemany or operation not in ("select", "with"):
+            return False
+
+        now = time.monotonic()
+        explained_at = self._explained_at.get(fingerprint)
+
+        if explained_at is not None and now - explained_at < self.explain_interval_seconds:
+            return False
+
+        self._explained_at[fingerprint] = now
+        return True
+
+    async def log_with_plan(
+            self,
+            statement: str,
+            parameters: Any,
+            fingerprint: str,
+            normalized: str,
+            elapsed: float
+    ) -> None:
+        plan = await self.get_plan(statement=statement, parameters=parameters)
+        logger.warning(
+            "Slow query %s took %.3fs: %s\n%s",
+            fingerprint,
+            elapsed,
+            normalized,
+            plan or "План запроса недоступен"
+        )
+
+    async def get_plan(self, statement: str, parameters: Any) -> Optional[str]:
+        prefix = "EXPLAIN" if self.async_engine.dialect.name == "postgresql" else "EXPLAIN QUERY PLAN"
+
+        try:
+            async with self.async_engine.connect() as connection:
+                result = await connection.exec_driver_sql(f"{prefix} {statement}", parameters)
+                rows = result.fetchall()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("Failed to explain slow query", exc_info=True)
+            return None
+
+        return "\n".join(" ".join(str(value) for value in row) for row in rows)
@@ -0,0 +1,26 @@
+import base64
+import binascii
+import json
+from typing import Any, List
+
+from src.domain.pagination.exceptions import InvalidCursorException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding)
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursorException()
+
+    if not isinstance(values, list):
+        raise InvalidCursorException()
+
+    return values
@@ -0,0 +1,28 @@
+import json
+from typing import Any, Union
+
+from pydantic_core import to_jsonable_python
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=to_jsonable_python)
+
+    return json.dumps(
+        value,
+        default=to_jsonable_python,
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+
+    return json.loads(raw)
@@ -1,11 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database.routing import pin_primary
+
 
 class SQLAlchemyUoW:
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def __aenter__(self):
+        pin_primary(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
 
 @dataclass
@@ -14,6 +14,8 @@ class AuthorEntity:
     death_date: Optional[date]
     country: Optional[str]
     photo_url: Optional[str]
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
 
 @dataclass
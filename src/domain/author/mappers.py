@@ -13,5 +13,7 @@ class AuthorSchemaMapper(EntityToSchemaMapper[AuthorEntity, AuthorResponse]):
             birth_date=entity.birth_date,
             death_date=entity.death_date,
             country=entity.country,
-            photo_url=entity.photo_url
+            photo_url=entity.photo_url,
+            version=entity.version,
+            updated_at=entity.updated_at
         )
\ No newline at end of file
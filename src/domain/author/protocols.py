@@ -1,8 +1,9 @@
-from typing import Protocol, Optional
+from typing import Protocol, Optional, Set
 from uuid import UUID
 
 from fastapi import UploadFile
 
+from src.adapters.responses import EncodedResponse
 from src.adapters.schemas.requests.author import AuthorCreateRequest
 from src.adapters.schemas.responses.author import AuthorResponse
 from src.domain.author.entities import AuthorCreateEntity, AuthorEntity
@@ -12,8 +13,9 @@ class AuthorRepositoryProtocol(Protocol):
     async def create(self, entity: AuthorCreateEntity) -> AuthorEntity: ...
     async def find_by_slug(self, slug: str) -> Optional[AuthorEntity]: ...
     async def find_by_id(self, model_id: UUID) -> Optional[AuthorEntity]: ...
-    async def delete_by_id(self, model_id: UUID) -> bool: ...
+    async def delete_by_id(self, model_id: UUID) -> Optional[str]: ...
     async def update_photo_url(self, model_id: UUID, photo_url: str) -> AuthorEntity: ...
+    async def find_existing_ids(self, ids: Set[UUID]) -> Set[UUID]: ...
 
 
 class CreateAuthorUseCaseProtocol(Protocol):
@@ -21,7 +23,7 @@ class CreateAuthorUseCaseProtocol(Protocol):
 
 
 class FindAuthorUseCaseProtocol(Protocol):
-    async def execute(self, slug: str) -> AuthorResponse: ...
+    async def execute(self, slug: str) -> EncodedResponse: ...
 
 
 class DeleteAuthorUseCaseProtocol(Protocol):
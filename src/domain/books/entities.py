@@ -1,8 +1,16 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Union, List
 from uuid import UUID
 
-from src.domain.books.enums import Genre, BookReadingStatus
+from src.domain.books.enums import Genre, BookReadingStatus, BookSortField
+
+
+@dataclass
+class BookRatingEntity:
+    count: int = 0
+    total: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0, 0, 0, 0, 0])
 
 
 @dataclass
@@ -17,6 +25,9 @@ class BookEntity:
     publish_year: Optional[int] = None
     page_count: Optional[int] = None
     author_id: Optional[UUID] = None
+    rating: BookRatingEntity = field(default_factory=BookRatingEntity)
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
 
 @dataclass
@@ -52,6 +63,9 @@ class BookFilterEntity:
     year_to: Optional[int] = None
     pages_from: Optional[int] = None
     pages_to: Optional[int] = None
+    sort: BookSortField = BookSortField.TITLE
+    after_value: Optional[Union[str, int]] = None
+    after_id: Optional[UUID] = None
 
 
 @dataclass
@@ -12,4 +12,14 @@ class Genre(str, Enum):
 class BookReadingStatus(str, Enum):
     NOT_STARTED = "not_started"
     READING = "reading"
-    FINISHED = "finished"
\ No newline at end of file
+    FINISHED = "finished"
+
+
+class BookSortField(str, Enum):
+    TITLE = "title"
+    PUBLISH_YEAR = "publish_year"
+
+
+class BookFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
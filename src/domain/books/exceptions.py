@@ -7,6 +7,15 @@ class BookAlreadyExistException(BaseException):
         self.message = message
 
 
+class BookBulkCreateException(BaseException):
+    def __init__(
+            self,
+            message: str = "Не удалось сохранить пачку книг"
+    ):
+        super().__init__(message)
+        self.message = message
+
+
 class BookNotExistException(BaseException):
     def __init__(
             self,
@@ -1,6 +1,6 @@
-from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse
+from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse, BookRatingResponse
 from src.core.mappers import EntityToSchemaMapper
-from src.domain.books.entities import BookEntity, FavouriteBookEntity
+from src.domain.books.entities import BookEntity, FavouriteBookEntity, BookRatingEntity
 
 
 class BookSchemaMapper(EntityToSchemaMapper[BookEntity, BookResponse]):
@@ -15,7 +15,21 @@ class BookSchemaMapper(EntityToSchemaMapper[BookEntity, BookResponse]):
             publish_year=entity.publish_year,
             page_count=entity.page_count,
             author_id=entity.author_id,
-            genre=entity.genre
+            genre=entity.genre,
+            rating=self.build_rating(entity=entity.rating),
+            version=entity.version,
+            updated_at=entity.updated_at
+        )
+
+    @staticmethod
+    def build_rating(entity: BookRatingEntity) -> BookRatingResponse:
+        return BookRatingResponse(
+            average=round(entity.total / entity.count, 2) if entity.count else None,
+            count=entity.count,
+            histogram={
+                stars: count
+                for stars, count in enumerate(entity.histogram, start=1)
+            }
         )
 
 
@@ -1,21 +1,34 @@
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Set, TextIO, AsyncIterator
 from uuid import UUID
 
-from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery
-from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse
+from src.adapters.responses import EncodedResponse
+from src.adapters.schemas.requests.books import BookCreateRequest, BookUpdateRequest, BooksQuery, BooksExportQuery
+from src.adapters.schemas.responses.books import BookResponse, FavouriteBookResponse, BookImportResponse
 from src.domain.books.entities import BookCreateEntity, BookEntity, BookUpdateEntity, BookFilterEntity, \
     FavouriteBookEntity
-from src.domain.books.enums import BookReadingStatus
+from src.domain.books.enums import BookReadingStatus, BookFileFormat
 
 
 class BookRepositoryProtocol(Protocol):
     async def create(self, entity: BookCreateEntity) -> BookEntity: ...
+    async def bulk_create(self, entities: List[BookCreateEntity]) -> Set[str]: ...
     async def find_by_slug(self, slug: str) -> Optional[BookEntity]: ...
     async def find_by_id(self, book_id: UUID) -> Optional[BookEntity]: ...
     async def find_all(self, filters: BookFilterEntity) -> List[BookEntity]: ...
-    async def delete_by_id(self, model_id: UUID) -> bool: ...
+    def stream_all(self, filters: BookFilterEntity, batch_size: int) -> AsyncIterator[BookEntity]: ...
+    async def delete_by_id(self, model_id: UUID) -> Optional[str]: ...
+    async def detach_author(self, author_id: UUID) -> List[str]: ...
     async def update(self, entity: BookUpdateEntity) -> Optional[BookEntity]: ...
 
+    async def update_rating_stats(
+            self,
+            book_id: UUID,
+            added_rating: Optional[int] = None,
+            removed_rating: Optional[int] = None
+    ) -> None: ...
+
+    async def recalculate_rating_stats(self, book_id: Optional[UUID] = None) -> int: ...
+
 
 class FavouriteBookRepositoryProtocol(Protocol):
     async def add(self, user_id: UUID, book_id: UUID) -> FavouriteBookEntity: ...
@@ -33,12 +46,20 @@ class CreateBookUseCaseProtocol(Protocol):
     async def execute(self, data: BookCreateRequest) -> BookResponse: ...
 
 
+class ImportBooksUseCaseProtocol(Protocol):
+    async def execute(self, stream: TextIO, fmt: BookFileFormat) -> BookImportResponse: ...
+
+
+class ExportBooksUseCaseProtocol(Protocol):
+    def execute(self, filters: BooksExportQuery) -> AsyncIterator[str]: ...
+
+
 class GetBooksUseCaseProtocol(Protocol):
-    async def execute(self, filters: BooksQuery) -> List[BookResponse]: ...
+    async def execute(self, filters: BooksQuery) -> EncodedResponse: ...
 
 
 class FindBookBySlugUseCaseProtocol(Protocol):
-    async def execute(self, slug: str) -> BookResponse: ...
+    async def execute(self, slug: str) -> EncodedResponse: ...
 
 
 class DeleteBookUseCaseProtocol(Protocol):
@@ -1,4 +1,6 @@
-from typing import Protocol, Optional, Any
+from typing import Protocol, Optional, Any, Type, TypeVar, Callable, Awaitable, Sequence
+
+T = TypeVar("T")
 
 
 class CacheManagerProtocol(Protocol):
@@ -19,4 +21,26 @@ class CacheManagerProtocol(Protocol):
             key: str,
             value: Any,
             ttl: int
-    ) -> None: ...
\ No newline at end of file
+    ) -> None: ...
+
+    async def get_model(self, key: str, schema: Type[T]) -> Optional[T]: ...
+
+    async def set_model(
+            self,
+            key: str,
+            value: T,
+            ttl: int
+    ) -> None: ...
+
+    async def get_or_load(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int = 0,
+            tags: Sequence[str] = (),
+            refresh_loader: Optional[Callable[[], Awaitable[T]]] = None
+    ) -> T: ...
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None: ...
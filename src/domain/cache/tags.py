@@ -0,0 +1,9 @@
+BOOKS_LIST_TAG = "books:list"
+
+
+def get_book_tag(slug: str) -> str:
+    return f"book:{slug}"
+
+
+def get_author_tag(slug: str) -> str:
+    return f"author:{slug}"
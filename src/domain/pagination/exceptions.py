@@ -0,0 +1,7 @@
+class InvalidCursorException(Exception):
+    def __init__(
+            self,
+            message: str = "Невалидный курсор пагинации"
+    ):
+        super().__init__(message)
+        self.message = message
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from src.domain.books.entities import BookEntity
+from src.domain.reviews.enums import ReviewSortField
 
 
 @dataclass
@@ -29,3 +31,23 @@ class ReviewUpdateEntity:
     rating: int
     user_id: UUID
     book_id: UUID
+
+
+@dataclass
+class ReviewItemEntity:
+    id: UUID
+    created_at: datetime
+    review: str
+    rating: int
+    full_name: str
+    version: int = 1
+
+
+@dataclass
+class ReviewFilterEntity:
+    book_id: UUID
+    limit: int
+    sort: ReviewSortField = ReviewSortField.NEWEST
+    after_rating: Optional[int] = None
+    after_created_at: Optional[datetime] = None
+    after_id: Optional[UUID] = None
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ReviewSortField(str, Enum):
+    NEWEST = "newest"
+    OLDEST = "oldest"
+    RATING_DESC = "rating_desc"
+    RATING_ASC = "rating_asc"
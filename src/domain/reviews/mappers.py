@@ -1,7 +1,7 @@
-from src.adapters.schemas.responses.reviews import ReviewResponse
+from src.adapters.schemas.responses.reviews import ReviewResponse, ReviewItemResponse
 from src.core.mappers import EntityToSchemaMapper
 from src.domain.books.mappers import BookSchemaMapper
-from src.domain.reviews.entities import ReviewEntity
+from src.domain.reviews.entities import ReviewEntity, ReviewItemEntity
 
 
 class ReviewSchemaMapper(EntityToSchemaMapper[ReviewEntity, ReviewResponse]):
@@ -19,4 +19,16 @@ class ReviewSchemaMapper(EntityToSchemaMapper[ReviewEntity, ReviewResponse]):
             rating=entity.rating,
             book=self.mapper.from_entity_to_schema(entity=entity.book),
             created_at=entity.created_at
-        )
\ No newline at end of file
+        )
+
+
+class ReviewItemSchemaMapper(EntityToSchemaMapper[ReviewItemEntity, ReviewItemResponse]):
+    def from_entity_to_schema(self, entity: ReviewItemEntity) -> ReviewItemResponse:
+        return ReviewItemResponse(
+            id=entity.id,
+            full_name=entity.full_name,
+            review=entity.review,
+            rating=entity.rating,
+            created_at=entity.created_at,
+            version=entity.version
+        )
@@ -1,16 +1,17 @@
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Tuple
 from uuid import UUID
 
-from src.adapters.schemas.requests.reviews import ReviewRequest
-from src.adapters.schemas.responses.reviews import ReviewResponse
-from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity
+from src.adapters.schemas.requests.reviews import ReviewRequest, ReviewsQuery
+from src.adapters.schemas.responses.reviews import ReviewResponse, ReviewPageResponse
+from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity, ReviewFilterEntity, \
+    ReviewItemEntity
 
 
 class ReviewRepositoryProtocol(Protocol):
     async def create(self, entity: ReviewCreateEntity) -> ReviewEntity: ...
-    async def find_all_by_book_id(self, book_id: UUID) -> List[ReviewEntity]: ...
-    async def update(self, entity: ReviewUpdateEntity) -> Optional[ReviewEntity]: ...
-    async def delete_by_id(self, user_id: UUID, book_id: UUID) -> bool: ...
+    async def find_page(self, filters: ReviewFilterEntity) -> List[ReviewItemEntity]: ...
+    async def update(self, entity: ReviewUpdateEntity) -> Optional[Tuple[ReviewEntity, int]]: ...
+    async def delete_by_id(self, user_id: UUID, book_id: UUID) -> Optional[int]: ...
 
 
 class CreateReviewUseCaseProtocol(Protocol):
@@ -23,7 +24,7 @@ class CreateReviewUseCaseProtocol(Protocol):
 
 
 class FindReviewsUseCaseProtocol(Protocol):
-    async def execute(self, slug: str) -> List[ReviewResponse]: ...
+    async def execute(self, slug: str, filters: ReviewsQuery) -> ReviewPageResponse: ...
 
 
 class UpdateReviewUseCaseProtocol(Protocol):
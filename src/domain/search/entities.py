@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.search.enums import SearchTarget, SearchResultKind
+
+
+@dataclass
+class SearchFilterEntity:
+    query: str
+    target: SearchTarget = SearchTarget.ALL
+    limit: int = 20
+    offset: int = 0
+
+
+@dataclass
+class SearchResultEntity:
+    id: UUID
+    kind: SearchResultKind
+    title: str
+    slug: str
+    rank: float
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class SearchTarget(str, Enum):
+    ALL = "all"
+    BOOKS = "books"
+    AUTHORS = "authors"
+
+
+class SearchResultKind(str, Enum):
+    BOOK = "book"
+    AUTHOR = "author"
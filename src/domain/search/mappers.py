@@ -0,0 +1,14 @@
+from src.adapters.schemas.responses.search import SearchResultResponse
+from src.core.mappers import EntityToSchemaMapper
+from src.domain.search.entities import SearchResultEntity
+
+
+class SearchResultSchemaMapper(EntityToSchemaMapper[SearchResultEntity, SearchResultResponse]):
+    def from_entity_to_schema(self, entity: SearchResultEntity) -> SearchResultResponse:
+        return SearchResultResponse(
+            id=entity.id,
+            kind=entity.kind,
+            title=entity.title,
+            slug=entity.slug,
+            rank=entity.rank
+        )
@@ -0,0 +1,13 @@
+from typing import Protocol, List
+
+from src.adapters.schemas.requests.search import SearchQuery
+from src.adapters.schemas.responses.search import SearchPageResponse
+from src.domain.search.entities import SearchFilterEntity, SearchResultEntity
+
+
+class SearchRepositoryProtocol(Protocol):
+    async def search(self, filters: SearchFilterEntity) -> List[SearchResultEntity]: ...
+
+
+class SearchUseCaseProtocol(Protocol):
+    async def execute(self, query: SearchQuery) -> SearchPageResponse: ...
@@ -0,0 +1,7 @@
+class PasswordHasherBusyException(Exception):
+    def __init__(
+            self,
+            message: str = "Сервис авторизации перегружен, повторите попытку позже"
+    ):
+        super().__init__(message)
+        self.message = message
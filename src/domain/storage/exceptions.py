@@ -40,4 +40,13 @@ class MinioFileDeleteException(Exception):
             message: str = "Ошибка при удалении изображения"
     ):
         super().__init__(message)
-        self.message = message
\ No newline at end of file
+        self.message = message
+
+
+class MinioFileTooLargeException(Exception):
+    def __init__(
+            self,
+            message: str = "Размер файла превышает допустимый"
+    ):
+        super().__init__(message)
+        self.message = message
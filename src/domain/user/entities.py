@@ -14,6 +14,15 @@ class UserEntity:
     role: UserRole
 
 
+@dataclass
+class UserProfileEntity:
+    id: UUID
+    email: str
+    first_name: str
+    last_name: str
+    role: UserRole
+
+
 @dataclass
 class UserCreateEntity:
     email: str
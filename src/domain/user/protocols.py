@@ -3,13 +3,14 @@ from uuid import UUID
 
 from src.adapters.schemas.requests.user import RegisterRequest, LogInRequest
 from src.adapters.schemas.responses.user import UserResponse, TokenResponse
-from src.domain.user.entities import UserEntity, UserCreateEntity
+from src.domain.user.entities import UserEntity, UserCreateEntity, UserProfileEntity
 
 
 class UserRepositoryProtocol(Protocol):
     async def find_by_email(self, email: str) -> Optional[UserEntity]: ...
     async def create(self, entity: UserCreateEntity) -> UserEntity: ...
     async def find_by_id(self, model_id: UUID) -> Optional[UserEntity]: ...
+    async def find_profile_by_id(self, model_id: UUID) -> Optional[UserProfileEntity]: ...
 
 
 class RegisterUseCaseProtocol(Protocol):
@@ -5,7 +5,10 @@ import redis.asyncio as redis
 
 from src.core.observability.metrics import REDIS_OPERATION_SECONDS
 from src.domain.cache.protocols import CacheManagerProtocol
-from src.infrastructure.cache.manager import RedisCacheManager
+from src.infrastructure.cache.invalidation import CacheInvalidationListener
+from src.infrastructure.cache.local import LocalCache
+from src.infrastructure.cache.manager import RedisCacheManager, TwoTierCacheManager
+from src.infrastructure.cache.singleflight import SingleFlight
 
 
 class InstrumentedRedis:
@@ -31,9 +34,36 @@ class InstrumentedRedis:
 
 
 redis_url = settings.REDIS_URL
-redis_client = redis.from_url(redis_url, decode_responses=True)
-redis_client = InstrumentedRedis(redis_client)
+redis_connection = redis.from_url(redis_url, decode_responses=True)
+redis_client = InstrumentedRedis(redis_connection)
 
+local_cache = LocalCache(
+    max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+    max_bytes=settings.CACHE_LOCAL_MAX_BYTES
+)
 
-async def get_redis_cache_manager() -> CacheManagerProtocol:
-    return RedisCacheManager(redis_client)
\ No newline at end of file
+token_cache = LocalCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_LOCAL_MAX_BYTES
+)
+
+single_flight = SingleFlight()
+
+cache_invalidation_listener = CacheInvalidationListener(
+    redis_client=redis_connection,
+    local_cache=local_cache,
+    channel=settings.CACHE_INVALIDATION_CHANNEL
+)
+
+
+async def get_cache_manager() -> CacheManagerProtocol:
+    return TwoTierCacheManager(
+        redis_manager=RedisCacheManager(redis_client),
+        local_cache=local_cache,
+        single_flight=single_flight,
+        local_ttl=settings.CACHE_LOCAL_TTL_SECONDS,
+        invalidation_channel=settings.CACHE_INVALIDATION_CHANNEL,
+        lock_ttl=settings.CACHE_LOCK_TTL_SECONDS,
+        lock_wait_seconds=settings.CACHE_LOCK_WAIT_SECONDS,
+        xfetch_beta=settings.CACHE_XFETCH_BETA
+    )
\ No newline at end of file
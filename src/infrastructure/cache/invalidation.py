@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from src.infrastructure.cache.local import LocalCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationListener:
+    def __init__(
+            self,
+            redis_client: redis.Redis,
+            local_cache: LocalCache,
+            channel: str,
+            retry_delay_seconds: float = 1.0
+    ):
+        self.redis_client = redis_client
+        self.local_cache = local_cache
+        self.channel = channel
+        self.retry_delay_seconds = retry_delay_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def listen(self) -> None:
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+
+            try:
+                await pubsub.subscribe(self.channel)
+                # Invalidations published while we were not subscribed are lost.
+                self.local_cache.clear()
+
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.local_cache.delete(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cache invalidation subscription failed, retrying", exc_info=True)
+                self.local_cache.clear()
+                await asyncio.sleep(self.retry_delay_seconds)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
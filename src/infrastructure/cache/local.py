@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class LocalCacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class LocalCache:
+    def __init__(
+            self,
+            max_entries: int,
+            max_bytes: int
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, LocalCacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(
+            self,
+            key: str,
+            value: Any,
+            size: int,
+            ttl: float
+    ) -> None:
+        self.delete(key)
+
+        if ttl <= 0 or size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        self._entries[key] = LocalCacheEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + ttl
+        )
+        self.current_bytes += size
+
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
@@ -1,11 +1,65 @@
-import json
-from json import JSONDecodeError
-from typing import Optional, Any
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from functools import lru_cache
+from typing import Optional, Any, Type, TypeVar, Callable, Awaitable, Generic, Set, Union, Sequence, List
 
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.core.observability.metrics import CACHE_LOCAL_REQUESTS, CACHE_REFRESHES
+from src.core.serialization import dumps, loads
 from src.domain.cache.protocols import CacheManagerProtocol
+from src.infrastructure.cache.local import LocalCache
+from src.infrastructure.cache.singleflight import SingleFlight
 
 import redis.asyncio as redis
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+background_tasks: Set[asyncio.Task] = set()
+
+
+class CacheEntry(BaseModel, Generic[T]):
+    value: T
+    expires_at: float
+    delta: float = 0.0
+
+
+@lru_cache(maxsize=None)
+def get_entry_adapter(schema: Type[T]) -> TypeAdapter:
+    return TypeAdapter(CacheEntry[schema])
+
+
+def get_tag_key(tag: str) -> str:
+    return f"cache:tag:{tag}"
+
+
+def build_tagged_key(key: str, versions: Sequence[int]) -> str:
+    if not versions:
+        return key
+
+    return f"{key}@{'.'.join(map(str, versions))}"
+
+
+def build_entry(value: T, ttl: int, delta: float = 0.0) -> CacheEntry[T]:
+    return CacheEntry[type(value)].model_construct(
+        value=value,
+        expires_at=time.time() + ttl,
+        delta=delta
+    )
+
 
 class RedisCacheManager(CacheManagerProtocol):
     def __init__(self, redis_client: redis.Redis):
@@ -20,7 +74,7 @@ class RedisCacheManager(CacheManagerProtocol):
     async def set(
             self,
             key: str,
-            value: str,
+            value: Union[str, bytes],
             ttl: int
     ) -> None:
         if ttl <= 0:
@@ -44,8 +98,8 @@ class RedisCacheManager(CacheManagerProtocol):
             return None
 
         try:
-            return json.loads(raw)
-        except JSONDecodeError:
+            return loads(raw)
+        except ValueError:
             await self.delete(key)
             return None
 
@@ -59,8 +113,408 @@ class RedisCacheManager(CacheManagerProtocol):
             return
 
         try:
-            raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            raw = dumps(value)
         except Exception:
             return
 
-        await self.set(key, raw, ttl)
\ No newline at end of file
+        await self.set(key, raw, ttl)
+
+    async def get_entry(self, key: str, schema: Type[T]) -> Optional[CacheEntry[T]]:
+        raw = await self.get(key)
+
+        if raw is None:
+            return None
+
+        try:
+            return get_entry_adapter(schema).validate_json(raw)
+        except ValidationError:
+            await self.delete(key)
+            return None
+
+    async def set_entry(
+            self,
+            key: str,
+            entry: CacheEntry[T],
+            ttl: int
+    ) -> int:
+        raw = entry.model_dump_json()
+        await self.set(key, raw, ttl)
+
+        return len(raw)
+
+    async def get_model(self, key: str, schema: Type[T]) -> Optional[T]:
+        entry = await self.get_entry(key, schema)
+        return entry.value if entry is not None else None
+
+    async def set_model(
+            self,
+            key: str,
+            value: T,
+            ttl: int
+    ) -> None:
+        if ttl <= 0:
+            return
+
+        await self.set_entry(key, build_entry(value=value, ttl=ttl), ttl)
+
+    async def get_or_load(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int = 0,
+            tags: Sequence[str] = (),
+            refresh_loader: Optional[Callable[[], Awaitable[T]]] = None
+    ) -> T:
+        if tags:
+            versions = await self.get_tag_versions(tags)
+
+            if versions is None:
+                return await loader()
+
+            key = build_tagged_key(key, versions)
+
+        cached = await self.get_model(key, schema)
+
+        if cached is not None:
+            return cached
+
+        value = await loader()
+        await self.set_model(key, value, ttl)
+
+        return value
+
+    async def get_tag_versions(self, tags: Sequence[str]) -> Optional[List[int]]:
+        try:
+            values = await self.redis_client.mget([get_tag_key(tag) for tag in tags])
+        except Exception:
+            return None
+
+        return [int(value or 0) for value in values]
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            try:
+                await self.redis_client.incr(get_tag_key(tag))
+            except Exception:
+                pass
+
+    async def acquire_lock(self, key: str, token: str, ttl: int) -> bool:
+        try:
+            return bool(await self.redis_client.set(key, token, nx=True, ex=ttl))
+        except Exception:
+            return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        try:
+            await self.redis_client.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+        except Exception:
+            pass
+
+
+class TwoTierCacheManager(CacheManagerProtocol):
+    def __init__(
+            self,
+            redis_manager: RedisCacheManager,
+            local_cache: LocalCache,
+            single_flight: SingleFlight,
+            local_ttl: int,
+            invalidation_channel: str,
+            lock_ttl: int,
+            lock_wait_seconds: float,
+            lock_poll_interval_seconds: float = 0.05,
+            xfetch_beta: float = 1.0
+    ):
+        self.redis_manager = redis_manager
+        self.local_cache = local_cache
+        self.single_flight = single_flight
+        self.local_ttl = local_ttl
+        self.invalidation_channel = invalidation_channel
+        self.lock_ttl = lock_ttl
+        self.lock_wait_seconds = lock_wait_seconds
+        self.lock_poll_interval_seconds = lock_poll_interval_seconds
+        self.xfetch_beta = xfetch_beta
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.redis_manager.get(key)
+
+    async def set(
+            self,
+            key: str,
+            value: str,
+            ttl: int
+    ) -> None:
+        await self.redis_manager.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.local_cache.delete(key)
+        await self.redis_manager.delete(key)
+
+        try:
+            await self.redis_manager.redis_client.publish(self.invalidation_channel, key)
+        except Exception:
+            pass
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        return await self.redis_manager.get_json(key)
+
+    async def set_json(
+            self,
+            key: str,
+            value: Any,
+            ttl: int
+    ) -> None:
+        await self.redis_manager.set_json(key, value, ttl)
+
+    async def get_entry(self, key: str, schema: Type[T]) -> Optional[CacheEntry[T]]:
+        entry = self.local_cache.get(key)
+
+        if isinstance(entry, CacheEntry) and isinstance(entry.value, schema):
+            CACHE_LOCAL_REQUESTS.labels(result="hit").inc()
+            return entry
+
+        CACHE_LOCAL_REQUESTS.labels(result="miss").inc()
+        raw = await self.redis_manager.get(key)
+
+        if raw is None:
+            return None
+
+        try:
+            entry = get_entry_adapter(schema).validate_json(raw)
+        except ValidationError:
+            await self.redis_manager.delete(key)
+            return None
+
+        self.local_cache.set(key, entry, size=len(raw), ttl=self.local_ttl)
+        return entry
+
+    async def set_entry(
+            self,
+            key: str,
+            entry: CacheEntry[T],
+            ttl: int
+    ) -> None:
+        size = await self.redis_manager.set_entry(key, entry, ttl)
+        self.local_cache.set(key, entry, size=size, ttl=min(ttl, self.local_ttl))
+
+    async def get_model(self, key: str, schema: Type[T]) -> Optional[T]:
+        entry = await self.get_entry(key, schema)
+        return entry.value if entry is not None else None
+
+    async def set_model(
+            self,
+            key: str,
+            value: T,
+            ttl: int
+    ) -> None:
+        if ttl <= 0:
+            return
+
+        await self.set_entry(key, build_entry(value=value, ttl=ttl), ttl)
+
+    async def get_or_load(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int = 0,
+            tags: Sequence[str] = (),
+            refresh_loader: Optional[Callable[[], Awaitable[T]]] = None
+    ) -> T:
+        if tags:
+            versions = await self.get_tag_versions(tags)
+
+            if versions is None:
+                return await loader()
+
+            key = build_tagged_key(key, versions)
+
+        entry = await self.get_entry(key, schema)
+
+        if entry is not None:
+            if not self.should_refresh(entry):
+                return entry.value
+
+            if refresh_loader is not None:
+                self.refresh_in_background(
+                    key=key,
+                    schema=schema,
+                    loader=refresh_loader,
+                    ttl=ttl,
+                    stale_ttl=stale_ttl,
+                    expires_at=entry.expires_at
+                )
+            elif entry.expires_at <= time.time():
+                return await self.single_flight.do(
+                    f"{key}#refresh",
+                    lambda: self.store(key=key, loader=loader, ttl=ttl, stale_ttl=stale_ttl)
+                )
+
+            return entry.value
+
+        return await self.single_flight.do(
+            key,
+            lambda: self.load(
+                key=key,
+                schema=schema,
+                loader=loader,
+                ttl=ttl,
+                stale_ttl=stale_ttl
+            )
+        )
+
+    async def get_tag_versions(self, tags: Sequence[str]) -> Optional[List[int]]:
+        keys = [get_tag_key(tag) for tag in tags]
+        versions = [self.local_cache.get(key) for key in keys]
+        missing = [index for index, version in enumerate(versions) if version is None]
+
+        if missing:
+            loaded = await self.redis_manager.get_tag_versions([tags[index] for index in missing])
+
+            if loaded is None:
+                return None
+
+            for index, version in zip(missing, loaded):
+                versions[index] = version
+                self.local_cache.set(keys[index], version, size=len(keys[index]), ttl=self.local_ttl)
+
+        return versions
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        await self.redis_manager.invalidate_tags(tags)
+
+        for tag in tags:
+            key = get_tag_key(tag)
+            self.local_cache.delete(key)
+
+            try:
+                await self.redis_manager.redis_client.publish(self.invalidation_channel, key)
+            except Exception:
+                pass
+
+    def should_refresh(self, entry: CacheEntry) -> bool:
+        now = time.time()
+
+        if entry.expires_at <= now:
+            return True
+
+        jitter = -entry.delta * self.xfetch_beta * math.log(1.0 - random.random())
+        return now + jitter >= entry.expires_at
+
+    def refresh_in_background(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int,
+            expires_at: float
+    ) -> None:
+        task = asyncio.create_task(self.single_flight.do(
+            f"{key}#refresh",
+            lambda: self.refresh(
+                key=key,
+                schema=schema,
+                loader=loader,
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                expires_at=expires_at
+            )
+        ))
+
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+    async def refresh(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int,
+            expires_at: float
+    ) -> None:
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+
+        if not await self.redis_manager.acquire_lock(lock_key, token, self.lock_ttl):
+            return
+
+        try:
+            entry = await self.redis_manager.get_entry(key, schema)
+
+            if entry is not None and entry.expires_at > expires_at:
+                self.local_cache.delete(key)
+                return
+
+            await self.store(key=key, loader=loader, ttl=ttl, stale_ttl=stale_ttl)
+            CACHE_REFRESHES.labels(status="ok").inc()
+        except Exception:
+            CACHE_REFRESHES.labels(status="error").inc()
+            logger.warning("Background refresh of %s failed", key, exc_info=True)
+        finally:
+            await self.redis_manager.release_lock(lock_key, token)
+
+    async def load(
+            self,
+            key: str,
+            schema: Type[T],
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int
+    ) -> T:
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+
+        acquired = await self.redis_manager.acquire_lock(lock_key, token, self.lock_ttl)
+
+        if not acquired:
+            cached = await self.wait_for(key=key, schema=schema)
+
+            if cached is not None:
+                return cached
+
+        try:
+            entry = await self.redis_manager.get_entry(key, schema)
+
+            if entry is not None:
+                return entry.value
+
+            return await self.store(key=key, loader=loader, ttl=ttl, stale_ttl=stale_ttl)
+        finally:
+            if acquired:
+                await self.redis_manager.release_lock(lock_key, token)
+
+    async def store(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[T]],
+            ttl: int,
+            stale_ttl: int
+    ) -> T:
+        start = time.perf_counter()
+        value = await loader()
+        delta = time.perf_counter() - start
+
+        if ttl > 0:
+            await self.set_entry(
+                key,
+                build_entry(value=value, ttl=ttl, delta=delta),
+                ttl + max(stale_ttl, 0)
+            )
+
+        return value
+
+    async def wait_for(self, key: str, schema: Type[T]) -> Optional[T]:
+        deadline = time.monotonic() + self.lock_wait_seconds
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.lock_poll_interval_seconds)
+            cached = await self.get_model(key, schema)
+
+            if cached is not None:
+                return cached
+
+        return None
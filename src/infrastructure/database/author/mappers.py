@@ -13,5 +13,7 @@ class AuthorModelMapper(ModelToEntityMapper[AuthorModel, AuthorEntity]):
             birth_date=model.birth_date,
             death_date=model.death_date,
             country=model.country,
-            photo_url=model.photo_url
+            photo_url=model.photo_url,
+            version=model.version,
+            updated_at=model.updated_at
         )
\ No newline at end of file
@@ -1,13 +1,14 @@
 from typing import Optional
 
-from sqlalchemy import String, Text, Date
+from sqlalchemy import String, Text, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import date
 
-from src.core.database.models import SQLBaseModel
+from src.core.database.models import SQLBaseModel, VersionedModelMixin
+from src.infrastructure.database.search.expressions import search_vector
 
 
-class AuthorModel(SQLBaseModel):
+class AuthorModel(VersionedModelMixin, SQLBaseModel):
     __tablename__ = "authors"
 
     name: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
@@ -17,3 +18,14 @@ class AuthorModel(SQLBaseModel):
     death_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     country: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     photo_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+
+AUTHOR_SEARCH_VECTOR = search_vector((AuthorModel.name, "A"))
+
+Index("ix_authors_search_vector", AUTHOR_SEARCH_VECTOR, postgresql_using="gin").ddl_if(dialect="postgresql")
+Index(
+    "ix_authors_name_trgm",
+    AuthorModel.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
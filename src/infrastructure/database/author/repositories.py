@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Set
 from uuid import UUID
 
 from sqlalchemy import select, delete, update
@@ -70,14 +70,15 @@ class AuthorRepository(AuthorRepositoryProtocol):
 
         return self.mapper.from_model_to_entity(model=model)
 
-    async def delete_by_id(self, model_id: UUID) -> bool:
+    async def delete_by_id(self, model_id: UUID) -> Optional[str]:
         statement = (
             delete(self.model)
             .where(self.model.id == model_id)
+            .returning(self.model.slug)
         )
 
         result = await self.session.execute(statement)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
 
     async def update_photo_url(self, model_id: UUID, photo_url: str) -> AuthorEntity:
         statement = (
@@ -90,3 +91,14 @@ class AuthorRepository(AuthorRepositoryProtocol):
         result = await self.session.execute(statement)
         return self.mapper.from_model_to_entity(result.scalar_one())
 
+    async def find_existing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        if not ids:
+            return set()
+
+        statement = (
+            select(self.model.id)
+            .where(self.model.id.in_(ids))
+        )
+
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
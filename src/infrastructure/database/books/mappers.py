@@ -1,5 +1,5 @@
 from src.core.mappers import ModelToEntityMapper
-from src.domain.books.entities import BookEntity, FavouriteBookEntity
+from src.domain.books.entities import BookEntity, FavouriteBookEntity, BookRatingEntity
 from src.infrastructure.database.books.models import BookModel, FavouriteBookModel
 
 
@@ -15,7 +15,20 @@ class BookModelMapper(ModelToEntityMapper[BookModel, BookEntity]):
             publish_year=model.publish_year,
             page_count=model.page_count,
             author_id=model.author_id,
-            genre=model.genre
+            genre=model.genre,
+            rating=BookRatingEntity(
+                count=model.rating_count,
+                total=model.rating_sum,
+                histogram=[
+                    model.rating_1,
+                    model.rating_2,
+                    model.rating_3,
+                    model.rating_4,
+                    model.rating_5
+                ]
+            ),
+            version=model.version,
+            updated_at=model.updated_at
         )
 
 
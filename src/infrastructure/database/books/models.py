@@ -1,14 +1,15 @@
 import uuid
 from typing import Optional
 
-from sqlalchemy import String, Enum, Text, Integer, UUID, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Enum, Text, Integer, UUID, ForeignKey, UniqueConstraint, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database.models import SQLBaseModel
+from src.core.database.models import SQLBaseModel, VersionedModelMixin
 from src.domain.books.enums import Genre, BookReadingStatus
+from src.infrastructure.database.search.expressions import search_vector
 
 
-class BookModel(SQLBaseModel):
+class BookModel(VersionedModelMixin, SQLBaseModel):
     __tablename__ = "books"
 
     title: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
@@ -30,9 +31,35 @@ class BookModel(SQLBaseModel):
         index=True
     )
 
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_3: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_4: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_5: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     reviews = relationship("ReviewModel", back_populates="book")
 
 
+Index("ix_books_title_id", BookModel.title, BookModel.id)
+Index("ix_books_publish_year_id", func.coalesce(BookModel.publish_year, 0), BookModel.id)
+
+BOOK_SEARCH_VECTOR = search_vector(
+    (BookModel.title, "A"),
+    (BookModel.short_description, "B"),
+    (BookModel.description, "C")
+)
+
+Index("ix_books_search_vector", BOOK_SEARCH_VECTOR, postgresql_using="gin").ddl_if(dialect="postgresql")
+Index(
+    "ix_books_title_trgm",
+    BookModel.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
+
+
 class FavouriteBookModel(SQLBaseModel):
     __tablename__ = "favourite_books"
 
@@ -1,19 +1,40 @@
-from typing import Optional, List
-from uuid import UUID
-
-from sqlalchemy import select, delete, update, and_
-from sqlalchemy.exc import IntegrityError
+from typing import Optional, List, Set, AsyncIterator
+from uuid import UUID, uuid4
+
+from asyncpg import PostgresError, InterfaceError
+from sqlalchemy import select, delete, update, and_, tuple_, func, Select, CTE, Update, text, table, column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, aliased, contains_eager
+
+from src.core.database.dialect import is_postgresql
 
 from src.domain.books.entities import BookCreateEntity, BookEntity, BookUpdateEntity, BookFilterEntity, \
     FavouriteBookEntity
-from src.domain.books.enums import BookReadingStatus
+from src.domain.books.enums import BookReadingStatus, BookSortField
 from src.domain.books.exceptions import BookAlreadyExistException, FavouriteBookAlreadyExistException, \
-    FavouriteBookRepositoryException
+    FavouriteBookRepositoryException, BookBulkCreateException
 from src.domain.books.protocols import BookRepositoryProtocol, FavouriteBookRepositoryProtocol
 from src.infrastructure.database.books.mappers import BookModelMapper, FavouriteBookModelMapper
 from src.infrastructure.database.books.models import BookModel, FavouriteBookModel
+from src.infrastructure.database.reviews.models import ReviewModel
+
+
+IMPORT_STAGING_TABLE = "books_import_staging"
+IMPORT_COLUMNS = (
+    "id",
+    "title",
+    "slug",
+    "language",
+    "genre",
+    "description",
+    "short_description",
+    "publish_year",
+    "page_count",
+    "author_id"
+)
 
 
 class BookRepository(BookRepositoryProtocol):
@@ -49,6 +70,75 @@ class BookRepository(BookRepositoryProtocol):
 
         return self.mapper.from_model_to_entity(model=model)
 
+    async def bulk_create(self, entities: List[BookCreateEntity]) -> Set[str]:
+        if not entities:
+            return set()
+
+        try:
+            if is_postgresql(self.session):
+                return await self.copy_create(entities=entities)
+
+            statement = (
+                sqlite_insert(self.model)
+                .on_conflict_do_nothing()
+                .returning(self.model.slug)
+            )
+
+            result = await self.session.execute(
+                statement,
+                [self.build_import_row(entity=entity) for entity in entities]
+            )
+            return set(result.scalars().all())
+        except (DBAPIError, PostgresError, InterfaceError):
+            raise BookBulkCreateException()
+
+    async def copy_create(self, entities: List[BookCreateEntity]) -> Set[str]:
+        await self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {IMPORT_STAGING_TABLE} "
+            f"(LIKE {self.model.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            IMPORT_STAGING_TABLE,
+            records=[
+                tuple(self.build_import_row(entity=entity).values())
+                for entity in entities
+            ],
+            columns=IMPORT_COLUMNS
+        )
+
+        staging = table(IMPORT_STAGING_TABLE, *[column(name) for name in IMPORT_COLUMNS])
+        statement = (
+            pg_insert(self.model)
+            .from_select(IMPORT_COLUMNS, select(*staging.c))
+            .on_conflict_do_nothing()
+            .returning(self.model.slug)
+        )
+
+        result = await self.session.execute(statement)
+        slugs = set(result.scalars().all())
+
+        await self.session.execute(text(f"TRUNCATE {IMPORT_STAGING_TABLE}"))
+        return slugs
+
+    @staticmethod
+    def build_import_row(entity: BookCreateEntity) -> dict:
+        return {
+            "id": uuid4(),
+            "title": entity.title,
+            "slug": entity.slug,
+            "language": entity.language,
+            "genre": entity.genre.name,
+            "description": entity.description,
+            "short_description": entity.short_description,
+            "publish_year": entity.publish_year,
+            "page_count": entity.page_count,
+            "author_id": entity.author_id
+        }
+
     async def find_by_id(self, book_id: UUID) -> Optional[BookEntity]:
         statement = (
             select(self.model)
@@ -77,15 +167,54 @@ class BookRepository(BookRepositoryProtocol):
 
         return None
 
+    def get_sort_column(self, sort: BookSortField):
+        if sort == BookSortField.PUBLISH_YEAR:
+            return func.coalesce(self.model.publish_year, 0)
+
+        return self.model.title
+
     async def find_all(self, filters: BookFilterEntity) -> List[BookEntity]:
-        statement = select(self.model)
+        sort_column = self.get_sort_column(sort=filters.sort)
+        statement = (
+            select(self.model)
+            .order_by(sort_column, self.model.id)
+        )
 
-        if filters.genre is not None:
-            statement = statement.where(self.model.genre == filters.genre)
+        if filters.after_id is not None:
+            statement = statement.where(
+                tuple_(sort_column, self.model.id) > (filters.after_value, filters.after_id)
+            )
 
         if filters.limit is not None:
             statement = statement.limit(filters.limit)
 
+        statement = self.apply_filters(statement=statement, filters=filters)
+
+        result = await self.session.execute(statement)
+        models = list(result.scalars().all())
+
+        return [
+            self.mapper.from_model_to_entity(model=model)
+            for model in models
+        ]
+
+    async def stream_all(self, filters: BookFilterEntity, batch_size: int) -> AsyncIterator[BookEntity]:
+        statement = (
+            select(self.model)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        statement = self.apply_filters(statement=statement, filters=filters)
+
+        result = await self.session.stream_scalars(statement)
+
+        async for model in result:
+            yield self.mapper.from_model_to_entity(model=model)
+
+    def apply_filters(self, statement: Select, filters: BookFilterEntity) -> Select:
+        if filters.genre is not None:
+            statement = statement.where(self.model.genre == filters.genre)
+
         if filters.year_from is not None:
             statement = statement.where(self.model.publish_year >= filters.year_from)
 
@@ -98,22 +227,28 @@ class BookRepository(BookRepositoryProtocol):
         if filters.pages_to is not None:
             statement = statement.where(self.model.page_count <= filters.pages_to)
 
-        result = await self.session.execute(statement)
-        models = list(result.scalars().all())
-
-        return [
-            self.mapper.from_model_to_entity(model=model)
-            for model in models
-        ]
+        return statement
 
-    async def delete_by_id(self, model_id: UUID) -> bool:
+    async def delete_by_id(self, model_id: UUID) -> Optional[str]:
         statement = (
             delete(self.model)
             .where(self.model.id == model_id)
+            .returning(self.model.slug)
         )
 
         result = await self.session.execute(statement)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
+
+    async def detach_author(self, author_id: UUID) -> List[str]:
+        statement = (
+            update(self.model)
+            .where(self.model.author_id == author_id)
+            .values(author_id=None)
+            .returning(self.model.slug)
+        )
+
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
 
     async def update(self, entity: BookUpdateEntity) -> Optional[BookEntity]:
         statement = (
@@ -139,6 +274,69 @@ class BookRepository(BookRepositoryProtocol):
 
         return None
 
+    async def update_rating_stats(
+            self,
+            book_id: UUID,
+            added_rating: Optional[int] = None,
+            removed_rating: Optional[int] = None
+    ) -> None:
+        if added_rating == removed_rating:
+            return
+
+        values = {}
+
+        for rating, step in ((added_rating, 1), (removed_rating, -1)):
+            if rating is None:
+                continue
+
+            count_column = getattr(self.model, f"rating_{rating}")
+            values[count_column] = values.get(count_column, count_column) + step
+            values[self.model.rating_count] = values.get(self.model.rating_count, self.model.rating_count) + step
+            values[self.model.rating_sum] = values.get(self.model.rating_sum, self.model.rating_sum) + step * rating
+
+        statement = (
+            update(self.model)
+            .values(values)
+            .where(self.model.id == book_id)
+        )
+
+        await self.session.execute(statement)
+
+    async def recalculate_rating_stats(self, book_id: Optional[UUID] = None) -> int:
+        def count_reviews(rating: Optional[int] = None):
+            statement = (
+                select(func.count(ReviewModel.id))
+                .where(ReviewModel.book_id == self.model.id)
+            )
+
+            if rating is not None:
+                statement = statement.where(ReviewModel.rating == rating)
+
+            return statement.scalar_subquery()
+
+        statement = (
+            update(self.model)
+            .values(
+                rating_count=count_reviews(),
+                rating_sum=(
+                    select(func.coalesce(func.sum(ReviewModel.rating), 0))
+                    .where(ReviewModel.book_id == self.model.id)
+                    .scalar_subquery()
+                ),
+                rating_1=count_reviews(rating=1),
+                rating_2=count_reviews(rating=2),
+                rating_3=count_reviews(rating=3),
+                rating_4=count_reviews(rating=4),
+                rating_5=count_reviews(rating=5)
+            )
+        )
+
+        if book_id is not None:
+            statement = statement.where(self.model.id == book_id)
+
+        result = await self.session.execute(statement)
+        return result.rowcount
+
 
 class FavouriteBookRepository(FavouriteBookRepositoryProtocol):
     def __init__(
@@ -151,6 +349,19 @@ class FavouriteBookRepository(FavouriteBookRepositoryProtocol):
         self.model = FavouriteBookModel
 
     async def add(self, user_id: UUID, book_id: UUID) -> FavouriteBookEntity:
+        if is_postgresql(self.session):
+            try:
+                result = await self.session.execute(self.build_add_statement(user_id=user_id, book_id=book_id))
+            except IntegrityError:
+                raise FavouriteBookRepositoryException()
+
+            model = result.scalar_one_or_none()
+
+            if model is None:
+                raise FavouriteBookAlreadyExistException()
+
+            return self.mapper.from_model_to_entity(model=model)
+
         model = self.model(
             user_id=user_id,
             book_id=book_id
@@ -166,20 +377,71 @@ class FavouriteBookRepository(FavouriteBookRepositoryProtocol):
                 raise FavouriteBookAlreadyExistException()
             raise FavouriteBookRepositoryException()
 
-        statement = (
-            select(self.model)
-            .options(selectinload(self.model.book))
-            .where(self.model.id == model.id)
-        )
+        statement = self.build_select().where(self.model.id == model.id)
 
         result = await self.session.execute(statement)
         model = result.scalar_one_or_none()
 
-        if model is None or model.book is None:
+        if model is None:
             raise FavouriteBookRepositoryException()
 
         return self.mapper.from_model_to_entity(model=model)
 
+    def build_select(self, source: Optional[CTE] = None) -> Select:
+        favourite_book = aliased(self.model, source) if source is not None else self.model
+
+        return (
+            select(favourite_book)
+            .join(favourite_book.book)
+            .options(contains_eager(favourite_book.book))
+            .execution_options(populate_existing=True)
+        )
+
+    def build_add_statement(self, user_id: UUID, book_id: UUID) -> Select:
+        written = (
+            pg_insert(self.model)
+            .values(
+                user_id=user_id,
+                book_id=book_id
+            )
+            .on_conflict_do_nothing(constraint="uq_user_book_favourite")
+            .returning(*self.model.__table__.columns)
+            .cte("written_favourite_book")
+        )
+
+        return self.build_select(source=written)
+
+    def build_update_status(
+            self,
+            user_id: UUID,
+            book_id: UUID,
+            status: BookReadingStatus
+    ) -> Update:
+        return (
+            update(self.model)
+            .values(status=status)
+            .where(
+                and_(
+                    self.model.user_id == user_id,
+                    self.model.book_id == book_id
+                )
+            )
+        )
+
+    def build_update_status_statement(
+            self,
+            user_id: UUID,
+            book_id: UUID,
+            status: BookReadingStatus
+    ) -> Select:
+        written = (
+            self.build_update_status(user_id=user_id, book_id=book_id, status=status)
+            .returning(*self.model.__table__.columns)
+            .cte("written_favourite_book")
+        )
+
+        return self.build_select(source=written)
+
     async def delete(self, user_id: UUID, book_id: UUID) -> bool:
         statement = (
             delete(self.model)
@@ -215,15 +477,23 @@ class FavouriteBookRepository(FavouriteBookRepositoryProtocol):
             book_id: UUID,
             status: BookReadingStatus
     ) -> Optional[FavouriteBookEntity]:
-        statement = (
-            update(self.model)
-            .values(status=status)
-            .where(
-                and_(
-                    self.model.user_id == user_id,
-                    self.model.book_id == book_id
-                )
+        if is_postgresql(self.session):
+            statement = self.build_update_status_statement(
+                user_id=user_id,
+                book_id=book_id,
+                status=status
             )
+
+            result = await self.session.execute(statement)
+            model = result.scalar_one_or_none()
+
+            if model is None:
+                return None
+
+            return self.mapper.from_model_to_entity(model=model)
+
+        statement = (
+            self.build_update_status(user_id=user_id, book_id=book_id, status=status)
             .returning(self.model.id)
         )
 
@@ -233,14 +503,9 @@ class FavouriteBookRepository(FavouriteBookRepositoryProtocol):
         if favourite_book_id is None:
             return None
 
-        statement = (
-            select(self.model)
-            .options(selectinload(self.model.book))
-            .where(self.model.id == favourite_book_id)
-        )
+        statement = self.build_select().where(self.model.id == favourite_book_id)
 
         result = await self.session.execute(statement)
         model = result.scalar_one_or_none()
 
         return self.mapper.from_model_to_entity(model=model)
-
@@ -1,5 +1,7 @@
+from sqlalchemy import Row
+
 from src.core.mappers import ModelToEntityMapper
-from src.domain.reviews.entities import ReviewEntity
+from src.domain.reviews.entities import ReviewEntity, ReviewItemEntity
 from src.infrastructure.database.books.mappers import BookModelMapper
 from src.infrastructure.database.reviews.models import ReviewModel
 
@@ -20,3 +22,13 @@ class ReviewModelMapper(ModelToEntityMapper[ReviewModel, ReviewEntity]):
             book=self.mapper.from_model_to_entity(model=model.book),
             created_at=model.created_at
         )
+
+    def from_row_to_item_entity(self, row: Row) -> ReviewItemEntity:
+        return ReviewItemEntity(
+            id=row.id,
+            review=row.review,
+            rating=row.rating,
+            full_name=f"{row.first_name} {row.last_name}",
+            created_at=row.created_at,
+            version=row.version
+        )
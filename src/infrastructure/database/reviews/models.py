@@ -1,15 +1,15 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, ForeignKey, Text, Integer, func, DateTime, UniqueConstraint
+from sqlalchemy import UUID, ForeignKey, Text, Integer, func, DateTime, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database.models import SQLBaseModel
+from src.core.database.models import SQLBaseModel, VersionedModelMixin
 from src.infrastructure.database.books.models import BookModel
 from src.infrastructure.database.user.models import UserModel
 
 
-class ReviewModel(SQLBaseModel):
+class ReviewModel(VersionedModelMixin, SQLBaseModel):
     __tablename__ = "reviews"
 
     review: Mapped[str] = mapped_column(Text, nullable=False)
@@ -41,4 +41,6 @@ class ReviewModel(SQLBaseModel):
             "user_id", "book_id",
             name="uq_user_book_review"
         ),
+        Index("ix_reviews_book_id_created_at_id", "book_id", "created_at", "id"),
+        Index("ix_reviews_book_id_rating_created_at_id", "book_id", "rating", "created_at", "id"),
     )
\ No newline at end of file
@@ -1,16 +1,21 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple, Any
 from uuid import UUID
 
-from sqlalchemy import select, update, and_, delete
+from sqlalchemy import select, update, and_, delete, Select, CTE, Update, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager
 
-from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity
+from src.core.database.dialect import is_postgresql
+from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity, ReviewFilterEntity, \
+    ReviewItemEntity
+from src.domain.reviews.enums import ReviewSortField
 from src.domain.reviews.exceptions import ReviewAlreadyExistException, ReviewRepositoryException
 from src.domain.reviews.protocols import ReviewRepositoryProtocol
 from src.infrastructure.database.reviews.mappers import ReviewModelMapper
 from src.infrastructure.database.reviews.models import ReviewModel
+from src.infrastructure.database.user.models import UserModel
 
 
 class ReviewRepository(ReviewRepositoryProtocol):
@@ -24,6 +29,19 @@ class ReviewRepository(ReviewRepositoryProtocol):
         self.model = ReviewModel
 
     async def create(self, entity: ReviewCreateEntity) -> ReviewEntity:
+        if is_postgresql(self.session):
+            try:
+                result = await self.session.execute(self.build_create_statement(entity=entity))
+            except IntegrityError:
+                raise ReviewRepositoryException()
+
+            model = result.scalar_one_or_none()
+
+            if model is None:
+                raise ReviewAlreadyExistException()
+
+            return self.mapper.from_model_to_entity(model=model)
+
         model = self.model(
             review=entity.review,
             rating=entity.rating,
@@ -41,78 +59,148 @@ class ReviewRepository(ReviewRepositoryProtocol):
                 raise ReviewAlreadyExistException()
             raise ReviewRepositoryException()
 
-        statement = (
-            select(self.model)
-            .options(
-                selectinload(self.model.user),
-                selectinload(self.model.book)
-            )
-            .where(self.model.id == model.id)
-        )
+        statement = self.build_select().where(self.model.id == model.id)
 
         result = await self.session.execute(statement)
         model = result.scalar_one_or_none()
 
-        if model is None or model.book is None or model.user is None:
+        if model is None:
             raise ReviewRepositoryException()
 
         return self.mapper.from_model_to_entity(model=model)
 
-    async def find_all_by_book_id(self, book_id: UUID) -> List[ReviewEntity]:
-        statement = (
-            select(self.model)
+    def build_select(self, source: Optional[CTE] = None) -> Select:
+        review = aliased(self.model, source) if source is not None else self.model
+
+        return (
+            select(review)
+            .join(review.book)
+            .join(review.user)
             .options(
-                selectinload(self.model.user),
-                selectinload(self.model.book)
+                contains_eager(review.book),
+                contains_eager(review.user)
             )
-            .where(self.model.book_id == book_id)
+            .execution_options(populate_existing=True)
         )
 
-        result = await self.session.execute(statement)
-        models = list(result.scalars().all())
+    def build_create_statement(self, entity: ReviewCreateEntity) -> Select:
+        written = (
+            pg_insert(self.model)
+            .values(
+                review=entity.review,
+                rating=entity.rating,
+                user_id=entity.user_id,
+                book_id=entity.book_id
+            )
+            .on_conflict_do_nothing(constraint="uq_user_book_review")
+            .returning(*self.model.__table__.columns)
+            .cte("written_review")
+        )
 
-        return [
-            self.mapper.from_model_to_entity(model=model)
-            for model in models
-        ]
+        return self.build_select(source=written)
 
-    async def update(self, entity: ReviewUpdateEntity) -> Optional[ReviewEntity]:
-        statement = (
+    def build_update(self, entity: ReviewUpdateEntity, review_id: Any) -> Update:
+        return (
             update(self.model)
             .values(
                 review=entity.review,
                 rating=entity.rating
             )
+            .where(self.model.id == review_id)
+        )
+
+    def build_find_previous(self, entity: ReviewUpdateEntity) -> Select:
+        return (
+            select(self.model.id, self.model.rating)
             .where(
                 and_(
                     self.model.book_id == entity.book_id,
                     self.model.user_id == entity.user_id
                 )
             )
-            .returning(self.model.id)
+            .with_for_update()
         )
 
-        result = await self.session.execute(statement)
-        review_id = result.scalar_one_or_none()
+    def build_update_statement(self, entity: ReviewUpdateEntity) -> Select:
+        previous = self.build_find_previous(entity=entity).cte("previous_review")
+        written = (
+            self.build_update(entity=entity, review_id=previous.c.id)
+            .returning(*self.model.__table__.columns, previous.c.rating.label("previous_rating"))
+            .cte("written_review")
+        )
 
-        if review_id is None:
-            return None
+        return self.build_select(source=written).add_columns(written.c.previous_rating)
+
+    def get_sort_columns(self, sort: ReviewSortField) -> Tuple:
+        if sort in (ReviewSortField.RATING_DESC, ReviewSortField.RATING_ASC):
+            return self.model.rating, self.model.created_at, self.model.id
+
+        return self.model.created_at, self.model.id
+
+    async def find_page(self, filters: ReviewFilterEntity) -> List[ReviewItemEntity]:
+        sort_columns = self.get_sort_columns(sort=filters.sort)
+        descending = filters.sort in (ReviewSortField.NEWEST, ReviewSortField.RATING_DESC)
 
         statement = (
-            select(self.model)
-            .options(
-                selectinload(self.model.user),
-                selectinload(self.model.book)
+            select(
+                self.model.id,
+                self.model.review,
+                self.model.rating,
+                self.model.created_at,
+                self.model.version,
+                UserModel.first_name,
+                UserModel.last_name
             )
-            .where(self.model.id == review_id)
+            .join(self.model.user)
+            .where(self.model.book_id == filters.book_id)
+            .order_by(*(column.desc() if descending else column for column in sort_columns))
+            .limit(filters.limit)
         )
 
+        if filters.after_id is not None:
+            after = (filters.after_created_at, filters.after_id)
+
+            if len(sort_columns) == 3:
+                after = (filters.after_rating, *after)
+
+            sort_key = tuple_(*sort_columns)
+            statement = statement.where(sort_key < after if descending else sort_key > after)
+
         result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
 
-        return self.mapper.from_model_to_entity(model=model)
+        return [
+            self.mapper.from_row_to_item_entity(row=row)
+            for row in result.all()
+        ]
+
+    async def update(self, entity: ReviewUpdateEntity) -> Optional[Tuple[ReviewEntity, int]]:
+        if is_postgresql(self.session):
+            result = await self.session.execute(self.build_update_statement(entity=entity))
+            row = result.one_or_none()
+
+            if row is None:
+                return None
+
+            model, previous_rating = row
+            return self.mapper.from_model_to_entity(model=model), previous_rating
+
+        result = await self.session.execute(self.build_find_previous(entity=entity))
+        previous = result.one_or_none()
+
+        if previous is None:
+            return None
+
+        review_id, previous_rating = previous
+        await self.session.execute(self.build_update(entity=entity, review_id=review_id))
+
+        statement = self.build_select().where(self.model.id == review_id)
+
+        result = await self.session.execute(statement)
+        model = result.scalar_one()
+
+        return self.mapper.from_model_to_entity(model=model), previous_rating
 
-    async def delete_by_id(self, user_id: UUID, book_id: UUID) -> bool:
+    async def delete_by_id(self, user_id: UUID, book_id: UUID) -> Optional[int]:
         statement = (
             delete(self.model)
             .where(
@@ -121,7 +209,8 @@ class ReviewRepository(ReviewRepositoryProtocol):
                     self.model.user_id == user_id
                 )
             )
+            .returning(self.model.rating)
         )
 
         result = await self.session.execute(statement)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
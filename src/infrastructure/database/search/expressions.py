@@ -0,0 +1,30 @@
+from typing import Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, TSQUERY
+from sqlalchemy.sql.elements import ColumnElement
+
+SEARCH_CONFIG = text("'simple'::regconfig")
+EMPTY_TEXT = text("''")
+
+
+def weighted_vector(column: ColumnElement, weight: str) -> ColumnElement:
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(column, EMPTY_TEXT), type_=TSVECTOR),
+        text(f"'{weight}'"),
+        type_=TSVECTOR
+    )
+
+
+def search_vector(*columns: Tuple[ColumnElement, str]) -> ColumnElement:
+    column, weight = columns[0]
+    vector = weighted_vector(column=column, weight=weight)
+
+    for column, weight in columns[1:]:
+        vector = vector.op("||", return_type=TSVECTOR)(weighted_vector(column=column, weight=weight))
+
+    return vector
+
+
+def search_query(query: str) -> ColumnElement:
+    return func.websearch_to_tsquery(SEARCH_CONFIG, query, type_=TSQUERY)
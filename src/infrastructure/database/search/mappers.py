@@ -0,0 +1,16 @@
+from sqlalchemy import Row
+
+from src.core.mappers import ModelToEntityMapper
+from src.domain.search.entities import SearchResultEntity
+from src.domain.search.enums import SearchResultKind
+
+
+class SearchResultRowMapper(ModelToEntityMapper[Row, SearchResultEntity]):
+    def from_model_to_entity(self, model: Row) -> SearchResultEntity:
+        return SearchResultEntity(
+            id=model.id,
+            kind=SearchResultKind(model.kind),
+            title=model.title,
+            slug=model.slug,
+            rank=float(model.rank)
+        )
@@ -0,0 +1,85 @@
+from typing import List
+
+from sqlalchemy import select, literal, or_, func, union_all, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.search.entities import SearchFilterEntity, SearchResultEntity
+from src.domain.search.enums import SearchTarget, SearchResultKind
+from src.domain.search.protocols import SearchRepositoryProtocol
+from src.infrastructure.database.author.models import AuthorModel, AUTHOR_SEARCH_VECTOR
+from src.infrastructure.database.books.models import BookModel, BOOK_SEARCH_VECTOR
+from src.infrastructure.database.search.expressions import search_query
+from src.infrastructure.database.search.mappers import SearchResultRowMapper
+
+
+class SearchRepository(SearchRepositoryProtocol):
+    def __init__(
+            self,
+            session: AsyncSession,
+            mapper: SearchResultRowMapper
+    ):
+        self.session = session
+        self.mapper = mapper
+
+    @staticmethod
+    def build_statement(
+            kind: SearchResultKind,
+            model,
+            vector,
+            title_column,
+            query: str
+    ) -> Select:
+        ts_query = search_query(query=query)
+        rank = func.ts_rank_cd(vector, ts_query) + func.similarity(title_column, query)
+
+        return (
+            select(
+                literal(kind.value).label("kind"),
+                model.id.label("id"),
+                title_column.label("title"),
+                model.slug.label("slug"),
+                rank.label("rank")
+            )
+            .where(
+                or_(
+                    vector.op("@@")(ts_query),
+                    title_column.op("%")(query)
+                )
+            )
+        )
+
+    async def search(self, filters: SearchFilterEntity) -> List[SearchResultEntity]:
+        statements = []
+
+        if filters.target in (SearchTarget.ALL, SearchTarget.BOOKS):
+            statements.append(self.build_statement(
+                kind=SearchResultKind.BOOK,
+                model=BookModel,
+                vector=BOOK_SEARCH_VECTOR,
+                title_column=BookModel.title,
+                query=filters.query
+            ))
+
+        if filters.target in (SearchTarget.ALL, SearchTarget.AUTHORS):
+            statements.append(self.build_statement(
+                kind=SearchResultKind.AUTHOR,
+                model=AuthorModel,
+                vector=AUTHOR_SEARCH_VECTOR,
+                title_column=AuthorModel.name,
+                query=filters.query
+            ))
+
+        results = union_all(*statements).subquery()
+        statement = (
+            select(results)
+            .order_by(results.c.rank.desc(), results.c.id)
+            .limit(filters.limit)
+            .offset(filters.offset)
+        )
+
+        result = await self.session.execute(statement)
+
+        return [
+            self.mapper.from_model_to_entity(model=row)
+            for row in result.all()
+        ]
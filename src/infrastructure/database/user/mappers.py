@@ -1,5 +1,7 @@
 from src.core.mappers import ModelToEntityMapper
-from src.domain.user.entities import UserEntity
+from sqlalchemy import Row
+
+from src.domain.user.entities import UserEntity, UserProfileEntity
 from src.infrastructure.database.user.models import UserModel
 
 
@@ -12,4 +14,13 @@ class UserModelMapper(ModelToEntityMapper[UserModel, UserEntity]):
             last_name=model.last_name,
             hashed_password=model.hashed_password,
             role=model.role
+        )
+
+    def from_row_to_profile(self, row: Row) -> UserProfileEntity:
+        return UserProfileEntity(
+            id=row.id,
+            email=row.email,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            role=row.role
         )
\ No newline at end of file
@@ -4,7 +4,7 @@ from sqlalchemy import select, UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.user.entities import UserCreateEntity, UserEntity
+from src.domain.user.entities import UserCreateEntity, UserEntity, UserProfileEntity
 from src.domain.user.exceptions import UserAlreadyExistException
 from src.domain.user.protocols import UserRepositoryProtocol
 from src.infrastructure.database.user.mappers import UserModelMapper
@@ -54,6 +54,26 @@ class UserRepository(UserRepositoryProtocol):
 
         return self.mapper.from_model_to_entity(model=model)
 
+    async def find_profile_by_id(self, model_id: UUID) -> Optional[UserProfileEntity]:
+        statement = (
+            select(
+                self.model.id,
+                self.model.email,
+                self.model.first_name,
+                self.model.last_name,
+                self.model.role
+            )
+            .where(self.model.id == model_id)
+        )
+
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+
+        if row is None:
+            return None
+
+        return self.mapper.from_row_to_profile(row=row)
+
     async def find_by_email(self, email: str) -> Optional[UserEntity]:
         statement = (
             select(self.model)
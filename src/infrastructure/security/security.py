@@ -1,15 +1,25 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from typing import Callable, TypeVar, Optional
 
 from jose import jwt
 from asyncpg.pgproto.pgproto import timedelta
 from passlib.context import CryptContext
 
 from src.core.config import settings
+from src.core.observability.metrics import PASSWORD_HASHER_QUEUED, PASSWORD_HASHER_IN_PROGRESS, \
+    PASSWORD_HASHER_WAIT_SECONDS, PASSWORD_HASHER_SECONDS
+from src.domain.security.exceptions import PasswordHasherBusyException
 from src.domain.security.protocols import (
     PasswordHasherProtocol,
     TokenServiceProtocol
 )
 
+T = TypeVar("T")
+
 pwd_context = CryptContext(
     schemes=["bcrypt_sha256", "bcrypt"],
     deprecated="auto"
@@ -17,11 +27,74 @@ pwd_context = CryptContext(
 
 
 class PasswordHasher(PasswordHasherProtocol):
-    def hash(self, password: str) -> str:
-        return pwd_context.hash(password)
+    def __init__(
+            self,
+            max_workers: int,
+            max_queue: int
+    ):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queued = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+
+        return self._semaphore
+
+    async def hash(self, password: str) -> str:
+        return await self.run("hash", pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run("verify", pwd_context.verify, plain_password, hashed_password)
+
+    async def run(self, op: str, fn: Callable[..., T], *args) -> T:
+        semaphore = self.semaphore
 
-    def verify(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        if semaphore.locked() and self.queued >= self.max_queue:
+            raise PasswordHasherBusyException()
+
+        self.queued += 1
+        PASSWORD_HASHER_QUEUED.inc()
+        start = time.perf_counter()
+
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queued -= 1
+            PASSWORD_HASHER_QUEUED.dec()
+
+        PASSWORD_HASHER_WAIT_SECONDS.observe(time.perf_counter() - start)
+        start = time.perf_counter()
+
+        try:
+            with PASSWORD_HASHER_IN_PROGRESS.track_inprogress():
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, partial(fn, *args))
+
+            PASSWORD_HASHER_SECONDS.labels(op=op, status="ok").observe(time.perf_counter() - start)
+            return result
+        except Exception:
+            PASSWORD_HASHER_SECONDS.labels(op=op, status="error").observe(time.perf_counter() - start)
+            raise
+        finally:
+            semaphore.release()
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHER_MAX_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE
+)
 
 
 class TokenService(TokenServiceProtocol):
@@ -1,23 +1,58 @@
 import asyncio
 import io
+import logging
 import uuid
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, BinaryIO, Optional, Set
 from urllib.parse import urlparse, unquote
 
+import certifi
+import urllib3
 from fastapi import UploadFile
 from minio import Minio, S3Error
 
 from src.core.config import settings
 from src.domain.storage.file_storage import MinioClientProtocol
 from src.domain.storage.exceptions import MinioEndpointNotFoundException, MinioKeyNotFoundException, \
-    MinioUploadFileException, MinioNotValidUrlException, MinioFileDeleteException
+    MinioUploadFileException, MinioNotValidUrlException, MinioFileDeleteException, MinioFileTooLargeException
 
 BASE_FILE_CONTENT_TYPE = "application/octet-stream"
 
+logger = logging.getLogger(__name__)
+
+
+class LimitedReader:
+    def __init__(self, stream: BinaryIO, max_bytes: int):
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.max_bytes - self.bytes_read + 1
+
+        chunk = self.stream.read(size)
+        self.bytes_read += len(chunk)
+
+        if self.bytes_read > self.max_bytes:
+            raise MinioFileTooLargeException()
+
+        return chunk
+
 
 class MinioClient(MinioClientProtocol):
+    def __init__(self):
+        self.client: Optional[Minio] = None
+        self.http_client: Optional[urllib3.PoolManager] = None
+        self.known_buckets: Set[str] = set()
+
     def get_client(self) -> Minio:
+        if self.client is None:
+            self.client = self.build_client()
+
+        return self.client
+
+    def build_client(self) -> Minio:
         endpoint = settings.MINIO_ENDPOINT
         if not endpoint:
             raise MinioEndpointNotFoundException()
@@ -32,13 +67,67 @@ class MinioClient(MinioClientProtocol):
         if not (access_key and secret_key):
             raise MinioKeyNotFoundException()
 
+        self.http_client = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=settings.MINIO_POOL_MAXSIZE,
+            block=True,
+            timeout=urllib3.Timeout(
+                connect=settings.MINIO_CONNECT_TIMEOUT_SECONDS,
+                read=settings.MINIO_READ_TIMEOUT_SECONDS
+            ),
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504]
+            ),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where()
+        )
+
         return Minio(
             endpoint=endpoint,
             access_key=access_key,
             secret_key=secret_key,
-            secure=secure
+            secure=secure,
+            region=settings.MINIO_REGION,
+            http_client=self.http_client
         )
 
+    async def start(self) -> None:
+        try:
+            await self.ensure_bucket(settings.MINIO_BUCKET_AVATARS)
+        except Exception:
+            logger.warning("MinIO is unavailable at startup, buckets will be checked on first use", exc_info=True)
+
+    def close(self) -> None:
+        if self.http_client is not None:
+            self.http_client.clear()
+
+        self.client = None
+        self.http_client = None
+
+        self.known_buckets.clear()
+
+    async def ensure_bucket(self, bucket_name: str) -> None:
+        if bucket_name in self.known_buckets:
+            return
+
+        client = self.get_client()
+
+        def _ensure_bucket():
+            exists = client.bucket_exists(bucket_name)
+
+            if not exists:
+                client.make_bucket(bucket_name)
+
+        try:
+            await asyncio.to_thread(_ensure_bucket)
+        except S3Error as ex:
+            if ex.code not in {"BucketAlreadyOwnedByYou", "BucketAlreadyExists"}:
+                raise
+
+        self.known_buckets.add(bucket_name)
+
     def build_base_url(self) -> str:
         base = settings.MINIO_PUBLIC_ENDPOINT or settings.MINIO_ENDPOINT
         url = urlparse(base)
@@ -96,30 +185,24 @@ class MinioClient(MinioClientProtocol):
             public: bool
     ) -> str:
         client = self.get_client()
+        await self.ensure_bucket(bucket_name)
 
-        def _ensure_bucket():
-            exists = client.bucket_exists(bucket_name)
-
-            if not exists:
-                client.make_bucket(bucket_name)
+        max_bytes = settings.MINIO_UPLOAD_MAX_BYTES
 
-        try:
-            await asyncio.to_thread(_ensure_bucket)
-        except S3Error as ex:
-            if ex.code not in {"BucketAlreadyOwnedByYou", "BucketAlreadyExists"}:
-                raise
+        if file.size is not None and file.size > max_bytes:
+            raise MinioFileTooLargeException()
 
         object_name = self.generate_name(file.filename)
-        file_data = await file.read()
-        file_stream = io.BytesIO(file_data)
-        file_length = len(file_data)
+        await file.seek(0)
+        file_stream = LimitedReader(stream=file.file, max_bytes=max_bytes)
 
         def _upload():
             client.put_object(
                 bucket_name=bucket_name,
                 object_name=object_name,
                 data=file_stream,
-                length=file_length,
+                length=-1,
+                part_size=settings.MINIO_UPLOAD_PART_SIZE,
                 content_type=file.content_type or BASE_FILE_CONTENT_TYPE
             )
 
@@ -149,4 +232,7 @@ class MinioClient(MinioClientProtocol):
         try:
             await asyncio.to_thread(_remove)
         except S3Error:
-            raise MinioFileDeleteException()
\ No newline at end of file
+            raise MinioFileDeleteException()
+
+
+minio_client = MinioClient()
@@ -8,11 +8,24 @@ from src.adapters.endpoints.author import router as author_router
 from src.adapters.endpoints.books.books import router as books_router
 from src.adapters.endpoints.books.favourites import router as favourite_books_router
 from src.adapters.endpoints.reviews import router as reviews_router
+from src.adapters.endpoints.search import router as search_router
+from src.adapters.responses import FastJSONResponse
+from src.core.compression import CompressionMiddleware
+from src.core.database.database import replica_router
+from src.core.observability.queries import QueryStatsMiddleware
+from src.infrastructure.cache.cache import cache_invalidation_listener
+from src.infrastructure.storage.file_storage import minio_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    cache_invalidation_listener.start()
+    replica_router.start()
+    await minio_client.start()
     yield
+    await replica_router.stop()
+    await cache_invalidation_listener.stop()
+    minio_client.close()
 
 
 def create_app():
@@ -20,9 +33,13 @@ def create_app():
         title="BookWise API",
         description="API for BookWise",
         version="1.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse
     )
 
+    _app.add_middleware(CompressionMiddleware)
+    _app.add_middleware(QueryStatsMiddleware)
+
     _app.include_router(auth_router)
     _app.include_router(author_router)
 
@@ -31,6 +48,8 @@ def create_app():
 
     _app.include_router(reviews_router)
 
+    _app.include_router(search_router)
+
     return _app
 
 
@@ -4,7 +4,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.uow import SQLAlchemyUoW
-from src.domain.user.entities import UserCreateEntity
+from src.domain.user.entities import UserCreateEntity, UserProfileEntity
 from src.domain.user.enums import UserRole
 from src.domain.user.exceptions import UserAlreadyExistException
 from src.infrastructure.database.user.mappers import UserModelMapper
@@ -42,6 +42,15 @@ class TestUserRepository:
             assert result_by_id.id == result.id
             assert result_by_id.email == entity.email
 
+            profile = await repository.find_profile_by_id(model_id=result.id)
+            assert profile == UserProfileEntity(
+                id=result.id,
+                email=entity.email,
+                first_name=entity.first_name,
+                last_name=entity.last_name,
+                role=entity.role
+            )
+
             result_by_email = await repository.find_by_email(email=entity.email)
             assert result_by_email.id == result.id
             assert result_by_email.email == entity.email
@@ -1,19 +1,29 @@
+import asyncio
+import threading
 import uuid
-from unittest.mock import AsyncMock, create_autospec, MagicMock
+from unittest.mock import AsyncMock, create_autospec, MagicMock, patch
 
 import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.schemas.requests.user import RegisterRequest, LogInRequest
 from src.adapters.schemas.responses.user import TokenResponse
 from src.application.usecases.user import RegisterUseCase, LogInUseCase
+from src.core.auth import get_user
+from src.domain.cache.protocols import CacheManagerProtocol
 from src.core.uow import SQLAlchemyUoW
+from src.domain.security.exceptions import PasswordHasherBusyException
 from src.domain.security.protocols import PasswordHasherProtocol, TokenServiceProtocol
-from src.domain.user.entities import UserCreateEntity, UserEntity
+from src.domain.user.entities import UserCreateEntity, UserEntity, UserProfileEntity
 from src.domain.user.enums import UserRole
 from src.domain.user.exceptions import UserAlreadyExistException, InvalidCredentialsException
 from src.domain.user.mappers import UserSchemaMapper
 from src.domain.user.protocols import UserRepositoryProtocol
+from src.infrastructure.cache.cache import token_cache
+from src.infrastructure.security.security import TokenService, PasswordHasher
 
 
 @pytest.mark.asyncio
@@ -70,7 +80,7 @@ class TestRegisterUseCase:
         result = await use_case.execute(data=request)
         assert result == response
 
-        password_hasher.hash.assert_called_once_with(password=request.password)
+        password_hasher.hash.assert_awaited_once_with(password=request.password)
         mapper.from_entity_to_schema.assert_called_once_with(entity=created_entity)
 
         repository.create.assert_awaited_once_with(entity=create_entity)
@@ -110,7 +120,7 @@ class TestRegisterUseCase:
         with pytest.raises(UserAlreadyExistException):
             await use_case.execute(data=request)
 
-        password_hasher.hash.assert_called_once_with(password=request.password)
+        password_hasher.hash.assert_awaited_once_with(password=request.password)
 
         fake_session.rollback.assert_awaited_once()
         fake_session.commit.assert_not_awaited()
@@ -157,7 +167,7 @@ class TestLogInUseCase:
         assert result.access_token == response.access_token
 
         repository.find_by_email.assert_awaited_once_with(email=request.email)
-        password_hasher.verify.assert_called_once_with(
+        password_hasher.verify.assert_awaited_once_with(
             plain_password=request.password,
             hashed_password=user_entity.hashed_password
         )
@@ -189,7 +199,7 @@ class TestLogInUseCase:
             await use_case.execute(data=request)
 
         repository.find_by_email.assert_awaited_once_with(email=request.email)
-        password_hasher.verify.assert_not_called()
+        password_hasher.verify.assert_not_awaited()
         token_service.create_access_token.assert_not_called()
 
     async def test_execute_verify_returns_false(self):
@@ -226,8 +236,110 @@ class TestLogInUseCase:
             await use_case.execute(data=request)
 
         repository.find_by_email.assert_awaited_once_with(email=request.email)
-        password_hasher.verify.assert_called_once_with(
+        password_hasher.verify.assert_awaited_once_with(
             plain_password=request.password,
             hashed_password=user_entity.hashed_password
         )
-        token_service.create_access_token.assert_not_called()
\ No newline at end of file
+        token_service.create_access_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestGetUser:
+    @staticmethod
+    def build_user() -> UserProfileEntity:
+        return UserProfileEntity(
+            id=uuid.uuid4(),
+            email="user@email.com",
+            first_name="First name",
+            last_name="Last name",
+            role=UserRole.USER
+        )
+
+    async def test_get_user_loads_through_cache(self, load_through_cache):
+        user = self.build_user()
+        token = TokenService().create_access_token(data={"sub": str(user.id)})
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        repository = create_autospec(UserRepositoryProtocol, instance=True)
+        repository.find_profile_by_id = AsyncMock(return_value=user)
+
+        cache = create_autospec(CacheManagerProtocol, instance=True)
+        cache.get_or_load.side_effect = load_through_cache
+
+        result = await get_user(creds=creds, repository=repository, cache=cache)
+
+        assert result == user
+        assert cache.get_or_load.await_args.kwargs["key"] == f"user:profile:{user.id}"
+        assert cache.get_or_load.await_args.kwargs["schema"] is UserProfileEntity
+        repository.find_profile_by_id.assert_awaited_once_with(model_id=user.id)
+
+    async def test_get_user_decodes_token_once(self):
+        token_cache.clear()
+        user = self.build_user()
+        token = TokenService().create_access_token(data={"sub": str(user.id)})
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        repository = create_autospec(UserRepositoryProtocol, instance=True)
+        cache = create_autospec(CacheManagerProtocol, instance=True)
+        cache.get_or_load.return_value = user
+
+        with patch("src.core.auth.jwt.decode", wraps=jwt.decode) as decode:
+            await get_user(creds=creds, repository=repository, cache=cache)
+            await get_user(creds=creds, repository=repository, cache=cache)
+
+        decode.assert_called_once()
+
+    async def test_get_user_not_found(self, load_through_cache):
+        user = self.build_user()
+        token = TokenService().create_access_token(data={"sub": str(user.id)})
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        repository = create_autospec(UserRepositoryProtocol, instance=True)
+        repository.find_profile_by_id = AsyncMock(return_value=None)
+
+        cache = create_autospec(CacheManagerProtocol, instance=True)
+        cache.get_or_load.side_effect = load_through_cache
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_user(creds=creds, repository=repository, cache=cache)
+
+        assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestPasswordHasher:
+    async def test_hash_and_verify_run_in_pool(self):
+        hasher = PasswordHasher(max_workers=2, max_queue=4)
+
+        hashed = await hasher.hash(password="password")
+
+        assert await hasher.verify(plain_password="password", hashed_password=hashed)
+        assert not await hasher.verify(plain_password="wrong", hashed_password=hashed)
+
+        thread_name = await hasher.run("noop", lambda: threading.current_thread().name)
+        assert thread_name.startswith("password-hasher")
+
+    async def test_semaphore_is_bound_to_running_loop(self):
+        hasher = PasswordHasher(max_workers=1, max_queue=1)
+        semaphore = hasher.semaphore
+
+        assert hasher.semaphore is semaphore
+        assert await asyncio.to_thread(lambda: asyncio.run(hasher.run("noop", lambda: True)))
+        assert hasher.semaphore is not semaphore
+
+    async def test_run_rejects_when_queue_is_full(self):
+        hasher = PasswordHasher(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = asyncio.create_task(hasher.run("block", release.wait))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(hasher.run("block", release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(PasswordHasherBusyException):
+            await hasher.run("block", release.wait)
+
+        release.set()
+        assert await running
+        assert await queued
+        assert hasher.queued == 0
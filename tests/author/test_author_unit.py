@@ -14,6 +14,7 @@ from src.core.uow import SQLAlchemyUoW
 from src.domain.author.entities import AuthorEntity, AuthorCreateEntity
 from src.domain.author.exceptions import AuthorNotExistException, AuthorAlreadyExistException
 from src.domain.author.mappers import AuthorSchemaMapper
+from src.domain.books.protocols import BookRepositoryProtocol
 from src.domain.cache.protocols import CacheManagerProtocol
 from src.domain.storage.file_storage import MinioClientProtocol
 from src.domain.user.protocols import UserRepositoryProtocol
@@ -21,17 +22,20 @@ from src.domain.user.protocols import UserRepositoryProtocol
 
 @pytest.mark.asyncio
 class TestFindAuthorUseCase:
-    async def test_execute_success(self):
+    async def test_execute_success(self, load_through_cache):
         repository = create_autospec(UserRepositoryProtocol, instance=True)
         repository.find_by_slug = AsyncMock()
 
         mapper = create_autospec(AuthorSchemaMapper, instance=True)
-        founded_result = create_autospec(AuthorResponse, instance=True)
-        founded_result.model_dump.return_value = object()
         slug = "thomas-shelby"
+        founded_result = AuthorResponse(
+            id=uuid.uuid4(),
+            name="Thomas Shelby",
+            slug=slug
+        )
 
         cache_manager = create_autospec(CacheManagerProtocol, instance=True)
-        cache_manager.get.return_value = None
+        cache_manager.get_or_load.side_effect = load_through_cache
 
         author_entity = AuthorEntity(
             id=uuid.uuid4(),
@@ -54,12 +58,13 @@ class TestFindAuthorUseCase:
         )
 
         result = await use_case.execute(slug=slug)
-        assert result == founded_result
+        assert AuthorResponse.model_validate_json(result.body) == founded_result
+        assert result.to_response().headers["etag"] == result.etag
 
         repository.find_by_slug.assert_awaited_once_with(slug=slug)
         mapper.from_entity_to_schema.assert_called_once_with(entity=author_entity)
 
-    async def test_execute_author_not_found(self):
+    async def test_execute_author_not_found(self, load_through_cache):
         repository = create_autospec(UserRepositoryProtocol, instance=True)
         repository.find_by_slug = AsyncMock()
 
@@ -68,7 +73,7 @@ class TestFindAuthorUseCase:
         slug = "thomas-shelby"
 
         cache_manager = create_autospec(CacheManagerProtocol, instance=True)
-        cache_manager.get.return_value = None
+        cache_manager.get_or_load.side_effect = load_through_cache
 
         use_case = FindAuthorUseCase(
             repository=repository,
@@ -196,17 +201,27 @@ class TestDeleteAuthorUseCase:
         fake_session.rollback = AsyncMock()
 
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
         author_id = uuid.uuid4()
 
-        repository.delete_by_id.return_value = True
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        book_repository.detach_author = AsyncMock(return_value=["peaky-blinders", "small-heath"])
+
+        repository.delete_by_id.return_value = "thomas-shelby"
 
         use_case = DeleteAuthorUseCase(
             repository=repository,
-            uow=uow
+            book_repository=book_repository,
+            uow=uow,
+            cache=cache_manager
         )
 
         await use_case.execute(author_id=author_id)
+        book_repository.detach_author.assert_awaited_once_with(author_id=author_id)
         repository.delete_by_id.assert_awaited_once_with(model_id=author_id)
+        cache_manager.invalidate_tags.assert_awaited_once_with(
+            ["author:thomas-shelby", "books:list", "book:peaky-blinders", "book:small-heath"]
+        )
 
     async def test_execute_author_not_found(self):
         repository = create_autospec(UserRepositoryProtocol, instance=True)
@@ -217,19 +232,27 @@ class TestDeleteAuthorUseCase:
         fake_session.rollback = AsyncMock()
 
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
         author_id = uuid.uuid4()
 
-        repository.delete_by_id.return_value = False
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        book_repository.detach_author = AsyncMock(return_value=[])
+
+        repository.delete_by_id.return_value = None
 
         use_case = DeleteAuthorUseCase(
             repository=repository,
-            uow=uow
+            book_repository=book_repository,
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(AuthorNotExistException):
             await use_case.execute(author_id=author_id)
 
         repository.delete_by_id.assert_awaited_once_with(model_id=author_id)
+        fake_session.rollback.assert_awaited_once()
+        cache_manager.invalidate_tags.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -1,12 +1,21 @@
 import uuid
 
 import pytest
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.schemas.requests.books import BookUpdateRequest
+from src.application.usecases.books import UpdateBookUseCase
+from src.core.observability.queries import assert_max_queries
 from src.core.uow import SQLAlchemyUoW
+from src.domain.author.entities import AuthorCreateEntity
 from src.domain.books.entities import BookCreateEntity, BookUpdateEntity, BookFilterEntity
-from src.domain.books.enums import Genre
-from src.domain.books.exceptions import BookAlreadyExistException
+from src.domain.books.enums import Genre, BookSortField
+from src.domain.books.exceptions import BookAlreadyExistException, BookBulkCreateException
+from src.domain.books.mappers import BookSchemaMapper
+from src.infrastructure.cache.cache import get_cache_manager
+from src.infrastructure.database.author.mappers import AuthorModelMapper
+from src.infrastructure.database.author.repositories import AuthorRepository
 from src.infrastructure.database.books.mappers import BookModelMapper
 from src.infrastructure.database.books.repositories import BookRepository
 
@@ -142,6 +151,52 @@ class TestBookRepository:
             result = await repository.delete_by_id(model_id=book_id)
             assert not result
 
+    async def test_detach_author_bumps_version(self, session: AsyncSession):
+        repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=session
+        )
+        author_repository = AuthorRepository(
+            mapper=AuthorModelMapper(),
+            session=session
+        )
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            author = await author_repository.create(
+                entity=AuthorCreateEntity(
+                    name="Thomas Shelby",
+                    slug="thomas-shelby",
+                    bio=None,
+                    birth_date=None,
+                    death_date=None,
+                    country=None
+                )
+            )
+            book = await repository.create(
+                entity=BookCreateEntity(
+                    title="Peaky Blinders",
+                    slug="peaky-blinders",
+                    genre=Genre.FANTASY,
+                    language="Русский",
+                    description=None,
+                    short_description=None,
+                    publish_year=None,
+                    page_count=None,
+                    author_id=author.id
+                )
+            )
+
+        async with uow:
+            slugs = await repository.detach_author(author_id=author.id)
+
+        assert slugs == ["peaky-blinders"]
+
+        session.expire_all()
+        result = await repository.find_by_id(book_id=book.id)
+        assert result.author_id is None
+        assert result.version == book.version + 1
+
     async def test_update_success(self, session: AsyncSession):
         mapper = BookModelMapper()
         repository = BookRepository(
@@ -184,6 +239,7 @@ class TestBookRepository:
             assert updated_result.title == result.title
             assert updated_result.publish_year == update_entity.publish_year
             assert updated_result.language == update_entity.language
+            assert updated_result.version == result.version + 1
 
     async def test_update_returns_none(self, session: AsyncSession):
         mapper = BookModelMapper()
@@ -308,4 +364,265 @@ class TestBookRepository:
 
         results = await repository.find_all(filters=filters)
         assert len(results) == 1
-        assert results[0].title == entity2.title
\ No newline at end of file
+        assert results[0].title == entity2.title
+
+    async def test_find_all_keyset_pagination(self, session: AsyncSession):
+        mapper = BookModelMapper()
+        repository = BookRepository(
+            mapper=mapper,
+            session=session
+        )
+
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            for title, year in (("Alpha", 2001), ("Beta", None), ("Gamma", 1999)):
+                await repository.create(entity=BookCreateEntity(
+                    title=title,
+                    slug=title.lower(),
+                    genre=Genre.FANTASY,
+                    language="Русский",
+                    publish_year=year
+                ))
+
+        first_page = await repository.find_all(filters=BookFilterEntity(limit=2))
+        assert [book.title for book in first_page] == ["Alpha", "Beta"]
+
+        last = first_page[-1]
+        second_page = await repository.find_all(filters=BookFilterEntity(
+            limit=2,
+            after_value=last.title,
+            after_id=last.id
+        ))
+        assert [book.title for book in second_page] == ["Gamma"]
+
+        by_year = await repository.find_all(filters=BookFilterEntity(sort=BookSortField.PUBLISH_YEAR))
+        assert [book.title for book in by_year] == ["Beta", "Gamma", "Alpha"]
+
+        after_year = await repository.find_all(filters=BookFilterEntity(
+            sort=BookSortField.PUBLISH_YEAR,
+            after_value=1999,
+            after_id=by_year[1].id
+        ))
+        assert [book.title for book in after_year] == ["Alpha"]
+
+    async def test_bulk_create_skips_existing(self, session: AsyncSession):
+        mapper = BookModelMapper()
+        repository = BookRepository(
+            mapper=mapper,
+            session=session
+        )
+
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            await repository.create(entity=BookCreateEntity(
+                title="Alpha",
+                slug="alpha",
+                genre=Genre.FANTASY,
+                language="Русский"
+            ))
+
+        entities = [
+            BookCreateEntity(title=title, slug=title.lower(), genre=Genre.DETECTIVE, language="English")
+            for title in ("Alpha", "Beta", "Gamma")
+        ]
+
+        async with uow:
+            created = await repository.bulk_create(entities=entities)
+
+        assert created == {"beta", "gamma"}
+
+        result = await repository.find_by_slug(slug="gamma")
+        assert result is not None
+        assert result.genre == Genre.DETECTIVE
+        assert result.language == "English"
+
+    async def test_stream_all_with_filters(self, session: AsyncSession):
+        mapper = BookModelMapper()
+        repository = BookRepository(
+            mapper=mapper,
+            session=session
+        )
+
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            for title, year in (("Alpha", 2001), ("Beta", 1990), ("Gamma", 2010)):
+                await repository.create(entity=BookCreateEntity(
+                    title=title,
+                    slug=title.lower(),
+                    genre=Genre.FANTASY,
+                    language="Русский",
+                    publish_year=year
+                ))
+
+        results = [
+            entity
+            async for entity in repository.stream_all(filters=BookFilterEntity(year_from=2000), batch_size=1)
+        ]
+
+        assert sorted(entity.slug for entity in results) == ["alpha", "gamma"]
+
+
+@pytest.mark.asyncio
+class TestBooksEndpoints:
+    async def test_get_books_conditional(self, session: AsyncSession, client: AsyncClient):
+        repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=session
+        )
+
+        async with SQLAlchemyUoW(session):
+            book = await repository.create(entity=BookCreateEntity(
+                title="Alpha",
+                slug="alpha",
+                genre=Genre.FANTASY,
+                language="Русский"
+            ))
+
+        response = await client.get("/v1/books")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"]
+        assert response.headers["last-modified"]
+
+        response = await client.get("/v1/books", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        use_case = UpdateBookUseCase(
+            mapper=BookSchemaMapper(),
+            book_repository=repository,
+            author_repository=AuthorRepository(mapper=AuthorModelMapper(), session=session),
+            uow=SQLAlchemyUoW(session),
+            cache=await get_cache_manager()
+        )
+        await use_case.execute(
+            book_id=book.id,
+            data=BookUpdateRequest(genre=Genre.FANTASY, language="English")
+        )
+
+        response = await client.get("/v1/books", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_read_endpoints_query_budget(self, session: AsyncSession, client: AsyncClient):
+        repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=session
+        )
+
+        async with SQLAlchemyUoW(session):
+            for index in range(5):
+                await repository.create(entity=BookCreateEntity(
+                    title=f"Book {index}",
+                    slug=f"book-{index}",
+                    genre=Genre.FANTASY,
+                    language="Русский"
+                ))
+
+        with assert_max_queries(1):
+            response = await client.get("/v1/books")
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 5
+        assert response.headers["server-timing"].startswith("db;dur=")
+
+        with assert_max_queries(1):
+            response = await client.get("/v1/books/book-0")
+
+        assert response.status_code == 200
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+class TestBookRepositoryPostgres:
+    async def test_bulk_create_copies_through_staging_table(self, postgres_session: AsyncSession):
+        repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=postgres_session
+        )
+        author_repository = AuthorRepository(
+            mapper=AuthorModelMapper(),
+            session=postgres_session
+        )
+        uow = SQLAlchemyUoW(postgres_session)
+
+        async with uow:
+            author = await author_repository.create(
+                entity=AuthorCreateEntity(
+                    name="Thomas Shelby",
+                    slug="thomas-shelby",
+                    bio=None,
+                    birth_date=None,
+                    death_date=None,
+                    country=None
+                )
+            )
+            await repository.create(entity=BookCreateEntity(
+                title="Alpha",
+                slug="alpha",
+                genre=Genre.FANTASY,
+                language="Русский"
+            ))
+
+        entities = [
+            BookCreateEntity(title="Alpha", slug="alpha", genre=Genre.FANTASY, language="Русский"),
+            BookCreateEntity(
+                title="Beta",
+                slug="beta",
+                genre=Genre.SCIENCE_FICTION,
+                language="English",
+                short_description="Short",
+                publish_year=1999,
+                page_count=320,
+                author_id=author.id
+            ),
+            BookCreateEntity(title="Gamma", slug="gamma", genre=Genre.DETECTIVE, language="Русский")
+        ]
+
+        async with uow:
+            created = await repository.bulk_create(entities=entities)
+
+        assert created == {"beta", "gamma"}
+
+        result = await repository.find_by_slug(slug="beta")
+        assert result.genre == Genre.SCIENCE_FICTION
+        assert result.author_id == author.id
+        assert result.publish_year == 1999
+        assert result.page_count == 320
+        assert result.version == 1
+        assert result.rating.count == 0
+        assert result.updated_at is not None
+
+        async with uow:
+            created = await repository.bulk_create(entities=[
+                BookCreateEntity(title="Delta", slug="delta", genre=Genre.ROMANCE, language="Русский")
+            ])
+
+        assert created == {"delta"}
+
+    async def test_bulk_create_rolls_back_failed_batch(self, postgres_session: AsyncSession):
+        repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=postgres_session
+        )
+
+        entities = [
+            BookCreateEntity(title="Alpha", slug="alpha", genre=Genre.FANTASY, language="Русский"),
+            BookCreateEntity(
+                title="Beta",
+                slug="beta",
+                genre=Genre.FANTASY,
+                language="Русский",
+                author_id=uuid.uuid4()
+            )
+        ]
+
+        with pytest.raises(BookBulkCreateException):
+            async with SQLAlchemyUoW(postgres_session):
+                await repository.bulk_create(entities=entities)
+
+        assert await repository.find_by_slug(slug="alpha") is None
@@ -1,40 +1,47 @@
+import io
+import threading
 import uuid
+from contextlib import asynccontextmanager
 from unittest.mock import create_autospec, AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.schemas.requests.books import BooksQuery, BookCreateRequest, BookUpdateRequest
-from src.adapters.schemas.responses.books import BookResponse
+from src.adapters.conditional import build_etag
+from src.adapters.schemas.requests.books import BooksQuery, BookCreateRequest, BookUpdateRequest, BooksExportQuery
+from src.adapters.schemas.responses.books import BookResponse, BookPageResponse
 from src.application.usecases.books import GetBooksUseCase, FindBookBySlugUseCase, DeleteBookUseCase, CreateBookUseCase, \
-    UpdateBookUseCase
+    UpdateBookUseCase, ImportBooksUseCase, ExportBooksUseCase
+from src.core.database.routing import primary_reads
 from src.core.uow import SQLAlchemyUoW
 from src.domain.author.exceptions import AuthorNotExistException
 from src.domain.author.protocols import AuthorRepositoryProtocol
 from src.domain.books.entities import BookFilterEntity, BookCreateEntity, BookUpdateEntity, BookEntity
-from src.domain.books.enums import Genre
-from src.domain.books.exceptions import BookNotExistException, BookAlreadyExistException
+from src.domain.books.enums import Genre, BookSortField, BookFileFormat
+from src.domain.books.exceptions import BookNotExistException, BookAlreadyExistException, BookBulkCreateException
 from src.domain.books.mappers import BookSchemaMapper
 from src.domain.books.protocols import BookRepositoryProtocol
 from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.pagination.exceptions import InvalidCursorException
 
 
 @pytest.mark.asyncio
 class TestGetBooksUseCase:
-    async def test_execute_success(self):
+    async def test_execute_success(self, load_through_cache):
         repository = create_autospec(BookRepositoryProtocol, instance=True)
         mapper = create_autospec(BookSchemaMapper, instance=True)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         query = BooksQuery(
             genre=None,
-            limit=None,
+            limit=20,
             year_from=None,
             year_to=None,
             pages_to=None,
             pages_from=None
         )
 
-        filters_entity = BookFilterEntity(**query.model_dump())
+        filters_entity = BookFilterEntity(limit=21)
         find_all_results = [object()]
         use_case_result = [
             BookResponse(
@@ -53,22 +60,95 @@ class TestGetBooksUseCase:
 
         repository.find_all.return_value = find_all_results
         mapper.from_entity_to_schema.return_value = use_case_result[0]
+        cache_manager.get_or_load.side_effect = load_through_cache
 
         use_case = GetBooksUseCase(
             repository=repository,
-            mapper=mapper
+            mapper=mapper,
+            cache=cache_manager
         )
 
-        result = await use_case.execute(filters=query)
-        assert result == use_case_result
+        result = BookPageResponse.model_validate_json((await use_case.execute(filters=query)).body)
+        assert result.items == use_case_result
+        assert result.next_cursor is None
+        assert cache_manager.get_or_load.await_args.kwargs["tags"] == ["books:list"]
 
         repository.find_all.assert_awaited_once_with(filters=filters_entity)
         mapper.from_entity_to_schema.assert_called_once_with(entity=find_all_results[0])
 
+    async def test_execute_returns_next_cursor(self, load_through_cache):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        mapper = BookSchemaMapper()
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+        cache_manager.get_or_load.side_effect = load_through_cache
+
+        entities = [
+            BookEntity(
+                id=uuid.uuid4(),
+                title=f"Book {index}",
+                slug=f"book-{index}",
+                language="Русский",
+                genre=Genre.FANTASY,
+                publish_year=2000 + index
+            )
+            for index in range(3)
+        ]
+        repository.find_all.return_value = entities
+
+        use_case = GetBooksUseCase(
+            repository=repository,
+            mapper=mapper,
+            cache=cache_manager
+        )
+
+        query = BooksQuery(limit=2, sort=BookSortField.PUBLISH_YEAR)
+        result = BookPageResponse.model_validate_json((await use_case.execute(filters=query)).body)
+
+        assert [item.id for item in result.items] == [entities[0].id, entities[1].id]
+        assert result.next_cursor is not None
+
+        repository.find_all.reset_mock()
+        repository.find_all.return_value = []
+
+        await use_case.execute(filters=BooksQuery(
+            limit=2,
+            sort=BookSortField.PUBLISH_YEAR,
+            cursor=result.next_cursor
+        ))
+
+        filters = repository.find_all.await_args.kwargs["filters"]
+        assert filters.after_value == entities[1].publish_year
+        assert filters.after_id == entities[1].id
+
+    async def test_execute_invalid_cursor(self):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        mapper = create_autospec(BookSchemaMapper, instance=True)
+
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        use_case = GetBooksUseCase(
+            repository=repository,
+            mapper=mapper,
+            cache=cache_manager
+        )
+
+        with pytest.raises(InvalidCursorException):
+            await use_case.execute(filters=BooksQuery(cursor="not-a-cursor"))
+
+        repository.find_all.assert_not_awaited()
+        cache_manager.get_or_load.assert_not_awaited()
+
+    async def test_cache_key_normalizes_query(self):
+        key = GetBooksUseCase.build_cache_key(filters=BooksQuery())
+
+        assert key == GetBooksUseCase.build_cache_key(filters=BooksQuery(limit=20, sort=BookSortField.TITLE))
+        assert key != GetBooksUseCase.build_cache_key(filters=BooksQuery(genre=Genre.FANTASY))
+        assert key.startswith("books:list:")
+
 
 @pytest.mark.asyncio
 class TestFindBookBySlugUseCase:
-    async def test_execute_success(self):
+    async def test_execute_success(self, load_through_cache):
         repository = create_autospec(BookRepositoryProtocol, instance=True)
         mapper = create_autospec(BookSchemaMapper, instance=True)
         cache_manager = create_autospec(CacheManagerProtocol, instance=True)
@@ -76,12 +156,17 @@ class TestFindBookBySlugUseCase:
         slug = "thomas-shelby"
 
         entity = object()
-        response = create_autospec(BookResponse, instance=True)
-        response.model_dump.return_value = object()
+        response = BookResponse(
+            id=uuid.uuid4(),
+            title="Thomas Shelby",
+            slug=slug,
+            genre=Genre.FANTASY,
+            language="Русский"
+        )
 
         repository.find_by_slug.return_value = entity
         mapper.from_entity_to_schema.return_value = response
-        cache_manager.get_json.return_value = None
+        cache_manager.get_or_load.side_effect = load_through_cache
 
         use_case = FindBookBySlugUseCase(
             repository=repository,
@@ -90,19 +175,69 @@ class TestFindBookBySlugUseCase:
         )
 
         result = await use_case.execute(slug=slug)
-        assert result == response
+        assert BookResponse.model_validate_json(result.body) == response
+        assert result.content_length == len(result.body)
+        assert result.etag == build_etag(response.id, response.version)
 
         repository.find_by_slug.assert_awaited_once_with(slug=slug)
         mapper.from_entity_to_schema.assert_called_once_with(entity=entity)
 
-    async def test_execute_book_not_found(self):
+    async def test_refresh_uses_own_repository(self, refresh_through_cache):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        refresh_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        mapper = create_autospec(BookSchemaMapper, instance=True)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        slug = "thomas-shelby"
+        refresh_repository.find_by_slug.return_value = None
+        cache_manager.get_or_load.side_effect = refresh_through_cache
+
+        @asynccontextmanager
+        async def repository_factory():
+            yield refresh_repository
+
+        use_case = FindBookBySlugUseCase(
+            repository=repository,
+            mapper=mapper,
+            cache=cache_manager,
+            repository_factory=repository_factory
+        )
+
+        with pytest.raises(BookNotExistException):
+            await use_case.execute(slug=slug)
+
+        repository.find_by_slug.assert_not_awaited()
+        refresh_repository.find_by_slug.assert_awaited_once_with(slug=slug)
+
+    async def test_cache_load_reads_from_primary(self, load_through_cache):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        mapper = create_autospec(BookSchemaMapper, instance=True)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        reads = []
+        repository.find_by_slug.side_effect = lambda slug: reads.append(primary_reads.get())
+        cache_manager.get_or_load.side_effect = load_through_cache
+
+        use_case = FindBookBySlugUseCase(
+            repository=repository,
+            mapper=mapper,
+            cache=cache_manager
+        )
+
+        with pytest.raises(BookNotExistException):
+            await use_case.execute(slug="thomas-shelby")
+
+        assert reads == [True]
+        assert not primary_reads.get()
+
+    async def test_execute_book_not_found(self, load_through_cache):
         repository = create_autospec(BookRepositoryProtocol, instance=True)
         mapper = create_autospec(BookSchemaMapper, instance=True)
         cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         slug = "thomas-shelby"
         repository.find_by_slug.return_value = None
-        cache_manager.get_json.return_value = None
+        cache_manager.get_or_load.side_effect = load_through_cache
 
         use_case = FindBookBySlugUseCase(
             repository=repository,
@@ -123,30 +258,35 @@ class TestDeleteBookUseCase:
         repository = create_autospec(BookRepositoryProtocol, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
-        repository.delete_by_id.return_value = True
+        repository.delete_by_id.return_value = "thomas-shelby"
 
         book_id = uuid.uuid4()
         use_case = DeleteBookUseCase(
             repository=repository,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         await use_case.execute(book_id=book_id)
 
         repository.delete_by_id.assert_awaited_once_with(model_id=book_id)
+        cache_manager.invalidate_tags.assert_awaited_once_with(["book:thomas-shelby", "books:list"])
 
     async def test_execute_book_not_found(self):
         repository = create_autospec(BookRepositoryProtocol, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
-        repository.delete_by_id.return_value = False
+        repository.delete_by_id.return_value = None
 
         book_id = uuid.uuid4()
         use_case = DeleteBookUseCase(
             repository=repository,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(BookNotExistException):
@@ -163,6 +303,7 @@ class TestCreateBookUseCase:
         mapper = create_autospec(BookSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         slug = "big-life"
         request = BookCreateRequest(
@@ -210,7 +351,8 @@ class TestCreateBookUseCase:
             book_repository=book_repository,
             author_repository=author_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         result = await use_case.execute(data=request)
@@ -226,6 +368,7 @@ class TestCreateBookUseCase:
         mapper = create_autospec(BookSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         slug = "big-life"
         author_id = uuid.uuid4()
@@ -276,7 +419,8 @@ class TestCreateBookUseCase:
             book_repository=book_repository,
             author_repository=author_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         result = await use_case.execute(data=request)
@@ -292,6 +436,7 @@ class TestCreateBookUseCase:
         mapper = create_autospec(BookSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         author_id = uuid.uuid4()
 
@@ -312,7 +457,8 @@ class TestCreateBookUseCase:
             book_repository=book_repository,
             author_repository=author_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(AuthorNotExistException):
@@ -330,6 +476,7 @@ class TestCreateBookUseCase:
         mapper = create_autospec(BookSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         slug = "big-life"
         author_id = uuid.uuid4()
@@ -363,7 +510,8 @@ class TestCreateBookUseCase:
             book_repository=book_repository,
             author_repository=author_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(BookAlreadyExistException):
@@ -599,4 +747,239 @@ class TestUpdateBookUseCase:
 
         author_repository.find_by_id.assert_awaited_once_with(model_id=author_id)
         book_repository.update.assert_awaited_once_with(entity=update_entity)
-        mapper.from_entity_to_schema.assert_not_called()
\ No newline at end of file
+        mapper.from_entity_to_schema.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestImportBooksUseCase:
+    async def test_execute_reports_row_errors(self):
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        author_repository = create_autospec(AuthorRepositoryProtocol, instance=True)
+        fake_session = create_autospec(AsyncSession, instance=True)
+        uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        author_id = uuid.uuid4()
+        missing_author_id = uuid.uuid4()
+
+        stream = io.StringIO(
+            "title,genre,author_id,page_count\n"
+            f"Alpha,fantasy,{author_id},100\n"
+            "Beta,unknown,,\n"
+            f"Gamma,detective,{missing_author_id},\n"
+            "alpha,fantasy,,\n"
+            "Delta,romance,,\n"
+            "!!!,fantasy,,\n"
+        )
+
+        author_repository.find_existing_ids.return_value = {author_id}
+        book_repository.bulk_create.return_value = {"alpha"}
+
+        use_case = ImportBooksUseCase(
+            book_repository=book_repository,
+            author_repository=author_repository,
+            uow=uow,
+            cache=cache_manager
+        )
+
+        result = await use_case.execute(stream=stream, fmt=BookFileFormat.CSV)
+
+        assert result.created == 1
+        assert result.failed == 5
+        assert [error.line for error in result.errors] == [3, 4, 5, 7, 6]
+        assert result.errors[2].message == "Книга с таким slug уже есть в файле"
+        assert result.errors[3].message == "Не удалось получить slug из названия книги"
+
+        author_repository.find_existing_ids.assert_awaited_once_with(ids={author_id, missing_author_id})
+        entities = book_repository.bulk_create.await_args.kwargs["entities"]
+        assert [entity.slug for entity in entities] == ["alpha", "delta"]
+        assert entities[0].author_id == author_id
+        assert entities[0].page_count == 100
+
+    async def test_execute_batches_ndjson(self):
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        author_repository = create_autospec(AuthorRepositoryProtocol, instance=True)
+        fake_session = create_autospec(AsyncSession, instance=True)
+        uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        stream = io.StringIO(
+            '{"title": "Alpha", "genre": "fantasy"}\n'
+            "not json\n"
+            '{"title": "Beta", "genre": "romance"}\n'
+            "\n"
+            '{"title": "Gamma", "genre": "detective"}\n'
+        )
+
+        author_repository.find_existing_ids.return_value = set()
+        book_repository.bulk_create.side_effect = lambda entities: {entity.slug for entity in entities}
+
+        use_case = ImportBooksUseCase(
+            book_repository=book_repository,
+            author_repository=author_repository,
+            uow=uow,
+            cache=cache_manager,
+            batch_size=2
+        )
+
+        result = await use_case.execute(stream=stream, fmt=BookFileFormat.NDJSON)
+
+        assert result.created == 3
+        assert result.failed == 1
+        assert result.errors[0].line == 2
+        assert book_repository.bulk_create.await_count == 2
+
+    async def test_execute_rejects_out_of_range_values(self):
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        author_repository = create_autospec(AuthorRepositoryProtocol, instance=True)
+        uow = SQLAlchemyUoW(create_autospec(AsyncSession, instance=True))
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        stream = io.StringIO(
+            "title,genre,publish_year,page_count\n"
+            "Alpha,fantasy,2001,100\n"
+            "Beta,fantasy,3000000000,\n"
+            "Gamma,fantasy,,-5\n"
+        )
+
+        author_repository.find_existing_ids.return_value = set()
+        book_repository.bulk_create.side_effect = lambda entities: {entity.slug for entity in entities}
+
+        use_case = ImportBooksUseCase(
+            book_repository=book_repository,
+            author_repository=author_repository,
+            uow=uow,
+            cache=cache_manager
+        )
+
+        result = await use_case.execute(stream=stream, fmt=BookFileFormat.CSV)
+
+        assert result.created == 1
+        assert [error.line for error in result.errors] == [3, 4]
+        assert result.errors[0].message.startswith("publish_year:")
+        assert result.errors[1].message.startswith("page_count:")
+
+    async def test_execute_reports_failed_batch_and_continues(self):
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        author_repository = create_autospec(AuthorRepositoryProtocol, instance=True)
+        fake_session = create_autospec(AsyncSession, instance=True)
+        uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        stream = io.StringIO(
+            '{"title": "Alpha", "genre": "fantasy"}\n'
+            '{"title": "Beta", "genre": "romance"}\n'
+            '{"title": "Gamma", "genre": "detective"}\n'
+        )
+
+        author_repository.find_existing_ids.return_value = set()
+        book_repository.bulk_create.side_effect = [BookBulkCreateException(), {"gamma"}]
+
+        use_case = ImportBooksUseCase(
+            book_repository=book_repository,
+            author_repository=author_repository,
+            uow=uow,
+            cache=cache_manager,
+            batch_size=2
+        )
+
+        result = await use_case.execute(stream=stream, fmt=BookFileFormat.NDJSON)
+
+        assert result.created == 1
+        assert result.failed == 2
+        assert [error.line for error in result.errors] == [1, 2]
+        assert result.errors[0].message == BookBulkCreateException().message
+        fake_session.rollback.assert_awaited_once()
+        assert fake_session.commit.await_count == 1
+
+    async def test_execute_parses_off_the_event_loop(self):
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+        author_repository = create_autospec(AuthorRepositoryProtocol, instance=True)
+        uow = SQLAlchemyUoW(create_autospec(AsyncSession, instance=True))
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+
+        threads = set()
+
+        class TrackingStream(io.StringIO):
+            def __next__(self):
+                threads.add(threading.get_ident())
+                return super().__next__()
+
+        stream = TrackingStream(
+            '{"title": "Alpha", "genre": "fantasy"}\n'
+            '{"title": "Beta", "genre": "romance"}\n'
+        )
+
+        author_repository.find_existing_ids.return_value = set()
+        book_repository.bulk_create.side_effect = lambda entities: {entity.slug for entity in entities}
+
+        use_case = ImportBooksUseCase(
+            book_repository=book_repository,
+            author_repository=author_repository,
+            uow=uow,
+            cache=cache_manager,
+            batch_size=1
+        )
+
+        result = await use_case.execute(stream=stream, fmt=BookFileFormat.NDJSON)
+
+        assert result.created == 2
+        assert threads
+        assert threading.get_ident() not in threads
+
+
+async def iterate(*items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+class TestExportBooksUseCase:
+    @staticmethod
+    def build_entity(title: str) -> BookEntity:
+        return BookEntity(
+            id=uuid.uuid4(),
+            title=title,
+            slug=title.lower(),
+            language="Русский",
+            genre=Genre.FANTASY,
+            publish_year=2001
+        )
+
+    async def test_execute_ndjson_in_batches(self):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        entities = [self.build_entity(title) for title in ("Alpha", "Beta", "Gamma")]
+        repository.stream_all.return_value = iterate(*entities)
+
+        use_case = ExportBooksUseCase(
+            mapper=BookSchemaMapper(),
+            repository=repository,
+            batch_size=2
+        )
+
+        chunks = [chunk async for chunk in use_case.execute(filters=BooksExportQuery(genre=Genre.FANTASY))]
+
+        assert len(chunks) == 2
+        lines = "".join(chunks).splitlines()
+        assert [BookResponse.model_validate_json(line).slug for line in lines] == ["alpha", "beta", "gamma"]
+        repository.stream_all.assert_called_once_with(
+            filters=BookFilterEntity(genre=Genre.FANTASY),
+            batch_size=2
+        )
+
+    async def test_execute_csv(self):
+        repository = create_autospec(BookRepositoryProtocol, instance=True)
+        entity = self.build_entity("Alpha")
+        repository.stream_all.return_value = iterate(entity)
+
+        use_case = ExportBooksUseCase(
+            mapper=BookSchemaMapper(),
+            repository=repository
+        )
+
+        chunks = [chunk async for chunk in use_case.execute(filters=BooksExportQuery(format=BookFileFormat.CSV))]
+
+        header, row = "".join(chunks).splitlines()
+        assert header.split(",") == list(ExportBooksUseCase.csv_header)
+        assert row == f"{entity.id},Alpha,alpha,Русский,fantasy,,,2001,,,,0"
+
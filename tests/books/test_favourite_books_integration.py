@@ -1,20 +1,24 @@
+import uuid
+
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.uow import SQLAlchemyUoW
 from src.domain.books.entities import BookCreateEntity, BookEntity
 from src.domain.books.enums import Genre, BookReadingStatus
-from src.domain.books.exceptions import FavouriteBookRepositoryException
+from src.core.observability.queries import track_queries
+from src.domain.books.exceptions import FavouriteBookRepositoryException, FavouriteBookAlreadyExistException
 from src.domain.user.entities import UserEntity, UserCreateEntity
 from src.domain.user.enums import UserRole
 from src.infrastructure.database.books.mappers import BookModelMapper, FavouriteBookModelMapper
+from src.infrastructure.database.books.models import FavouriteBookModel
 from src.infrastructure.database.books.repositories import BookRepository, FavouriteBookRepository
 from src.infrastructure.database.user.mappers import UserModelMapper
 from src.infrastructure.database.user.repositories import UserRepository
 
 
-@pytest.fixture
-async def book_entity(session: AsyncSession) -> BookEntity:
+async def create_book(session: AsyncSession) -> BookEntity:
     mapper = BookModelMapper()
     repository = BookRepository(
         session=session,
@@ -36,8 +40,7 @@ async def book_entity(session: AsyncSession) -> BookEntity:
     return result
 
 
-@pytest.fixture
-async def user_entity(session: AsyncSession) -> UserEntity:
+async def create_user(session: AsyncSession) -> UserEntity:
     mapper = UserModelMapper()
     repository = UserRepository(
         session=session,
@@ -60,6 +63,16 @@ async def user_entity(session: AsyncSession) -> UserEntity:
     return result
 
 
+@pytest.fixture
+async def book_entity(session: AsyncSession) -> BookEntity:
+    return await create_book(session)
+
+
+@pytest.fixture
+async def user_entity(session: AsyncSession) -> UserEntity:
+    return await create_user(session)
+
+
 @pytest.mark.asyncio
 class TestFavouriteBookRepository:
     async def test_add_success(
@@ -112,6 +125,36 @@ class TestFavouriteBookRepository:
                     book_id=book_entity.id
                 )
 
+    async def test_select_from_written_cte_loads_book(
+            self,
+            session: AsyncSession,
+            user_entity: UserEntity,
+            book_entity: BookEntity
+    ):
+        repository = FavouriteBookRepository(
+            mapper=FavouriteBookModelMapper(mapper=BookModelMapper()),
+            session=session
+        )
+
+        async with SQLAlchemyUoW(session):
+            added = await repository.add(
+                user_id=user_entity.id,
+                book_id=book_entity.id
+            )
+
+        written = (
+            select(*FavouriteBookModel.__table__.columns)
+            .where(FavouriteBookModel.id == added.id)
+            .cte("written_favourite_book")
+        )
+
+        session.expunge_all()
+        result = await session.execute(repository.build_select(source=written))
+        model = result.scalar_one()
+
+        assert "book" in model.__dict__
+        assert repository.mapper.from_model_to_entity(model=model) == added
+
     async def test_delete_returns_true(
             self,
             session: AsyncSession,
@@ -251,4 +294,47 @@ class TestFavouriteBookRepository:
                 status=BookReadingStatus.READING
             )
 
-            assert result is None
\ No newline at end of file
+            assert result is None
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+class TestFavouriteBookRepositoryPostgres:
+    async def test_add_and_update_status_in_single_statement(self, postgres_session: AsyncSession):
+        book = await create_book(postgres_session)
+        user = await create_user(postgres_session)
+        repository = FavouriteBookRepository(
+            mapper=FavouriteBookModelMapper(mapper=BookModelMapper()),
+            session=postgres_session
+        )
+
+        async with SQLAlchemyUoW(postgres_session):
+            with track_queries() as stats:
+                added = await repository.add(user_id=user.id, book_id=book.id)
+
+            assert stats.count == 1
+            assert added.book.id == book.id
+            assert added.book.title == book.title
+
+            with pytest.raises(FavouriteBookAlreadyExistException):
+                await repository.add(user_id=user.id, book_id=book.id)
+
+            with track_queries() as stats:
+                updated = await repository.update_status(
+                    user_id=user.id,
+                    book_id=book.id,
+                    status=BookReadingStatus.READING
+                )
+
+            assert stats.count == 1
+            assert updated.id == added.id
+            assert updated.status == BookReadingStatus.READING
+            assert updated.book.id == book.id
+
+            missing = await repository.update_status(
+                user_id=user.id,
+                book_id=uuid.uuid4(),
+                status=BookReadingStatus.READING
+            )
+
+            assert missing is None
@@ -2,6 +2,8 @@ import uuid
 from unittest.mock import create_autospec, AsyncMock, Mock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.usecases.books import AddFavouriteBookUseCase, DeleteFavouriteBookUseCase, \
@@ -10,9 +12,11 @@ from src.core.uow import SQLAlchemyUoW
 from src.domain.books.entities import BookEntity, FavouriteBookEntity
 from src.domain.books.enums import BookReadingStatus
 from src.domain.books.exceptions import BookNotExistException, FavouriteBookAlreadyExistException, \
-    FavouriteBookNotExistException
+    FavouriteBookNotExistException, FavouriteBookRepositoryException
 from src.domain.books.mappers import FavouriteBookSchemaMapper
 from src.domain.books.protocols import BookRepositoryProtocol, FavouriteBookRepositoryProtocol
+from src.infrastructure.database.books.mappers import FavouriteBookModelMapper, BookModelMapper
+from src.infrastructure.database.books.repositories import FavouriteBookRepository
 
 
 @pytest.mark.asyncio
@@ -404,4 +408,92 @@ class TestUpdateFavouriteBookStatusUseCase:
             book_id=book_id,
             status=BookReadingStatus.READING
         )
-        mapper.from_entity_to_schema.assert_not_called()
\ No newline at end of file
+        mapper.from_entity_to_schema.assert_not_called()
+
+
+class TestFavouriteBookRepositoryStatements:
+    @staticmethod
+    def build_repository() -> FavouriteBookRepository:
+        return FavouriteBookRepository(
+            mapper=FavouriteBookModelMapper(mapper=BookModelMapper()),
+            session=create_autospec(AsyncSession, instance=True)
+        )
+
+    def test_add_statement_is_single_round_trip(self):
+        statement = self.build_repository().build_add_statement(user_id=uuid.uuid4(), book_id=uuid.uuid4())
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH written_favourite_book AS")
+        assert "ON CONFLICT ON CONSTRAINT uq_user_book_favourite DO NOTHING RETURNING" in sql
+        assert "JOIN books ON books.id = written_favourite_book.book_id" in sql
+
+    def test_update_status_statement_is_single_round_trip(self):
+        statement = self.build_repository().build_update_status_statement(
+            user_id=uuid.uuid4(),
+            book_id=uuid.uuid4(),
+            status=BookReadingStatus.READING
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH written_favourite_book AS \n(UPDATE favourite_books")
+        assert "JOIN books ON books.id = written_favourite_book.book_id" in sql
+
+    @staticmethod
+    def build_postgres_repository(result: Mock) -> FavouriteBookRepository:
+        session = create_autospec(AsyncSession, instance=True)
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.execute = AsyncMock(return_value=result)
+
+        return FavouriteBookRepository(
+            mapper=create_autospec(FavouriteBookModelMapper, instance=True),
+            session=session
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_on_postgres_maps_written_favourite(self):
+        model = Mock()
+        result = Mock()
+        result.scalar_one_or_none.return_value = model
+        repository = self.build_postgres_repository(result)
+
+        added = await repository.add(user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        repository.session.execute.assert_awaited_once()
+        sql = str(repository.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_user_book_favourite DO NOTHING" in sql
+        repository.mapper.from_model_to_entity.assert_called_once_with(model=model)
+        assert added == repository.mapper.from_model_to_entity.return_value
+
+    @pytest.mark.asyncio
+    async def test_add_on_postgres_detects_duplicate(self):
+        result = Mock()
+        result.scalar_one_or_none.return_value = None
+        repository = self.build_postgres_repository(result)
+
+        with pytest.raises(FavouriteBookAlreadyExistException):
+            await repository.add(user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        repository.mapper.from_model_to_entity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_on_postgres_wraps_integrity_error(self):
+        repository = self.build_postgres_repository(Mock())
+        repository.session.execute.side_effect = IntegrityError("INSERT", {}, Exception("fk"))
+
+        with pytest.raises(FavouriteBookRepositoryException):
+            await repository.add(user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_update_status_on_postgres_returns_none_when_missing(self):
+        result = Mock()
+        result.scalar_one_or_none.return_value = None
+        repository = self.build_postgres_repository(result)
+
+        result = await repository.update_status(
+            user_id=uuid.uuid4(),
+            book_id=uuid.uuid4(),
+            status=BookReadingStatus.READING
+        )
+
+        assert result is None
+        repository.session.execute.assert_awaited_once()
@@ -0,0 +1,315 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.responses import FastJSONResponse, EncodedResponse
+from src.adapters.schemas.responses.author import AuthorResponse
+from src.core import serialization
+from src.infrastructure.cache.local import LocalCache
+from src.infrastructure.cache.manager import RedisCacheManager, TwoTierCacheManager, build_entry, \
+    background_tasks
+from src.infrastructure.cache.singleflight import SingleFlight
+
+
+class TestLocalCache:
+    def test_evicts_least_recently_used_by_entries(self):
+        cache = LocalCache(max_entries=2, max_bytes=1024)
+
+        cache.set("a", 1, size=1, ttl=60)
+        cache.set("b", 2, size=1, ttl=60)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3, size=1, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_evicts_by_bytes(self):
+        cache = LocalCache(max_entries=10, max_bytes=10)
+
+        cache.set("a", 1, size=6, ttl=60)
+        cache.set("b", 2, size=6, ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.current_bytes == 6
+
+    def test_skips_oversized_and_expired(self):
+        cache = LocalCache(max_entries=10, max_bytes=10)
+
+        cache.set("big", 1, size=11, ttl=60)
+        cache.set("expired", 2, size=1, ttl=-1)
+
+        assert cache.get("big") is None
+        assert cache.get("expired") is None
+        assert len(cache) == 0
+
+
+class TestSerialization:
+    def test_dumps_pydantic_and_builtin_types(self):
+        author_id = uuid.uuid4()
+        value = {"id": author_id, "author": AuthorResponse(id=author_id, name="Имя", slug="imya")}
+
+        raw = serialization.dumps(value)
+
+        assert isinstance(raw, bytes)
+        assert "Имя".encode() in raw
+        assert serialization.loads(raw)["author"]["id"] == str(author_id)
+
+    def test_stdlib_fallback_matches(self, monkeypatch: pytest.MonkeyPatch):
+        value = {"id": uuid.uuid4(), "name": "Имя", "items": [1, None, True]}
+        expected = serialization.dumps(value)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialization.dumps(value) == expected
+        assert serialization.loads(expected.decode()) == serialization.loads(expected)
+
+    def test_response_passes_pre_encoded_body_through(self):
+        raw = b'{"id":1}'
+
+        assert FastJSONResponse(content=raw).body == raw
+        assert FastJSONResponse(content={"id": 1}).body == raw
+
+
+@pytest.mark.asyncio
+class TestTwoTierCacheManager:
+    @staticmethod
+    def build_manager(redis_client: AsyncMock, xfetch_beta: float = 1.0) -> TwoTierCacheManager:
+        return TwoTierCacheManager(
+            redis_manager=RedisCacheManager(redis_client),
+            local_cache=LocalCache(max_entries=10, max_bytes=1024 * 1024),
+            single_flight=SingleFlight(),
+            local_ttl=30,
+            invalidation_channel="cache:invalidate",
+            lock_ttl=5,
+            lock_wait_seconds=0.5,
+            lock_poll_interval_seconds=0.01,
+            xfetch_beta=xfetch_beta
+        )
+
+    async def test_get_model_served_from_local_cache(self):
+        redis_client = AsyncMock()
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        redis_client.get.return_value = build_entry(value=author, ttl=60).model_dump_json()
+
+        first = await manager.get_model("author:slug:thomas-shelby", AuthorResponse)
+        second = await manager.get_model("author:slug:thomas-shelby", AuthorResponse)
+
+        assert first == author
+        assert second is first
+        redis_client.get.assert_awaited_once_with("author:slug:thomas-shelby")
+
+    async def test_set_model_populates_both_tiers(self):
+        redis_client = AsyncMock()
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        await manager.set_model("author:slug:thomas-shelby", author, ttl=120)
+
+        key, raw = redis_client.set.await_args.args
+        assert key == "author:slug:thomas-shelby"
+        assert redis_client.set.await_args.kwargs == {"ex": 120}
+        assert author.model_dump_json() in raw
+        assert await manager.get_model("author:slug:thomas-shelby", AuthorResponse) is author
+        redis_client.get.assert_not_awaited()
+
+    async def test_encoded_response_round_trips_through_redis(self):
+        redis_client = AsyncMock()
+        author = AuthorResponse(id=uuid.uuid4(), name="Томас Шелби", slug="thomas-shelby")
+        encoded = EncodedResponse.from_model(author)
+
+        await self.build_manager(redis_client).set_model("author:slug:thomas-shelby", encoded, ttl=120)
+        redis_client.get.return_value = redis_client.set.await_args.args[1]
+
+        result = await self.build_manager(redis_client).get_model("author:slug:thomas-shelby", EncodedResponse)
+
+        assert result == encoded
+        assert AuthorResponse.model_validate_json(result.body) == author
+
+    async def test_delete_evicts_and_publishes(self):
+        redis_client = AsyncMock()
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        await manager.set_model("author:slug:thomas-shelby", author, ttl=120)
+        await manager.delete("author:slug:thomas-shelby")
+
+        redis_client.delete.assert_awaited_once_with("author:slug:thomas-shelby")
+        redis_client.publish.assert_awaited_once_with("cache:invalidate", "author:slug:thomas-shelby")
+
+        redis_client.get.return_value = None
+        assert await manager.get_model("author:slug:thomas-shelby", AuthorResponse) is None
+
+    async def test_get_or_load_keys_entries_by_tag_generation(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        redis_client.set.return_value = True
+        redis_client.mget.return_value = ["3", None]
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        loader = AsyncMock(return_value=author)
+
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a", "b"])
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a", "b"])
+
+        loader.assert_awaited_once()
+        redis_client.mget.assert_awaited_once_with(["cache:tag:a", "cache:tag:b"])
+        assert redis_client.set.await_args_list[-1].args[0] == "author:slug:thomas-shelby@3.0"
+
+    async def test_get_or_load_bypasses_cache_without_tag_generations(self):
+        redis_client = AsyncMock()
+        redis_client.mget.side_effect = ConnectionError()
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        loader = AsyncMock(return_value=author)
+
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a"])
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a"])
+
+        assert loader.await_count == 2
+        redis_client.set.assert_not_awaited()
+        assert len(manager.local_cache) == 0
+
+    async def test_invalidate_tags_bumps_generation_and_publishes(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        redis_client.set.return_value = True
+        redis_client.mget.return_value = [None]
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        loader = AsyncMock(return_value=author)
+
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a"])
+        await manager.invalidate_tags(["a"])
+
+        redis_client.incr.assert_awaited_once_with("cache:tag:a")
+        redis_client.publish.assert_awaited_once_with("cache:invalidate", "cache:tag:a")
+
+        redis_client.mget.return_value = ["1"]
+        await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120, tags=["a"])
+
+        assert loader.await_count == 2
+        assert redis_client.set.await_args_list[-1].args[0] == "author:slug:thomas-shelby@1"
+
+    async def test_get_or_load_coalesces_concurrent_misses(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        redis_client.set.return_value = True
+        manager = self.build_manager(redis_client)
+
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return author
+
+        results = await asyncio.gather(*[
+            manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120)
+            for _ in range(10)
+        ])
+
+        assert calls == 1
+        assert all(result == author for result in results)
+        assert len(manager.single_flight) == 0
+
+    async def test_get_or_load_propagates_loader_error(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        redis_client.set.return_value = True
+        manager = self.build_manager(redis_client)
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise LookupError()
+
+        results = await asyncio.gather(*[
+            manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120)
+            for _ in range(3)
+        ], return_exceptions=True)
+
+        assert all(isinstance(result, LookupError) for result in results)
+
+    async def test_get_or_load_waits_for_lock_holder(self):
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = [None, None, build_entry(value=author, ttl=60).model_dump_json()]
+        redis_client.set.return_value = None
+        manager = self.build_manager(redis_client)
+
+        loader = AsyncMock()
+        result = await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=120)
+
+        assert result == author
+        loader.assert_not_awaited()
+        redis_client.eval.assert_not_awaited()
+
+    async def test_get_or_load_serves_stale_and_refreshes(self):
+        stale = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        fresh = stale.model_copy(update={"country": "England"})
+
+        redis_client = AsyncMock()
+        redis_client.get.return_value = build_entry(value=stale, ttl=-1).model_dump_json()
+        redis_client.set.return_value = True
+        manager = self.build_manager(redis_client)
+
+        loader = AsyncMock(return_value=stale)
+        refresh_loader = AsyncMock(return_value=fresh)
+        result = await manager.get_or_load(
+            "author:slug:thomas-shelby",
+            AuthorResponse,
+            loader,
+            ttl=60,
+            stale_ttl=600,
+            refresh_loader=refresh_loader
+        )
+
+        assert result == stale
+        await asyncio.gather(*background_tasks)
+
+        loader.assert_not_awaited()
+        refresh_loader.assert_awaited_once()
+        assert await manager.get_model("author:slug:thomas-shelby", AuthorResponse) == fresh
+        assert redis_client.set.await_args.kwargs == {"ex": 660}
+
+    async def test_get_or_load_reloads_expired_in_foreground_without_refresh_loader(self):
+        stale = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        fresh = stale.model_copy(update={"country": "England"})
+
+        redis_client = AsyncMock()
+        redis_client.get.return_value = build_entry(value=stale, ttl=-1).model_dump_json()
+        redis_client.set.return_value = True
+        manager = self.build_manager(redis_client)
+
+        loader = AsyncMock(return_value=fresh)
+        result = await manager.get_or_load("author:slug:thomas-shelby", AuthorResponse, loader, ttl=60, stale_ttl=600)
+
+        assert result == fresh
+        assert not background_tasks
+        loader.assert_awaited_once()
+
+    async def test_get_or_load_recomputes_early(self):
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        entry = build_entry(value=author, ttl=60, delta=1.0)
+
+        redis_client = AsyncMock()
+        redis_client.get.return_value = entry.model_dump_json()
+        redis_client.set.return_value = True
+
+        lazy_manager = self.build_manager(redis_client, xfetch_beta=0.0)
+        assert not lazy_manager.should_refresh(entry)
+
+        eager_manager = self.build_manager(redis_client, xfetch_beta=1_000_000.0)
+        assert eager_manager.should_refresh(entry)
@@ -1,13 +1,18 @@
-from typing import AsyncGenerator, Any
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Any, Callable, Awaitable
 
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+from sqlalchemy.pool import NullPool
 from starlette import status
 
 from src.main import create_app
 from src.core.database.database import Base, get_session
+from src.core.observability.database import setup_db_timing
 
 
 @pytest.fixture(scope="session")
@@ -20,6 +25,7 @@ def database_url(tmp_path_factory):
 @pytest.fixture(scope="session")
 async def engine(database_url):
     engine = create_async_engine(database_url, echo=False, future=True)
+    setup_db_timing(engine)
     yield engine
     await engine.dispose()
 
@@ -35,8 +41,42 @@ async def create_test_schema(engine):
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(scope="session")
+async def postgres_engine():
+    url = os.getenv("TEST_POSTGRES_URL")
+
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL не задан")
+
+    engine = create_async_engine(url, future=True, poolclass=NullPool)
+    setup_db_timing(engine)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await engine.dispose()
+
+
 @pytest.fixture
 async def session(engine) -> AsyncGenerator[AsyncSession, Any]:
+    async with open_test_session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+async def postgres_session(postgres_engine) -> AsyncGenerator[AsyncSession, Any]:
+    async with open_test_session(postgres_engine) as session:
+        yield session
+
+
+@asynccontextmanager
+async def open_test_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, Any]:
     connection = await engine.connect()
     transaction = await connection.begin()
     nested = await connection.begin_nested()
@@ -147,3 +187,19 @@ async def admin_client(client):
     })
 
     return client
+
+
+@pytest.fixture
+def load_through_cache() -> Callable[..., Awaitable[Any]]:
+    async def get_or_load(key, schema, loader, ttl, stale_ttl=0, tags=(), refresh_loader=None):
+        return await loader()
+
+    return get_or_load
+
+
+@pytest.fixture
+def refresh_through_cache() -> Callable[..., Awaitable[Any]]:
+    async def get_or_load(key, schema, loader, ttl, stale_ttl=0, tags=(), refresh_loader=None):
+        return await refresh_loader()
+
+    return get_or_load
@@ -0,0 +1,28 @@
+import pytest
+
+from src.core.observability.queries import track_queries, assert_max_queries, record_query
+
+
+class TestQueryStats:
+    def test_nested_tracking_propagates_to_parent(self):
+        with track_queries() as outer:
+            record_query("SELECT 1", 0.5)
+
+            with track_queries() as inner:
+                record_query("SELECT 2", 0.25)
+                record_query("SAVEPOINT sa_savepoint_1", 1.0)
+
+        assert inner.count == 1
+        assert outer.count == 2
+        assert outer.seconds == 0.75
+        assert inner.server_timing() == 'db;dur=250.00;desc="1 queries"'
+
+    def test_assert_max_queries(self):
+        with assert_max_queries(1):
+            record_query("SELECT 1", 0.1)
+
+        with pytest.raises(AssertionError):
+            with assert_max_queries(1):
+                record_query("SELECT 1", 0.1)
+                record_query("SELECT 2", 0.1)
+
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import select, update, literal
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+
+from src.core.database.routing import ReplicaRouter, RoutingSession, read_primary
+from src.core.uow import SQLAlchemyUoW
+from src.infrastructure.database.books.models import BookModel
+
+
+@pytest.fixture
+async def engines():
+    primary = create_async_engine("sqlite+aiosqlite://")
+    replica = create_async_engine("sqlite+aiosqlite://")
+
+    yield primary, replica
+
+    await primary.dispose()
+    await replica.dispose()
+
+
+def build_session(router: ReplicaRouter) -> AsyncSession:
+    return AsyncSession(bind=router.primary, sync_session_class=RoutingSession, router=router)
+
+
+def get_bind(session: AsyncSession, clause) -> AsyncEngine:
+    return session.sync_session.get_bind(clause=clause)
+
+
+@pytest.mark.asyncio
+class TestReplicaRouter:
+    async def test_reads_go_to_healthy_replica(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter(primary=primary, replicas=[replica])
+        await router.check_all()
+
+        session = build_session(router)
+
+        assert router.replicas[0].healthy
+        assert get_bind(session, select(BookModel)) is replica.sync_engine
+        assert get_bind(session, update(BookModel).values(title="x")) is primary.sync_engine
+        assert get_bind(session, select(BookModel).with_for_update()) is primary.sync_engine
+
+    async def test_uow_pins_session_to_primary(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter(primary=primary, replicas=[replica])
+        await router.check_all()
+
+        session = build_session(router)
+
+        async with SQLAlchemyUoW(session):
+            assert await session.scalar(select(literal(1))) == 1
+
+        assert get_bind(session, select(BookModel)) is primary.sync_engine
+
+    async def test_read_primary_routes_reads_to_primary(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter(primary=primary, replicas=[replica])
+        await router.check_all()
+
+        session = build_session(router)
+
+        with read_primary():
+            assert get_bind(session, select(BookModel)) is primary.sync_engine
+
+        assert get_bind(session, select(BookModel)) is replica.sync_engine
+
+    async def test_falls_back_to_primary(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter(primary=primary, replicas=[replica], max_lag_seconds=-1)
+
+        await router.check_all()
+        assert not router.replicas[0].healthy
+        assert get_bind(build_session(router), select(BookModel)) is primary.sync_engine
+
+        unreachable = create_async_engine("sqlite+aiosqlite:////nonexistent/replica.db")
+        router = ReplicaRouter(primary=primary, replicas=[unreachable])
+
+        await router.check_all()
+        assert not router.replicas[0].healthy
+        assert get_bind(build_session(router), select(BookModel)) is primary.sync_engine
+
+        await unreachable.dispose()
+
+    async def test_without_replicas_uses_default_bind(self, engines):
+        primary, _ = engines
+        router = ReplicaRouter(primary=primary)
+
+        router.start()
+        assert get_bind(build_session(router), select(BookModel)) is primary.sync_engine
+        await router.stop()
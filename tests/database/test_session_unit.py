@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, AsyncMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.responses import EncodedResponse
+from src.application.usecases.books import FindBookBySlugUseCase
+from src.core.database import database
+from src.core.database.database import LazySession
+from src.domain.books.mappers import BookSchemaMapper
+from src.domain.cache.protocols import CacheManagerProtocol
+from src.infrastructure.database.books.mappers import BookModelMapper
+from src.infrastructure.database.books.repositories import BookRepository
+
+
+@pytest.mark.asyncio
+class TestLazySession:
+    async def test_cache_hit_never_opens_session(self, monkeypatch: pytest.MonkeyPatch):
+        factory = MagicMock()
+        monkeypatch.setattr(database, "async_session", factory)
+
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
+        cache_manager.get_or_load.return_value = EncodedResponse.model_construct(body=b"{}", etag='"etag"', content_length=2)
+
+        dependency = database.get_session()
+        session = await anext(dependency)
+
+        use_case = FindBookBySlugUseCase(
+            mapper=BookSchemaMapper(),
+            repository=BookRepository(session=session, mapper=BookModelMapper()),
+            cache=cache_manager
+        )
+        await use_case.execute(slug="thomas-shelby")
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+
+        factory.assert_not_called()
+
+    async def test_opens_on_first_use_and_closes(self):
+        real_session = create_autospec(AsyncSession, instance=True)
+        real_session.close = AsyncMock()
+        factory = MagicMock(return_value=real_session)
+
+        session = LazySession(factory)
+        assert not session.is_opened
+
+        await session.execute("SELECT 1")
+        session.info["key"] = "value"
+
+        factory.assert_called_once_with()
+        real_session.execute.assert_awaited_once_with("SELECT 1")
+
+        await session.close()
+        real_session.close.assert_awaited_once()
+        assert not session.is_opened
@@ -0,0 +1,120 @@
+import gc
+import logging
+import weakref
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.observability.database import setup_db_timing
+from src.core.observability.queries import track_queries
+from src.core.observability.statements import normalize_statement, FingerprintRegistry, SlowQueryLog, \
+    background_tasks, OTHER_FINGERPRINT
+
+
+class TestFingerprints:
+    def test_normalize_strips_literals_and_parameters(self):
+        statement = """
+            SELECT books.id FROM books /* list */
+            WHERE books.title = 'It''s' AND books.rating >= 4.5 AND books.author_id = $1
+            AND books.id IN ($2, $3, $4) AND books.language = %(language)s::text
+            LIMIT 20
+        """
+
+        assert normalize_statement(statement) == (
+            "SELECT books.id FROM books WHERE books.title = ? AND books.rating >= ? "
+            "AND books.author_id = ? AND books.id IN (?) AND books.language = ?::text LIMIT ?"
+        )
+
+    def test_same_shape_shares_fingerprint(self):
+        registry = FingerprintRegistry(limit=10)
+
+        first, operation, _ = registry.resolve("SELECT * FROM books WHERE id IN ($1, $2)")
+        second, _, _ = registry.resolve("SELECT * FROM books WHERE id IN ($1, $2, $3)")
+        third, _, _ = registry.resolve("SELECT * FROM authors WHERE id IN ($1, $2)")
+
+        assert operation == "select"
+        assert first == second
+        assert first != third
+
+    def test_cardinality_is_capped(self):
+        registry = FingerprintRegistry(limit=2)
+
+        registry.resolve("SELECT * FROM books")
+        registry.resolve("SELECT * FROM authors")
+        fingerprint, operation, _ = registry.resolve("DELETE FROM reviews")
+
+        assert fingerprint == OTHER_FINGERPRINT
+        assert operation == "delete"
+        assert len(registry) == 2
+
+    def test_overflow_is_not_memoized(self):
+        registry = FingerprintRegistry(limit=1)
+
+        registry.resolve("SELECT * FROM books")
+        assert registry.resolve("SELECT * FROM authors")[0] == OTHER_FINGERPRINT
+
+        registry.limit = 2
+        fingerprint, _, _ = registry.resolve("SELECT * FROM authors")
+
+        assert fingerprint != OTHER_FINGERPRINT
+        assert len(registry) == 2
+
+    def test_registry_is_not_kept_alive(self):
+        registry = FingerprintRegistry(limit=10)
+        registry.resolve("SELECT * FROM books")
+        reference = weakref.ref(registry)
+
+        del registry
+        gc.collect()
+
+        assert reference() is None
+
+
+class TestSlowQueryLog:
+    def test_fast_queries_are_ignored(self, caplog):
+        log = SlowQueryLog(async_engine=None, threshold_seconds=0.5)
+
+        with caplog.at_level(logging.WARNING):
+            log.observe("SELECT 1", (), 0.1, False)
+
+        assert not caplog.records
+
+    def test_explain_is_rate_limited_per_fingerprint(self):
+        log = SlowQueryLog(async_engine=None, threshold_seconds=0.5, explain_interval_seconds=60)
+
+        assert log.should_explain("abc", "select", False)
+        assert not log.should_explain("abc", "select", False)
+        assert log.should_explain("def", "select", False)
+        assert not log.should_explain("ghi", "update", False)
+        assert not log.should_explain("jkl", "select", True)
+
+    @pytest.mark.asyncio
+    async def test_slow_query_logs_plan(self, caplog):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        log = SlowQueryLog(async_engine=engine, threshold_seconds=0.5)
+
+        with caplog.at_level(logging.WARNING):
+            log.observe("SELECT ? AS value", (1,), 0.75, False)
+            for task in list(background_tasks):
+                await task
+
+        await engine.dispose()
+
+        assert "Slow query" in caplog.text
+        assert "SELECT ? AS value" in caplog.text
+        assert "CONSTANT ROW" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_explain_is_not_counted_in_request_stats(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        setup_db_timing(engine)
+        log = SlowQueryLog(async_engine=engine, threshold_seconds=0.5)
+
+        with track_queries() as stats:
+            log.observe("SELECT ? AS value", (1,), 0.75, False)
+            for task in list(background_tasks):
+                await task
+
+        await engine.dispose()
+
+        assert stats.count == 0
@@ -0,0 +1,116 @@
+import gzip
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import AsyncClient, ASGITransport
+
+from src.adapters.responses import EncodedResponse
+from src.adapters.schemas.responses.author import AuthorResponse
+from src.core.compression import CompressionMiddleware, negotiate_encoding
+
+
+def build_client() -> AsyncClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse("x" * 1000, headers={"ETag": '"large"'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("x" * 10)
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield "y" * 500
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/encoded")
+    async def encoded():
+        return PlainTextResponse(gzip.compress(b"z" * 1000), headers={"Content-Encoding": "gzip"})
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestNegotiateEncoding:
+    def test_prefers_highest_weight(self):
+        assert negotiate_encoding("gzip") == "gzip"
+        assert negotiate_encoding("gzip;q=0.5, identity") == "gzip"
+        assert negotiate_encoding("*") is not None
+
+    def test_rejects_unacceptable(self):
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("*;q=0, gzip;q=0") is None
+        assert negotiate_encoding("gzip", available=()) is None
+
+
+@pytest.mark.asyncio
+class TestCompressionMiddleware:
+    async def test_compresses_large_responses(self):
+        async with build_client() as client:
+            response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == '"large-gzip"'
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.text == "x" * 1000
+
+    async def test_skips_small_and_unaccepted(self):
+        async with build_client() as client:
+            small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+            identity = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["etag"] == '"large"'
+
+    async def test_compresses_streaming_responses(self):
+        async with build_client() as client:
+            response = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "y" * 1500
+
+    async def test_keeps_encoded_responses(self):
+        async with build_client() as client:
+            response = await client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == b"z" * 1000
+
+
+class TestEncodedResponse:
+    def test_stores_compressed_variants(self):
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby", bio="x" * 2000)
+        encoded = EncodedResponse.from_model(author)
+
+        response = encoded.to_response(headers={"ETag": encoded.etag}, accept_encoding="gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == f'{encoded.etag[:-1]}-gzip"'
+        assert response.headers["etag"] == encoded.get_etag("gzip")
+        assert response.headers["content-length"] == str(len(response.body))
+        assert gzip.decompress(response.body) == encoded.body
+
+        response = encoded.to_response()
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == encoded.etag == encoded.get_etag()
+        assert response.body == encoded.body
+        assert response.headers["vary"] == "Accept-Encoding"
+
+        assert EncodedResponse.model_validate_json(encoded.model_dump_json()) == encoded
+
+    def test_skips_small_payloads(self):
+        author = AuthorResponse(id=uuid.uuid4(), name="Thomas Shelby", slug="thomas-shelby")
+        encoded = EncodedResponse.from_model(author)
+
+        assert encoded.compressed == {}
+        assert "vary" not in encoded.to_response(accept_encoding="gzip").headers
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone, timedelta
+
+from starlette.requests import Request
+
+from src.adapters.conditional import build_etag, build_validators, is_not_modified
+
+
+def build_request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [
+            (name.replace("_", "-").lower().encode(), value.encode())
+            for name, value in headers.items()
+        ]
+    })
+
+
+class TestConditionalRequests:
+    def test_build_etag_depends_on_every_part(self):
+        assert build_etag("a", 1) == build_etag("a", 1)
+        assert build_etag("a", 1) != build_etag("a", 2)
+        assert build_etag("a", 1).startswith('"')
+
+    def test_if_none_match(self):
+        headers = build_validators(etag=build_etag("a"), last_modified=None, cache_control="no-cache")
+
+        assert is_not_modified(build_request(if_none_match=headers["ETag"]), headers)
+        assert is_not_modified(build_request(if_none_match=f'"other", W/{headers["ETag"]}'), headers)
+        assert is_not_modified(build_request(if_none_match="*"), headers)
+        assert not is_not_modified(build_request(if_none_match='"other"'), headers)
+        assert not is_not_modified(build_request(), headers)
+
+    def test_if_none_match_accepts_encoded_variants(self):
+        etag = build_etag("a")
+        headers = build_validators(etag=f'{etag[:-1]}-br"', last_modified=None, cache_control="no-cache")
+
+        assert is_not_modified(build_request(if_none_match=etag), headers)
+        assert is_not_modified(build_request(if_none_match=f'{etag[:-1]}-gzip"'), headers)
+        assert is_not_modified(build_request(if_none_match=f'W/{etag[:-1]}-zstd"'), headers)
+        assert not is_not_modified(build_request(if_none_match=f'{build_etag("b")[:-1]}-br"'), headers)
+
+    def test_if_modified_since(self):
+        updated_at = datetime(2026, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc)
+        headers = build_validators(etag=build_etag("a"), last_modified=updated_at, cache_control="no-cache")
+
+        assert headers["Last-Modified"] == "Thu, 01 Jan 2026 12:00:00 GMT"
+        assert is_not_modified(build_request(if_modified_since=headers["Last-Modified"]), headers)
+        assert not is_not_modified(
+            build_request(if_modified_since="Thu, 01 Jan 2026 11:59:59 GMT"),
+            headers
+        )
+        assert not is_not_modified(build_request(if_modified_since="garbage"), headers)
+
+    def test_if_none_match_takes_precedence(self):
+        updated_at = datetime.now(timezone.utc) - timedelta(days=1)
+        headers = build_validators(etag=build_etag("a"), last_modified=updated_at, cache_control="no-cache")
+
+        request = build_request(if_none_match='"other"', if_modified_since=headers["Last-Modified"])
+        assert not is_not_modified(request, headers)
@@ -1,25 +1,32 @@
 import uuid
+from datetime import datetime
 
 import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.auth import get_user
+from src.core.observability.queries import assert_max_queries, track_queries
 from src.core.uow import SQLAlchemyUoW
-from src.domain.books.entities import BookEntity, BookCreateEntity
+from src.domain.books.entities import BookEntity, BookCreateEntity, BookRatingEntity
 from src.domain.books.enums import Genre
-from src.domain.reviews.entities import ReviewCreateEntity, ReviewUpdateEntity
-from src.domain.reviews.exceptions import ReviewRepositoryException
+from src.domain.reviews.entities import ReviewCreateEntity, ReviewUpdateEntity, ReviewFilterEntity
+from src.domain.reviews.enums import ReviewSortField
+from src.domain.reviews.exceptions import ReviewRepositoryException, ReviewAlreadyExistException
 from src.domain.user.entities import UserEntity, UserCreateEntity
 from src.domain.user.enums import UserRole
 from src.infrastructure.database.books.mappers import BookModelMapper
 from src.infrastructure.database.books.repositories import BookRepository
 from src.infrastructure.database.reviews.mappers import ReviewModelMapper
+from src.infrastructure.database.reviews.models import ReviewModel
 from src.infrastructure.database.reviews.repositories import ReviewRepository
 from src.infrastructure.database.user.mappers import UserModelMapper
 from src.infrastructure.database.user.repositories import UserRepository
 
 
-@pytest.fixture
-async def book_entity(session: AsyncSession) -> BookEntity:
+async def create_book(session: AsyncSession) -> BookEntity:
     mapper = BookModelMapper()
     repository = BookRepository(
         session=session,
@@ -41,8 +48,7 @@ async def book_entity(session: AsyncSession) -> BookEntity:
     return result
 
 
-@pytest.fixture
-async def user_entity(session: AsyncSession) -> UserEntity:
+async def create_user(session: AsyncSession) -> UserEntity:
     mapper = UserModelMapper()
     repository = UserRepository(
         session=session,
@@ -65,9 +71,19 @@ async def user_entity(session: AsyncSession) -> UserEntity:
     return result
 
 
+@pytest.fixture
+async def book_entity(session: AsyncSession) -> BookEntity:
+    return await create_book(session)
+
+
+@pytest.fixture
+async def user_entity(session: AsyncSession) -> UserEntity:
+    return await create_user(session)
+
+
 @pytest.mark.asyncio
 class TestReviewRepository:
-    async def test_create_and_find(
+    async def test_create(
             self,
             session: AsyncSession,
             user_entity: UserEntity,
@@ -98,8 +114,41 @@ class TestReviewRepository:
             assert result.review == create_entity.review
             assert result.rating == create_entity.rating
 
-        results = await repository.find_all_by_book_id(book_id=book_entity.id)
-        assert results == [result]
+    async def test_select_from_written_cte_loads_relationships(
+            self,
+            session: AsyncSession,
+            user_entity: UserEntity,
+            book_entity: BookEntity
+    ):
+        repository = ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=session
+        )
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            created = await repository.create(
+                entity=ReviewCreateEntity(
+                    review="Super good",
+                    rating=5,
+                    user_id=user_entity.id,
+                    book_id=book_entity.id
+                )
+            )
+
+        written = (
+            select(*ReviewModel.__table__.columns)
+            .where(ReviewModel.id == created.id)
+            .cte("written_review")
+        )
+
+        session.expunge_all()
+        result = await session.execute(repository.build_select(source=written))
+        model = result.scalar_one()
+
+        assert "book" in model.__dict__
+        assert "user" in model.__dict__
+        assert repository.mapper.from_model_to_entity(model=model) == created
 
     async def test_create_review_repository_exception(
             self,
@@ -126,23 +175,6 @@ class TestReviewRepository:
             async with uow:
                 await repository.create(entity=create_entity)
 
-    async def test_find_by_book_id_returns_empty(
-            self,
-            session: AsyncSession,
-            user_entity: UserEntity,
-            book_entity: BookEntity
-    ):
-        mapper = ReviewModelMapper(
-            mapper=BookModelMapper()
-        )
-        repository = ReviewRepository(
-            mapper=mapper,
-            session=session
-        )
-
-        result = await repository.find_all_by_book_id(book_id=book_entity.id)
-        assert result == []
-
     async def test_delete_by_id_returns_true(
             self,
             session: AsyncSession,
@@ -234,9 +266,10 @@ class TestReviewRepository:
             assert result.id is not None
 
         async with uow:
-            result = await repository.update(entity=update_entity)
+            result, previous_rating = await repository.update(entity=update_entity)
             assert result.review == update_entity.review
             assert result.rating == update_entity.rating
+            assert previous_rating == create_entity.rating
 
     async def test_update_returns_none(self, session: AsyncSession):
         mapper = ReviewModelMapper(
@@ -259,4 +292,229 @@ class TestReviewRepository:
             result = await repository.update(entity=update_entity)
             assert result is None
 
+    async def test_book_rating_stats(
+            self,
+            session: AsyncSession,
+            user_entity: UserEntity,
+            book_entity: BookEntity
+    ):
+        repository = ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=session
+        )
+        book_repository = BookRepository(
+            mapper=BookModelMapper(),
+            session=session
+        )
+        uow = SQLAlchemyUoW(session)
+
+        create_entity = ReviewCreateEntity(
+            review="Super good",
+            rating=5,
+            user_id=user_entity.id,
+            book_id=book_entity.id
+        )
+
+        async with uow:
+            await repository.create(entity=create_entity)
+            await book_repository.update_rating_stats(book_id=book_entity.id, added_rating=5)
+
+        book = await book_repository.find_by_id(book_id=book_entity.id)
+        assert book.rating == BookRatingEntity(count=1, total=5, histogram=[0, 0, 0, 0, 1])
+
+        async with uow:
+            await book_repository.update_rating_stats(book_id=book_entity.id, added_rating=2, removed_rating=5)
+
+        book = await book_repository.find_by_id(book_id=book_entity.id)
+        assert book.rating == BookRatingEntity(count=1, total=2, histogram=[0, 1, 0, 0, 0])
+
+        async with uow:
+            updated = await book_repository.recalculate_rating_stats(book_id=book_entity.id)
+            assert updated == 1
+
+        book = await book_repository.find_by_id(book_id=book_entity.id)
+        assert book.rating == BookRatingEntity(count=1, total=5, histogram=[0, 0, 0, 0, 1])
+
+        async with uow:
+            rating = await repository.delete_by_id(user_id=user_entity.id, book_id=book_entity.id)
+            assert rating == 5
+            await book_repository.update_rating_stats(book_id=book_entity.id, removed_rating=rating)
+
+        book = await book_repository.find_by_id(book_id=book_entity.id)
+        assert book.rating == BookRatingEntity()
+
+    async def test_find_page(
+            self,
+            session: AsyncSession,
+            book_entity: BookEntity
+    ):
+        repository = ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=session
+        )
+        user_repository = UserRepository(
+            mapper=UserModelMapper(),
+            session=session
+        )
+        uow = SQLAlchemyUoW(session)
+
+        async with uow:
+            for index, rating in enumerate((4, 5, 4)):
+                user = await user_repository.create(entity=UserCreateEntity(
+                    email=f"reader{index}@mail.com",
+                    hashed_password="pswd",
+                    first_name="Reader",
+                    last_name=str(index),
+                    role=UserRole.USER
+                ))
+                session.add(ReviewModel(
+                    review="Super good",
+                    rating=rating,
+                    user_id=user.id,
+                    book_id=book_entity.id,
+                    created_at=datetime(2026, 1, index + 1, 12, 30)
+                ))
+
+        newest = await repository.find_page(filters=ReviewFilterEntity(book_id=book_entity.id, limit=2))
+        assert [item.full_name for item in newest] == ["Reader 2", "Reader 1"]
+
+        last = newest[-1]
+        rest = await repository.find_page(filters=ReviewFilterEntity(
+            book_id=book_entity.id,
+            limit=2,
+            after_created_at=last.created_at,
+            after_id=last.id
+        ))
+        assert [item.full_name for item in rest] == ["Reader 0"]
+
+        by_rating = await repository.find_page(filters=ReviewFilterEntity(
+            book_id=book_entity.id,
+            limit=10,
+            sort=ReviewSortField.RATING_ASC
+        ))
+        assert [item.full_name for item in by_rating] == ["Reader 0", "Reader 2", "Reader 1"]
+
+        first = by_rating[0]
+        after_first = await repository.find_page(filters=ReviewFilterEntity(
+            book_id=book_entity.id,
+            limit=10,
+            sort=ReviewSortField.RATING_ASC,
+            after_rating=first.rating,
+            after_created_at=first.created_at,
+            after_id=first.id
+        ))
+        assert [item.full_name for item in after_first] == ["Reader 2", "Reader 1"]
+
+
+@pytest.mark.asyncio
+class TestReviewsEndpoints:
+    async def test_endpoints_query_budget(
+            self,
+            app: FastAPI,
+            client: AsyncClient,
+            book_entity: BookEntity,
+            user_entity: UserEntity
+    ):
+        app.dependency_overrides[get_user] = lambda: user_entity
+        url = f"/v1/books/{book_entity.slug}/reviews"
 
+        with assert_max_queries(4):
+            response = await client.post(url=url, json={"review": "Отличная книга", "rating": 5})
+
+        assert response.status_code == 200
+
+        with assert_max_queries(5):
+            response = await client.patch(url=url, json={"review": "Хорошая книга", "rating": 4})
+
+        assert response.status_code == 200
+
+        with assert_max_queries(2):
+            response = await client.get(url=url)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 1
+
+        with assert_max_queries(3):
+            response = await client.delete(url=url)
+
+        assert response.status_code == 204
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+class TestReviewRepositoryPostgres:
+    async def test_create_and_update_in_single_statement(self, postgres_session: AsyncSession):
+        book = await create_book(postgres_session)
+        user = await create_user(postgres_session)
+        repository = ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=postgres_session
+        )
+        uow = SQLAlchemyUoW(postgres_session)
+
+        create_entity = ReviewCreateEntity(
+            review="Super good",
+            rating=5,
+            user_id=user.id,
+            book_id=book.id
+        )
+
+        async with uow:
+            with track_queries() as stats:
+                created = await repository.create(entity=create_entity)
+
+            assert stats.count == 1
+            assert created.book.id == book.id
+            assert created.full_name == f"{user.first_name} {user.last_name}"
+            assert created.review == create_entity.review
+            assert created.rating == create_entity.rating
+
+            with pytest.raises(ReviewAlreadyExistException):
+                await repository.create(entity=create_entity)
+
+            with track_queries() as stats:
+                updated, previous_rating = await repository.update(
+                    entity=ReviewUpdateEntity(
+                        review="Not so good",
+                        rating=3,
+                        user_id=user.id,
+                        book_id=book.id
+                    )
+                )
+
+            assert stats.count == 1
+            assert previous_rating == 5
+            assert updated.id == created.id
+            assert updated.book.id == book.id
+            assert updated.full_name == created.full_name
+            assert updated.review == "Not so good"
+            assert updated.rating == 3
+
+            missing = await repository.update(
+                entity=ReviewUpdateEntity(
+                    review="Not so good",
+                    rating=3,
+                    user_id=user.id,
+                    book_id=uuid.uuid4()
+                )
+            )
+
+            assert missing is None
+
+    async def test_create_with_missing_book_raises_repository_exception(self, postgres_session: AsyncSession):
+        user = await create_user(postgres_session)
+        repository = ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=postgres_session
+        )
+
+        with pytest.raises(ReviewRepositoryException):
+            async with SQLAlchemyUoW(postgres_session):
+                await repository.create(
+                    entity=ReviewCreateEntity(
+                        review="Super good",
+                        rating=5,
+                        user_id=user.id,
+                        book_id=uuid.uuid4()
+                    )
+                )
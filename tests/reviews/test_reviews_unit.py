@@ -3,19 +3,31 @@ from datetime import datetime
 from unittest.mock import create_autospec, AsyncMock, Mock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.schemas.requests.reviews import ReviewRequest
+from src.adapters.schemas.requests.reviews import ReviewRequest, ReviewsQuery
 from src.application.usecases.reviews import CreateReviewUseCase, FindReviewsUseCase, UpdateReviewUseCase, \
     DeleteReviewUseCase
 from src.core.uow import SQLAlchemyUoW
 from src.domain.books.entities import BookEntity
+from src.domain.books.enums import Genre
 from src.domain.books.exceptions import BookNotExistException
+from src.domain.books.mappers import BookSchemaMapper
 from src.domain.books.protocols import BookRepositoryProtocol
-from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity
-from src.domain.reviews.exceptions import ReviewAlreadyExistException, ReviewNotExistException
-from src.domain.reviews.mappers import ReviewSchemaMapper
+from src.domain.cache.protocols import CacheManagerProtocol
+from src.domain.pagination.exceptions import InvalidCursorException
+from src.domain.reviews.entities import ReviewCreateEntity, ReviewEntity, ReviewUpdateEntity, ReviewItemEntity, \
+    ReviewFilterEntity
+from src.domain.reviews.enums import ReviewSortField
+from src.domain.reviews.exceptions import ReviewAlreadyExistException, ReviewNotExistException, \
+    ReviewRepositoryException
+from src.domain.reviews.mappers import ReviewSchemaMapper, ReviewItemSchemaMapper
 from src.domain.reviews.protocols import ReviewRepositoryProtocol
+from src.infrastructure.database.books.mappers import BookModelMapper
+from src.infrastructure.database.reviews.mappers import ReviewModelMapper
+from src.infrastructure.database.reviews.repositories import ReviewRepository
 
 
 @pytest.mark.asyncio
@@ -26,6 +38,7 @@ class TestCreateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.create = AsyncMock()
@@ -69,7 +82,8 @@ class TestCreateReviewUseCase:
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         result = await use_case.execute(
@@ -82,6 +96,7 @@ class TestCreateReviewUseCase:
 
         book_repository.find_by_slug.assert_awaited_once_with(slug=slug)
         review_repository.create.assert_awaited_once_with(entity=create_entity)
+        book_repository.update_rating_stats.assert_awaited_once_with(book_id=book_id, added_rating=5)
         mapper.from_entity_to_schema.assert_called_once_with(entity=entity)
 
     async def test_execute_book_not_found(self):
@@ -90,6 +105,7 @@ class TestCreateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.create = AsyncMock()
@@ -109,7 +125,8 @@ class TestCreateReviewUseCase:
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(BookNotExistException):
@@ -129,6 +146,7 @@ class TestCreateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.create = AsyncMock(side_effect=ReviewAlreadyExistException())
@@ -159,7 +177,8 @@ class TestCreateReviewUseCase:
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(ReviewAlreadyExistException):
@@ -176,69 +195,109 @@ class TestCreateReviewUseCase:
 
 @pytest.mark.asyncio
 class TestFindReviewsUseCase:
+    @staticmethod
+    def build_use_case(review_repository, book_repository) -> FindReviewsUseCase:
+        return FindReviewsUseCase(
+            book_repository=book_repository,
+            review_repository=review_repository,
+            mapper=ReviewItemSchemaMapper(),
+            book_mapper=BookSchemaMapper()
+        )
+
     async def test_execute_success(self):
         review_repository = create_autospec(ReviewRepositoryProtocol, instance=True)
         book_repository = create_autospec(BookRepositoryProtocol, instance=True)
-        mapper = create_autospec(ReviewSchemaMapper, instance=True)
 
-        book_repository.find_by_slug = AsyncMock()
-        review_repository.find_all_by_book_id = AsyncMock()
-        mapper.from_entity_to_schema = Mock()
-
-        book_id = uuid.uuid4()
         slug = "thomas-shelby"
+        book = BookEntity(
+            id=uuid.uuid4(),
+            title="Thomas Shelby",
+            slug=slug,
+            language="Русский",
+            genre=Genre.FANTASY
+        )
 
-        book = create_autospec(BookEntity, instance=True)
-        book.id = book_id
-
-        entities = [object(), object()]
+        entities = [
+            ReviewItemEntity(
+                id=uuid.uuid4(),
+                created_at=datetime(2026, 1, day),
+                review="Test message",
+                rating=5,
+                full_name="John Dul"
+            )
+            for day in (3, 2, 1)
+        ]
 
         book_repository.find_by_slug.return_value = book
-        review_repository.find_all_by_book_id.return_value = entities
-        mapper.from_entity_to_schema.side_effect = [object(), object()]
-
-        use_case = FindReviewsUseCase(
-            book_repository=book_repository,
-            review_repository=review_repository,
-            mapper=mapper
-        )
+        review_repository.find_page.return_value = entities
 
-        results = await use_case.execute(slug=slug)
+        use_case = self.build_use_case(review_repository, book_repository)
+        result = await use_case.execute(slug=slug, filters=ReviewsQuery(limit=2))
 
-        assert len(results) == 2
-        assert mapper.from_entity_to_schema.call_count == 2
+        assert result.book.id == book.id
+        assert [item.id for item in result.items] == [entity.id for entity in entities[:2]]
+        assert result.next_cursor is not None
 
         book_repository.find_by_slug.assert_awaited_once_with(slug=slug)
-        review_repository.find_all_by_book_id.assert_awaited_once_with(book_id=book.id)
-
-        for entity in entities:
-            mapper.from_entity_to_schema.assert_any_call(entity=entity)
+        review_repository.find_page.assert_awaited_once_with(filters=ReviewFilterEntity(
+            book_id=book.id,
+            limit=3,
+            sort=ReviewSortField.NEWEST
+        ))
+
+        review_repository.find_page.reset_mock()
+        await use_case.execute(slug=slug, filters=ReviewsQuery(limit=2, cursor=result.next_cursor))
+
+        review_repository.find_page.assert_awaited_once_with(filters=ReviewFilterEntity(
+            book_id=book.id,
+            limit=3,
+            sort=ReviewSortField.NEWEST,
+            after_rating=5,
+            after_created_at=entities[1].created_at,
+            after_id=entities[1].id
+        ))
 
-    async def test_execute_returns_empty_if_book_not_found(self):
+    async def test_execute_book_not_found(self):
         review_repository = create_autospec(ReviewRepositoryProtocol, instance=True)
         book_repository = create_autospec(BookRepositoryProtocol, instance=True)
-        mapper = create_autospec(ReviewSchemaMapper, instance=True)
-
-        book_repository.find_by_slug = AsyncMock()
-        review_repository.find_all_by_book_id = AsyncMock()
-        mapper.from_entity_to_schema = Mock()
 
         slug = "thomas-shelby"
-
         book_repository.find_by_slug.return_value = None
 
-        use_case = FindReviewsUseCase(
-            book_repository=book_repository,
-            review_repository=review_repository,
-            mapper=mapper
-        )
+        use_case = self.build_use_case(review_repository, book_repository)
 
-        results = await use_case.execute(slug=slug)
-        assert results == []
+        with pytest.raises(BookNotExistException):
+            await use_case.execute(slug=slug, filters=ReviewsQuery())
 
         book_repository.find_by_slug.assert_awaited_once_with(slug=slug)
-        review_repository.find_all_by_book_id.assert_not_awaited()
-        mapper.from_entity_to_schema.assert_not_called()
+        review_repository.find_page.assert_not_awaited()
+
+    async def test_execute_invalid_cursor(self):
+        review_repository = create_autospec(ReviewRepositoryProtocol, instance=True)
+        book_repository = create_autospec(BookRepositoryProtocol, instance=True)
+
+        use_case = self.build_use_case(review_repository, book_repository)
+        cursor = FindReviewsUseCase.build_cursor(
+            entity=ReviewItemEntity(
+                id=uuid.uuid4(),
+                created_at=datetime(2026, 1, 1),
+                review="Test message",
+                rating=5,
+                full_name="John Dul"
+            ),
+            sort=ReviewSortField.NEWEST
+        )
+
+        with pytest.raises(InvalidCursorException):
+            await use_case.execute(
+                slug="thomas-shelby",
+                filters=ReviewsQuery(sort=ReviewSortField.RATING_DESC, cursor=cursor)
+            )
+
+        with pytest.raises(InvalidCursorException):
+            await use_case.execute(slug="thomas-shelby", filters=ReviewsQuery(cursor="not-a-cursor"))
+
+        review_repository.find_page.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -249,6 +308,7 @@ class TestUpdateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.update = AsyncMock()
@@ -285,14 +345,15 @@ class TestUpdateReviewUseCase:
         response = object()
 
         book_repository.find_by_slug.return_value = book
-        review_repository.update.return_value = entity
+        review_repository.update.return_value = entity, 3
         mapper.from_entity_to_schema.return_value = response
 
         use_case = UpdateReviewUseCase(
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         result = await use_case.execute(
@@ -305,6 +366,11 @@ class TestUpdateReviewUseCase:
 
         book_repository.find_by_slug.assert_awaited_once_with(slug=slug)
         review_repository.update.assert_awaited_once_with(entity=update_entity)
+        book_repository.update_rating_stats.assert_awaited_once_with(
+            book_id=book_id,
+            added_rating=5,
+            removed_rating=3
+        )
         mapper.from_entity_to_schema.assert_called_once_with(entity=entity)
 
     async def test_execute_book_not_found(self):
@@ -313,6 +379,7 @@ class TestUpdateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.update = AsyncMock()
@@ -332,7 +399,8 @@ class TestUpdateReviewUseCase:
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(BookNotExistException):
@@ -352,6 +420,7 @@ class TestUpdateReviewUseCase:
         mapper = create_autospec(ReviewSchemaMapper, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.update = AsyncMock()
@@ -369,13 +438,6 @@ class TestUpdateReviewUseCase:
             rating=5
         )
 
-        update_entity = ReviewUpdateEntity(
-            review=request.review,
-            rating=request.rating,
-            book_id=book_id,
-            user_id=user_id
-        )
-
         book_repository.find_by_slug.return_value = book
         review_repository.update.return_value = None
 
@@ -383,7 +445,8 @@ class TestUpdateReviewUseCase:
             book_repository=book_repository,
             review_repository=review_repository,
             mapper=mapper,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(ReviewNotExistException):
@@ -394,7 +457,8 @@ class TestUpdateReviewUseCase:
             )
 
         book_repository.find_by_slug.assert_awaited_once_with(slug=slug)
-        review_repository.update.assert_awaited_once_with(entity=update_entity)
+        review_repository.update.assert_awaited_once()
+        book_repository.update_rating_stats.assert_not_awaited()
         mapper.from_entity_to_schema.assert_not_called()
 
 
@@ -405,6 +469,7 @@ class TestDeleteReviewUseCase:
         book_repository = create_autospec(BookRepositoryProtocol, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.delete_by_id = AsyncMock()
@@ -417,12 +482,13 @@ class TestDeleteReviewUseCase:
         book.id = book_id
 
         book_repository.find_by_slug.return_value = book
-        review_repository.delete_by_id.return_value = True
+        review_repository.delete_by_id.return_value = 4
 
         use_case = DeleteReviewUseCase(
             book_repository=book_repository,
             review_repository=review_repository,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         await use_case.execute(
@@ -435,12 +501,14 @@ class TestDeleteReviewUseCase:
             user_id=user_id,
             book_id=book.id
         )
+        book_repository.update_rating_stats.assert_awaited_once_with(book_id=book.id, removed_rating=4)
 
     async def test_execute_book_not_found(self):
         review_repository = create_autospec(ReviewRepositoryProtocol, instance=True)
         book_repository = create_autospec(BookRepositoryProtocol, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.delete_by_id = AsyncMock()
@@ -453,7 +521,8 @@ class TestDeleteReviewUseCase:
         use_case = DeleteReviewUseCase(
             book_repository=book_repository,
             review_repository=review_repository,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(BookNotExistException):
@@ -470,6 +539,7 @@ class TestDeleteReviewUseCase:
         book_repository = create_autospec(BookRepositoryProtocol, instance=True)
         fake_session = create_autospec(AsyncSession, instance=True)
         uow = SQLAlchemyUoW(fake_session)
+        cache_manager = create_autospec(CacheManagerProtocol, instance=True)
 
         book_repository.find_by_slug = AsyncMock()
         review_repository.delete_by_id = AsyncMock()
@@ -482,12 +552,13 @@ class TestDeleteReviewUseCase:
         book.id = book_id
 
         book_repository.find_by_slug.return_value = book
-        review_repository.delete_by_id.return_value = False
+        review_repository.delete_by_id.return_value = None
 
         use_case = DeleteReviewUseCase(
             book_repository=book_repository,
             review_repository=review_repository,
-            uow=uow
+            uow=uow,
+            cache=cache_manager
         )
 
         with pytest.raises(ReviewNotExistException):
@@ -500,4 +571,103 @@ class TestDeleteReviewUseCase:
         review_repository.delete_by_id.assert_awaited_once_with(
             user_id=user_id,
             book_id=book.id
-        )
\ No newline at end of file
+        )
+
+
+class TestReviewRepositoryStatements:
+    @staticmethod
+    def build_repository() -> ReviewRepository:
+        return ReviewRepository(
+            mapper=ReviewModelMapper(mapper=BookModelMapper()),
+            session=create_autospec(AsyncSession, instance=True)
+        )
+
+    def test_create_statement_is_single_round_trip(self):
+        entity = ReviewCreateEntity(
+            review="Super good",
+            rating=5,
+            user_id=uuid.uuid4(),
+            book_id=uuid.uuid4()
+        )
+
+        sql = str(self.build_repository().build_create_statement(entity=entity).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH written_review AS")
+        assert "ON CONFLICT ON CONSTRAINT uq_user_book_review DO NOTHING RETURNING" in sql
+        assert "JOIN books ON books.id = written_review.book_id" in sql
+        assert "JOIN users ON users.id = written_review.user_id" in sql
+
+    def test_update_statement_is_single_round_trip(self):
+        entity = ReviewUpdateEntity(
+            review="Super good",
+            rating=5,
+            user_id=uuid.uuid4(),
+            book_id=uuid.uuid4()
+        )
+
+        sql = str(self.build_repository().build_update_statement(entity=entity).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH previous_review AS \n(SELECT reviews.id AS id, reviews.rating AS rating")
+        assert "FOR UPDATE" in sql
+        assert "written_review AS \n(UPDATE reviews" in sql
+        assert "RETURNING" in sql and "previous_review.rating AS previous_rating" in sql
+        assert "JOIN books ON books.id = written_review.book_id" in sql
+        assert "JOIN users ON users.id = written_review.user_id" in sql
+
+    @staticmethod
+    def build_postgres_repository(result: Mock) -> ReviewRepository:
+        session = create_autospec(AsyncSession, instance=True)
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.execute = AsyncMock(return_value=result)
+
+        return ReviewRepository(
+            mapper=create_autospec(ReviewModelMapper, instance=True),
+            session=session
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_on_postgres_maps_written_review(self):
+        model = Mock()
+        result = Mock()
+        result.scalar_one_or_none.return_value = model
+        repository = self.build_postgres_repository(result)
+        entity = ReviewCreateEntity(review="Super good", rating=5, user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        created = await repository.create(entity=entity)
+
+        repository.session.execute.assert_awaited_once()
+        sql = str(repository.session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_user_book_review DO NOTHING" in sql
+        repository.mapper.from_model_to_entity.assert_called_once_with(model=model)
+        assert created == repository.mapper.from_model_to_entity.return_value
+
+    @pytest.mark.asyncio
+    async def test_create_on_postgres_detects_duplicate(self):
+        result = Mock()
+        result.scalar_one_or_none.return_value = None
+        repository = self.build_postgres_repository(result)
+        entity = ReviewCreateEntity(review="Super good", rating=5, user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        with pytest.raises(ReviewAlreadyExistException):
+            await repository.create(entity=entity)
+
+        repository.mapper.from_model_to_entity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_on_postgres_wraps_integrity_error(self):
+        repository = self.build_postgres_repository(Mock())
+        repository.session.execute.side_effect = IntegrityError("INSERT", {}, Exception("fk"))
+        entity = ReviewCreateEntity(review="Super good", rating=5, user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        with pytest.raises(ReviewRepositoryException):
+            await repository.create(entity=entity)
+
+    @pytest.mark.asyncio
+    async def test_update_on_postgres_returns_none_when_missing(self):
+        result = Mock()
+        result.one_or_none.return_value = None
+        repository = self.build_postgres_repository(result)
+        entity = ReviewUpdateEntity(review="Super good", rating=5, user_id=uuid.uuid4(), book_id=uuid.uuid4())
+
+        assert await repository.update(entity=entity) is None
+        repository.session.execute.assert_awaited_once()
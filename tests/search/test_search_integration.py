@@ -0,0 +1,106 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.uow import SQLAlchemyUoW
+from src.domain.author.entities import AuthorCreateEntity
+from src.domain.books.entities import BookCreateEntity
+from src.domain.books.enums import Genre
+from src.domain.search.entities import SearchFilterEntity
+from src.domain.search.enums import SearchTarget, SearchResultKind
+from src.infrastructure.database.author.mappers import AuthorModelMapper
+from src.infrastructure.database.author.repositories import AuthorRepository
+from src.infrastructure.database.books.mappers import BookModelMapper
+from src.infrastructure.database.books.repositories import BookRepository
+from src.infrastructure.database.search.mappers import SearchResultRowMapper
+from src.infrastructure.database.search.repositories import SearchRepository
+
+
+async def create_catalog(session: AsyncSession) -> None:
+    book_repository = BookRepository(
+        mapper=BookModelMapper(),
+        session=session
+    )
+    author_repository = AuthorRepository(
+        mapper=AuthorModelMapper(),
+        session=session
+    )
+
+    async with SQLAlchemyUoW(session):
+        await author_repository.create(
+            entity=AuthorCreateEntity(
+                name="Thomas Shelby",
+                slug="thomas-shelby",
+                bio=None,
+                birth_date=None,
+                death_date=None,
+                country=None
+            )
+        )
+
+        for title, slug, description in (
+                ("Shelby Company", "shelby-company", None),
+                ("Peaky Blinders", "peaky-blinders", "Small Heath gang led by the Shelby family"),
+                ("Garrison Tavern", "garrison-tavern", "A pub in Birmingham")
+        ):
+            await book_repository.create(entity=BookCreateEntity(
+                title=title,
+                slug=slug,
+                genre=Genre.FANTASY,
+                language="English",
+                description=description
+            ))
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+class TestSearchRepositoryPostgres:
+    async def test_search_ranks_title_matches_first(self, postgres_session: AsyncSession):
+        await create_catalog(postgres_session)
+        repository = SearchRepository(
+            session=postgres_session,
+            mapper=SearchResultRowMapper()
+        )
+
+        results = await repository.search(filters=SearchFilterEntity(query="shelby", target=SearchTarget.BOOKS))
+
+        assert [result.slug for result in results] == ["shelby-company", "peaky-blinders"]
+        assert all(result.kind == SearchResultKind.BOOK for result in results)
+        assert results[0].rank > results[1].rank
+
+    async def test_search_filters_by_target(self, postgres_session: AsyncSession):
+        await create_catalog(postgres_session)
+        repository = SearchRepository(
+            session=postgres_session,
+            mapper=SearchResultRowMapper()
+        )
+
+        authors = await repository.search(filters=SearchFilterEntity(query="shelby", target=SearchTarget.AUTHORS))
+        everything = await repository.search(filters=SearchFilterEntity(query="shelby", target=SearchTarget.ALL))
+
+        assert [(result.kind, result.slug) for result in authors] == [(SearchResultKind.AUTHOR, "thomas-shelby")]
+        assert {result.slug for result in everything} == {"thomas-shelby", "shelby-company", "peaky-blinders"}
+
+    async def test_search_matches_misspelled_title(self, postgres_session: AsyncSession):
+        await create_catalog(postgres_session)
+        repository = SearchRepository(
+            session=postgres_session,
+            mapper=SearchResultRowMapper()
+        )
+
+        results = await repository.search(filters=SearchFilterEntity(query="Garison Tavern"))
+
+        assert [result.slug for result in results] == ["garrison-tavern"]
+
+    async def test_search_paginates(self, postgres_session: AsyncSession):
+        await create_catalog(postgres_session)
+        repository = SearchRepository(
+            session=postgres_session,
+            mapper=SearchResultRowMapper()
+        )
+
+        first = await repository.search(filters=SearchFilterEntity(query="shelby", limit=2))
+        second = await repository.search(filters=SearchFilterEntity(query="shelby", limit=2, offset=2))
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert {result.id for result in first}.isdisjoint({result.id for result in second})
@@ -0,0 +1,83 @@
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+from pydantic import ValidationError
+
+from src.adapters.schemas.requests.search import SearchQuery
+from src.application.usecases.search import SearchUseCase
+from src.domain.search.entities import SearchFilterEntity, SearchResultEntity
+from src.domain.search.enums import SearchTarget, SearchResultKind
+from src.domain.search.mappers import SearchResultSchemaMapper
+from src.domain.search.protocols import SearchRepositoryProtocol
+
+
+@pytest.mark.asyncio
+class TestSearchUseCase:
+    async def test_execute_success(self):
+        repository = create_autospec(SearchRepositoryProtocol, instance=True)
+        mapper = SearchResultSchemaMapper()
+
+        entity = SearchResultEntity(
+            id=uuid.uuid4(),
+            kind=SearchResultKind.BOOK,
+            title="Thomas Shelby",
+            slug="thomas-shelby",
+            rank=0.75
+        )
+        repository.search.return_value = [entity]
+
+        use_case = SearchUseCase(
+            repository=repository,
+            mapper=mapper
+        )
+
+        result = await use_case.execute(query=SearchQuery(q="  shelby ", target=SearchTarget.BOOKS, limit=5))
+
+        assert len(result.items) == 1
+        assert result.items[0].id == entity.id
+        assert result.items[0].kind == SearchResultKind.BOOK
+        assert result.next_offset is None
+
+        repository.search.assert_awaited_once_with(filters=SearchFilterEntity(
+            query="shelby",
+            target=SearchTarget.BOOKS,
+            limit=6,
+            offset=0
+        ))
+
+    async def test_execute_returns_next_offset(self):
+        repository = create_autospec(SearchRepositoryProtocol, instance=True)
+        mapper = SearchResultSchemaMapper()
+
+        repository.search.return_value = [
+            SearchResultEntity(
+                id=uuid.uuid4(),
+                kind=SearchResultKind.AUTHOR,
+                title=f"Author {index}",
+                slug=f"author-{index}",
+                rank=1.0 - index / 10
+            )
+            for index in range(3)
+        ]
+
+        use_case = SearchUseCase(
+            repository=repository,
+            mapper=mapper
+        )
+
+        result = await use_case.execute(query=SearchQuery(q="author", limit=2, offset=4))
+
+        assert len(result.items) == 2
+        assert result.next_offset == 6
+
+
+class TestSearchQuery:
+    def test_strips_query_before_length_check(self):
+        assert SearchQuery(q="  shelby ").q == "shelby"
+
+        with pytest.raises(ValidationError):
+            SearchQuery(q="   ")
+
+        with pytest.raises(ValidationError):
+            SearchQuery(q=" a ")
@@ -0,0 +1,100 @@
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.domain.storage.exceptions import MinioFileTooLargeException
+from src.infrastructure.storage.file_storage import MinioClient, LimitedReader
+
+
+def build_upload_file(data: bytes, size=None) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(data),
+        size=size,
+        filename="avatar.png",
+        headers=Headers({"content-type": "image/png"})
+    )
+
+
+class TestLimitedReader:
+    def test_read_within_limit(self):
+        reader = LimitedReader(stream=io.BytesIO(b"abcdef"), max_bytes=6)
+
+        assert reader.read(4) == b"abcd"
+        assert reader.read(4) == b"ef"
+        assert reader.read(4) == b""
+
+    def test_read_over_limit(self):
+        reader = LimitedReader(stream=io.BytesIO(b"abcdef"), max_bytes=5)
+
+        assert reader.read(4) == b"abcd"
+        with pytest.raises(MinioFileTooLargeException):
+            reader.read(4)
+
+
+@pytest.mark.asyncio
+class TestMinioClientSaveFile:
+    async def test_save_file_streams_without_known_length(self):
+        client = MagicMock()
+        uploaded = []
+        client.put_object.side_effect = lambda **kwargs: uploaded.append(kwargs["data"].read(1024))
+
+        storage = MinioClient()
+        with patch.object(storage, "get_client", return_value=client):
+            url = await storage.save_file(
+                file=build_upload_file(b"image-bytes"),
+                bucket_name="avatars",
+                public=True
+            )
+
+        kwargs = client.put_object.call_args.kwargs
+        assert kwargs["length"] == -1
+        assert kwargs["content_type"] == "image/png"
+        assert uploaded == [b"image-bytes"]
+        assert url.endswith(f"/avatars/{kwargs['object_name']}")
+
+    async def test_save_file_rejects_declared_oversize(self):
+        client = MagicMock()
+
+        storage = MinioClient()
+        with patch.object(storage, "get_client", return_value=client), \
+                patch("src.infrastructure.storage.file_storage.settings.MINIO_UPLOAD_MAX_BYTES", 4):
+            with pytest.raises(MinioFileTooLargeException):
+                await storage.save_file(
+                    file=build_upload_file(b"image-bytes", size=11),
+                    bucket_name="avatars",
+                    public=True
+                )
+
+        client.put_object.assert_not_called()
+
+    async def test_save_file_checks_bucket_once(self):
+        client = MagicMock()
+        client.bucket_exists.return_value = True
+
+        storage = MinioClient()
+        with patch.object(storage, "build_client", return_value=client):
+            for _ in range(2):
+                await storage.save_file(
+                    file=build_upload_file(b"image-bytes"),
+                    bucket_name="avatars",
+                    public=True
+                )
+
+        client.bucket_exists.assert_called_once_with("avatars")
+        assert client.put_object.call_count == 2
+
+
+class TestMinioClientPool:
+    def test_get_client_is_reused(self):
+        storage = MinioClient()
+
+        first = storage.get_client()
+
+        assert storage.get_client() is first
+        assert first._http is storage.http_client
+
+        storage.close()
+        assert storage.client is None